@@ -2,7 +2,7 @@
 import asyncio
 from collections import OrderedDict
 from datetime import timedelta
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
 import jwt
 
@@ -19,6 +19,9 @@ from .providers import AuthProvider, LoginFlow, auth_provider_from_config
 EVENT_USER_ADDED = "user_added"
 EVENT_USER_REMOVED = "user_removed"
 
+# Number of validated access tokens that are remembered
+ACCESS_TOKEN_CACHE_SIZE = 512
+
 _MfaModuleDict = Dict[str, MultiFactorAuthModule]
 _ProviderKey = Tuple[str, Optional[str]]
 _ProviderDict = Dict[_ProviderKey, AuthProvider]
@@ -144,6 +147,8 @@ class AuthManager:
         self._providers = providers
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
+        # Validated access token -> (refresh token, expiration timestamp)
+        self._access_token_cache: Dict[str, Tuple[models.RefreshToken, float]] = {}
 
     @property
     def auth_providers(self) -> List[AuthProvider]:
@@ -277,6 +282,9 @@ class AuthManager:
             await asyncio.wait(tasks)
 
         await self._store.async_remove_user(user)
+        self._async_invalidate_access_tokens(
+            lambda refresh_token: refresh_token.user is user
+        )
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
 
@@ -434,6 +442,9 @@ class AuthManager:
     ) -> None:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
+        self._async_invalidate_access_tokens(
+            lambda cached: cached.id == refresh_token.id
+        )
 
     @callback
     def async_create_access_token(
@@ -457,6 +468,15 @@ class AuthManager:
         self, token: str
     ) -> Optional[models.RefreshToken]:
         """Return refresh token if an access token is valid."""
+        cached = self._access_token_cache.get(token)
+        if cached is not None:
+            refresh_token, expires = cached
+            if expires > dt_util.utcnow().timestamp():
+                if not refresh_token.user.is_active:
+                    return None
+                return refresh_token
+            del self._access_token_cache[token]
+
         try:
             unverif_claims = jwt.decode(token, verify=False)
         except jwt.InvalidTokenError:
@@ -474,15 +494,33 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt.decode(token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"])
+            claims = jwt.decode(
+                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            )
         except jwt.InvalidTokenError:
             return None
 
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        expires = claims.get("exp")
+        if isinstance(expires, (int, float)):
+            self._access_token_cache[token] = (refresh_token, expires)
+            if len(self._access_token_cache) > ACCESS_TOKEN_CACHE_SIZE:
+                # Forget the oldest token
+                del self._access_token_cache[next(iter(self._access_token_cache))]
+
         return refresh_token
 
+    @callback
+    def _async_invalidate_access_tokens(
+        self, matches: Callable[[models.RefreshToken], bool]
+    ) -> None:
+        """Forget validated access tokens of matching refresh tokens."""
+        for token, (refresh_token, _) in list(self._access_token_cache.items()):
+            if matches(refresh_token):
+                del self._access_token_cache[token]
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
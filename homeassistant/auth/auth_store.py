@@ -36,6 +36,8 @@ class AuthStore:
         self.hass = hass
         self._users: Optional[Dict[str, models.User]] = None
         self._groups: Optional[Dict[str, models.Group]] = None
+        # Refresh tokens of all users by id
+        self._refresh_tokens: Dict[str, models.RefreshToken] = {}
         self._perm_lookup: Optional[PermissionLookup] = None
         self._store = hass.helpers.storage.Store(
             STORAGE_VERSION, STORAGE_KEY, private=True
@@ -141,6 +143,8 @@ class AuthStore:
             assert self._users is not None
 
         self._users.pop(user.id)
+        for token_id in user.refresh_tokens:
+            self._refresh_tokens.pop(token_id, None)
         self._async_schedule_save()
 
     async def async_update_user(
@@ -223,6 +227,7 @@ class AuthStore:
 
         refresh_token = models.RefreshToken(**kwargs)
         user.refresh_tokens[refresh_token.id] = refresh_token
+        self._refresh_tokens[refresh_token.id] = refresh_token
 
         self._async_schedule_save()
         return refresh_token
@@ -235,10 +240,9 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            if user.refresh_tokens.pop(refresh_token.id, None):
-                self._async_schedule_save()
-                break
+        found = self._refresh_tokens.pop(refresh_token.id, None)
+        if found is not None and found.user.refresh_tokens.pop(found.id, None):
+            self._async_schedule_save()
 
     async def async_get_refresh_token(
         self, token_id: str
@@ -248,12 +252,7 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            refresh_token = user.refresh_tokens.get(token_id)
-            if refresh_token is not None:
-                return refresh_token
-
-        return None
+        return self._refresh_tokens.get(token_id)
 
     async def async_get_refresh_token_by_token(
         self, token: str
@@ -309,6 +308,7 @@ class AuthStore:
 
         users: Dict[str, models.User] = OrderedDict()
         groups: Dict[str, models.Group] = OrderedDict()
+        refresh_tokens: Dict[str, models.RefreshToken] = {}
 
         # Soft-migrating data as we load. We are going to make sure we have a
         # read only group and an admin group. There are two states that we can
@@ -471,9 +471,11 @@ class AuthStore:
                 last_used_ip=rt_dict.get("last_used_ip"),
             )
             users[rt_dict["user_id"]].refresh_tokens[token.id] = token
+            refresh_tokens[token.id] = token
 
         self._groups = groups
         self._users = users
+        self._refresh_tokens = refresh_tokens
 
     @callback
     def _async_schedule_save(self) -> None:
@@ -557,6 +559,7 @@ class AuthStore:
     def _set_defaults(self) -> None:
         """Set default values for auth store."""
         self._users = OrderedDict()
+        self._refresh_tokens = {}
 
         groups: Dict[str, models.Group] = OrderedDict()
         admin_group = _system_admin_group()
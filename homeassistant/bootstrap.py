@@ -21,6 +21,8 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
     DATA_SETUP,
     DATA_SETUP_STARTED,
+    async_get_setup_trace,
+    async_save_setup_report,
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
@@ -48,6 +50,9 @@ COOLDOWN_TIME = 60
 
 MAX_LOAD_CONCURRENTLY = 6
 
+# Number of slowest integrations to resolve that are logged
+RESOLVE_TIMES_LOGGED = 5
+
 DEBUGGER_INTEGRATIONS = {"debugpy"}
 CORE_INTEGRATIONS = ("homeassistant", "persistent_notification")
 LOGGING_INTEGRATIONS = {
@@ -197,6 +202,7 @@ async def async_from_config_dict(
     This method is a coroutine.
     """
     start = monotonic()
+    setup_trace = async_get_setup_trace(hass)
 
     hass.config_entries = config_entries.ConfigEntries(hass, config)
     await hass.config_entries.async_initialize()
@@ -216,6 +222,7 @@ async def async_from_config_dict(
         return None
 
     _LOGGER.debug("Home Assistant core initialized")
+    setup_trace.stages["core"] = monotonic() - start
 
     core_config = config.get(core.DOMAIN, {})
 
@@ -235,6 +242,15 @@ async def async_from_config_dict(
 
     stop = monotonic()
     _LOGGER.info("Home Assistant initialized in %.2fs", stop - start)
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Setup critical path: %s",
+            " -> ".join(
+                f"{domain} ({setup_trace.integrations[domain].own_time:.2f}s)"
+                for domain in setup_trace.critical_path()
+            ),
+        )
+    async_save_setup_report(hass)
 
     if REQUIRED_NEXT_PYTHON_DATE and sys.version_info[:3] < REQUIRED_NEXT_PYTHON_VER:
         msg = (
@@ -428,12 +444,14 @@ async def _async_set_up_integrations(
 ) -> None:
     """Set up all the integrations."""
     setup_started = hass.data[DATA_SETUP_STARTED] = {}
+    setup_trace = async_get_setup_trace(hass)
     domains_to_setup = _get_domains(hass, config)
 
     # Resolve all dependencies so we know all integrations
     # that will have to be loaded and start rightaway
     integration_cache: Dict[str, loader.Integration] = {}
     to_resolve = domains_to_setup
+    resolve_start = monotonic()
     while to_resolve:
         old_to_resolve = to_resolve
         to_resolve = set()
@@ -469,6 +487,21 @@ async def _async_set_up_integrations(
                 domains_to_setup.add(dep)
                 to_resolve.add(dep)
 
+    setup_trace.stages["resolve"] = monotonic() - resolve_start
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        resolve_times = loader.async_get_resolve_times(hass)
+        _LOGGER.debug(
+            "Resolved %s integrations in %.2fs, slowest: %s",
+            len(integration_cache),
+            setup_trace.stages["resolve"],
+            ", ".join(
+                f"{domain} ({resolve_times[domain]:.3f}s)"
+                for domain in sorted(
+                    resolve_times, key=resolve_times.__getitem__, reverse=True
+                )[:RESOLVE_TIMES_LOGGED]
+            ),
+        )
+
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
     logging_domains = domains_to_setup & LOGGING_INTEGRATIONS
@@ -518,6 +551,7 @@ async def _async_set_up_integrations(
     # Start setup
     if stage_1_domains:
         _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
+        stage_start = monotonic()
         try:
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
@@ -527,12 +561,14 @@ async def _async_set_up_integrations(
                 )
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 1 - moving forward")
+        setup_trace.stages["stage_1"] = monotonic() - stage_start
 
     # Enables after dependencies
     async_set_domains_to_be_loaded(hass, stage_2_domains)
 
     if stage_2_domains:
         _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
+        stage_start = monotonic()
         try:
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
@@ -542,11 +578,14 @@ async def _async_set_up_integrations(
                 )
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 2 - moving forward")
+        setup_trace.stages["stage_2"] = monotonic() - stage_start
 
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
+    stage_start = monotonic()
     try:
         async with hass.timeout.async_timeout(WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME):
             await hass.async_block_till_done()
     except asyncio.TimeoutError:
         _LOGGER.warning("Setup timed out for bootstrap - moving forward")
+    setup_trace.stages["wrap_up"] = monotonic() - stage_start
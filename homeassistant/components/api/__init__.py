@@ -1,17 +1,21 @@
 """Rest API for Home Assistant."""
 import asyncio
+from functools import lru_cache
 import json
 import logging
+from uuid import uuid4
 
-from aiohttp import web
-from aiohttp.web_exceptions import HTTPBadRequest
+from aiohttp import hdrs, web
+from aiohttp.web_exceptions import HTTPBadRequest, HTTPInternalServerError
 import async_timeout
 import voluptuous as vol
 
 from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.bootstrap import DATA_LOGGING
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.http.static import etag_matches
 from homeassistant.const import (
+    CONTENT_TYPE_JSON,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_TIME_CHANGED,
     HTTP_BAD_REQUEST,
@@ -34,7 +38,8 @@ from homeassistant.const import (
 import homeassistant.core as ha
 from homeassistant.exceptions import ServiceNotFound, TemplateError, Unauthorized
 from homeassistant.helpers import template
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.event import async_track_filtered_events
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.network import NoURLAvailableError, get_url
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.state import AsyncTrackStates
@@ -53,8 +58,13 @@ ATTR_VERSION = "version"
 
 DOMAIN = "api"
 STREAM_PING_PAYLOAD = "ping"
+STREAM_PING_MESSAGE = f"data: {STREAM_PING_PAYLOAD}\n\n".encode()
 STREAM_PING_INTERVAL = 50  # seconds
 
+# Versions of the state machine restart at zero, make the ETags of
+# /api/states unique to this run.
+STATES_ETAG_PREFIX = uuid4().hex[:8]
+
 
 async def async_setup(hass, config):
     """Register the API with the HTTP interface."""
@@ -104,62 +114,109 @@ class APIEventStream(HomeAssistantView):
         to_write = asyncio.Queue()
 
         restrict = request.query.get("restrict")
-        if restrict:
-            restrict = restrict.split(",") + [EVENT_HOMEASSISTANT_STOP]
+        event_types = set(restrict.split(",")) if restrict else {MATCH_ALL}
+        entity_ids = _query_list(request, "entity_id")
+        domains = _query_list(request, "domain")
 
-        async def forward_events(event):
+        @ha.callback
+        def forward_events(event):
             """Forward events to the open request."""
             if event.event_type == EVENT_TIME_CHANGED:
                 return
 
-            if restrict and event.event_type not in restrict:
-                return
-
             _LOGGER.debug("STREAM %s FORWARDING %s", id(stop_obj), event)
 
             if event.event_type == EVENT_HOMEASSISTANT_STOP:
-                data = stop_obj
+                to_write.put_nowait(stop_obj)
             else:
-                data = json.dumps(event, cls=JSONEncoder)
-
-            await to_write.put(data)
+                to_write.put_nowait(event)
 
         response = web.StreamResponse()
         response.content_type = "text/event-stream"
         await response.prepare(request)
 
-        unsub_stream = hass.bus.async_listen(MATCH_ALL, forward_events)
+        if entity_ids or domains:
+            unsubs = [
+                async_track_filtered_events(
+                    hass, event_type, forward_events, entity_ids, domains
+                )
+                for event_type in event_types
+            ]
+            unsubs.append(
+                hass.bus.async_listen(EVENT_HOMEASSISTANT_STOP, forward_events)
+            )
+        else:
+            if restrict:
+                event_types.add(EVENT_HOMEASSISTANT_STOP)
+            unsubs = [
+                hass.bus.async_listen(event_type, forward_events)
+                for event_type in event_types
+            ]
 
         try:
             _LOGGER.debug("STREAM %s ATTACHED", id(stop_obj))
 
             # Fire off one message so browsers fire open event right away
-            await to_write.put(STREAM_PING_PAYLOAD)
+            await response.write(STREAM_PING_MESSAGE)
 
-            while True:
+            stopped = False
+            while not stopped:
                 try:
                     with async_timeout.timeout(STREAM_PING_INTERVAL):
                         payload = await to_write.get()
+                except asyncio.TimeoutError:
+                    await response.write(STREAM_PING_MESSAGE)
+                    continue
 
+                # Write all queued events at once
+                batch = []
+                while True:
                     if payload is stop_obj:
+                        stopped = True
+                        break
+                    try:
+                        batch.append(_cached_stream_message(payload))
+                    except (ValueError, TypeError):
+                        _LOGGER.error("Unable to serialize event %s", payload)
+                    if to_write.empty():
                         break
+                    payload = to_write.get_nowait()
 
-                    msg = f"data: {payload}\n\n"
-                    _LOGGER.debug("STREAM %s WRITING %s", id(stop_obj), msg.strip())
-                    await response.write(msg.encode("UTF-8"))
-                except asyncio.TimeoutError:
-                    await to_write.put(STREAM_PING_PAYLOAD)
+                if batch:
+                    _LOGGER.debug(
+                        "STREAM %s WRITING %s EVENTS", id(stop_obj), len(batch)
+                    )
+                    await response.write(b"".join(batch))
 
         except asyncio.CancelledError:
             _LOGGER.debug("STREAM %s ABORT", id(stop_obj))
 
         finally:
             _LOGGER.debug("STREAM %s RESPONSE CLOSED", id(stop_obj))
-            unsub_stream()
+            for unsub in unsubs:
+                unsub()
 
         return response
 
 
+def _query_list(request, key):
+    """Return the comma separated values of a query parameter."""
+    value = request.query.get(key)
+    if not value:
+        return None
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+@lru_cache(maxsize=128)
+def _cached_stream_message(event):
+    """Serialize an event to a stream message.
+
+    Every stream receives the same events, so each event is
+    serialized once and shared by all of them.
+    """
+    return b"data: " + json_bytes(event) + b"\n\n"
+
+
 class APIConfigView(HomeAssistantView):
     """View to handle Configuration requests."""
 
@@ -223,13 +280,31 @@ class APIStatesView(HomeAssistantView):
     def get(self, request):
         """Get current states."""
         user = request["hass_user"]
-        entity_perm = user.permissions.check_entity
-        states = [
-            state
-            for state in request.app["hass"].states.async_all()
-            if entity_perm(state.entity_id, "read")
-        ]
-        return self.json(states)
+        hass = request.app["hass"]
+        etag = None
+        try:
+            if user.permissions.access_all_entities("read"):
+                etag = f'"{STATES_ETAG_PREFIX}-{hass.states.version}"'
+                if_none_match = request.headers.get(hdrs.IF_NONE_MATCH)
+                if if_none_match is not None and etag_matches(etag, if_none_match):
+                    return web.Response(status=304, headers={hdrs.ETAG: etag})
+                states_json = hass.states.async_all_json()
+            else:
+                entity_perm = user.permissions.check_entity
+                states_json = ha.states_to_json(
+                    state
+                    for state in hass.states.async_all()
+                    if entity_perm(state.entity_id, "read")
+                )
+        except (ValueError, TypeError) as err:
+            _LOGGER.error("Unable to serialize states to JSON: %s", err)
+            raise HTTPInternalServerError from err
+
+        response = web.Response(body=states_json, content_type=CONTENT_TYPE_JSON)
+        if etag is not None:
+            response.headers[hdrs.ETAG] = etag
+        response.enable_compression()
+        return response
 
 
 class APIEntityStateView(HomeAssistantView):
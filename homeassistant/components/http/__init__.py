@@ -29,6 +29,7 @@ from .ban import setup_bans
 from .const import KEY_AUTHENTICATED, KEY_HASS, KEY_HASS_USER  # noqa: F401
 from .cors import setup_cors
 from .forwarded import async_setup_forwarded
+from .instrumentation import setup_instrumentation
 from .request_context import setup_request_context
 from .security_filter import setup_security_filter
 from .static import CACHE_HEADERS, CachingStaticResource
@@ -51,6 +52,7 @@ CONF_TRUSTED_PROXIES = "trusted_proxies"
 CONF_LOGIN_ATTEMPTS_THRESHOLD = "login_attempts_threshold"
 CONF_IP_BAN_ENABLED = "ip_ban_enabled"
 CONF_SSL_PROFILE = "ssl_profile"
+CONF_REQUEST_STATS = "request_stats"
 
 SSL_MODERN = "modern"
 SSL_INTERMEDIATE = "intermediate"
@@ -94,6 +96,7 @@ HTTP_SCHEMA = vol.All(
             vol.Optional(CONF_SSL_PROFILE, default=SSL_MODERN): vol.In(
                 [SSL_INTERMEDIATE, SSL_MODERN]
             ),
+            vol.Optional(CONF_REQUEST_STATS, default=False): cv.boolean,
         }
     ),
 )
@@ -206,6 +209,7 @@ async def async_setup(hass, config):
     is_ban_enabled = conf[CONF_IP_BAN_ENABLED]
     login_threshold = conf[CONF_LOGIN_ATTEMPTS_THRESHOLD]
     ssl_profile = conf[CONF_SSL_PROFILE]
+    request_stats = conf[CONF_REQUEST_STATS]
 
     server = HomeAssistantHTTP(
         hass,
@@ -220,6 +224,7 @@ async def async_setup(hass, config):
         login_threshold=login_threshold,
         is_ban_enabled=is_ban_enabled,
         ssl_profile=ssl_profile,
+        request_stats=request_stats,
     )
 
     startup_listeners = []
@@ -290,6 +295,7 @@ class HomeAssistantHTTP:
         login_threshold,
         is_ban_enabled,
         ssl_profile,
+        request_stats=False,
     ):
         """Initialize the HTTP Home Assistant server."""
         app = self.app = web.Application(
@@ -308,6 +314,10 @@ class HomeAssistantHTTP:
 
         setup_request_context(app, current_request)
 
+        # Register before bans and auth so rejected requests are counted
+        if request_stats:
+            setup_instrumentation(hass, app)
+
         if is_ban_enabled:
             setup_bans(hass, app, login_threshold)
 
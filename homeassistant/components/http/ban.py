@@ -1,10 +1,10 @@
 """Ban logic for HTTP component."""
-from collections import defaultdict
 from datetime import datetime
-from ipaddress import ip_address
+from ipaddress import IPv4Address, IPv6Address, ip_address, ip_network
 import logging
 from socket import gethostbyaddr, herror
-from typing import List, Optional
+from time import monotonic
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 from aiohttp.web import middleware
 from aiohttp.web_exceptions import HTTPForbidden, HTTPUnauthorized
@@ -31,6 +31,13 @@ NOTIFICATION_ID_LOGIN = "http-login"
 IP_BANS_FILE = "ip_bans.yaml"
 ATTR_BANNED_AT = "banned_at"
 
+# Addresses with failed login attempts that are remembered
+FAILED_LOGIN_ATTEMPTS_SIZE = 4096
+# Seconds after which one failed login attempt is forgotten
+FAILED_LOGIN_ATTEMPTS_DECAY = 3600
+
+IPAddress = Union[IPv4Address, IPv6Address]
+
 SCHEMA_IP_BAN_ENTRY = vol.Schema(
     {vol.Optional("banned_at"): vol.Any(None, cv.datetime)}
 )
@@ -40,13 +47,14 @@ SCHEMA_IP_BAN_ENTRY = vol.Schema(
 def setup_bans(hass, app, login_threshold):
     """Create IP Ban middleware for the app."""
     app.middlewares.append(ban_middleware)
-    app[KEY_FAILED_LOGIN_ATTEMPTS] = defaultdict(int)
+    app[KEY_FAILED_LOGIN_ATTEMPTS] = FailedLoginAttempts()
     app[KEY_LOGIN_THRESHOLD] = login_threshold
 
     async def ban_startup(app):
         """Initialize bans when app starts up."""
-        app[KEY_BANNED_IPS] = await async_load_ip_bans_config(
-            hass, hass.config.path(IP_BANS_FILE)
+        path = hass.config.path(IP_BANS_FILE)
+        app[KEY_BANNED_IPS] = IpBans(
+            hass, path, await async_load_ip_bans_config(hass, path)
         )
 
     app.on_startup.append(ban_startup)
@@ -60,12 +68,7 @@ async def ban_middleware(request, handler):
         return await handler(request)
 
     # Verify if IP is not banned
-    ip_address_ = ip_address(request.remote)
-    is_banned = any(
-        ip_ban.ip_address == ip_address_ for ip_ban in request.app[KEY_BANNED_IPS]
-    )
-
-    if is_banned:
+    if request.remote in request.app[KEY_BANNED_IPS]:
         raise HTTPForbidden()
 
     try:
@@ -121,7 +124,7 @@ async def process_wrong_login(request):
     if KEY_BANNED_IPS not in request.app or request.app[KEY_LOGIN_THRESHOLD] < 1:
         return
 
-    request.app[KEY_FAILED_LOGIN_ATTEMPTS][remote_addr] += 1
+    failed_attempts = request.app[KEY_FAILED_LOGIN_ATTEMPTS].increment(remote_addr)
 
     # Supervisor IP should never be banned
     if (
@@ -130,16 +133,8 @@ async def process_wrong_login(request):
     ):
         return
 
-    if (
-        request.app[KEY_FAILED_LOGIN_ATTEMPTS][remote_addr]
-        >= request.app[KEY_LOGIN_THRESHOLD]
-    ):
-        new_ban = IpBan(remote_addr)
-        request.app[KEY_BANNED_IPS].append(new_ban)
-
-        await hass.async_add_executor_job(
-            update_ip_bans_config, hass.config.path(IP_BANS_FILE), new_ban
-        )
+    if failed_attempts >= request.app[KEY_LOGIN_THRESHOLD]:
+        request.app[KEY_BANNED_IPS].async_add(IpBan(remote_addr))
 
         _LOGGER.warning("Banned IP %s for too many login attempts", remote_addr)
 
@@ -163,24 +158,177 @@ async def process_success_login(request):
     if KEY_BANNED_IPS not in request.app or request.app[KEY_LOGIN_THRESHOLD] < 1:
         return
 
-    if (
-        remote_addr in request.app[KEY_FAILED_LOGIN_ATTEMPTS]
-        and request.app[KEY_FAILED_LOGIN_ATTEMPTS][remote_addr] > 0
-    ):
+    if request.app[KEY_FAILED_LOGIN_ATTEMPTS][remote_addr] > 0:
         _LOGGER.debug(
             "Login success, reset failed login attempts counter from %s", remote_addr
         )
         request.app[KEY_FAILED_LOGIN_ATTEMPTS].pop(remote_addr)
 
 
+class FailedLoginAttempts:
+    """Failed login attempts per address that are forgotten over time.
+
+    Every FAILED_LOGIN_ATTEMPTS_DECAY seconds without a new failed attempt
+    one attempt is forgotten. When more than FAILED_LOGIN_ATTEMPTS_SIZE
+    addresses are tracked, the least recent one is dropped.
+    """
+
+    def __init__(
+        self,
+        max_size: int = FAILED_LOGIN_ATTEMPTS_SIZE,
+        decay: float = FAILED_LOGIN_ATTEMPTS_DECAY,
+    ) -> None:
+        """Initialize the failed login attempts."""
+        self._max_size = max_size
+        self._decay = decay
+        # Address -> (attempts, time of last attempt)
+        self._attempts: Dict[IPAddress, Tuple[int, float]] = {}
+
+    def __getitem__(self, address: IPAddress) -> int:
+        """Return the current number of failed attempts of an address."""
+        attempts = self._attempts.get(address)
+        if attempts is None:
+            return 0
+        return self._decayed(*attempts)
+
+    def __contains__(self, address: IPAddress) -> bool:
+        """Return if an address has failed attempts."""
+        return self[address] > 0
+
+    def __len__(self) -> int:
+        """Return the number of tracked addresses."""
+        return len(self._attempts)
+
+    def _decayed(self, count: int, last_attempt: float) -> int:
+        """Return the number of attempts left after decay."""
+        return max(0, count - int((monotonic() - last_attempt) / self._decay))
+
+    def increment(self, address: IPAddress) -> int:
+        """Record a failed attempt and return the number of attempts."""
+        count = self[address] + 1
+        # Re-insert so the dict stays ordered by last attempt
+        self._attempts.pop(address, None)
+        self._attempts[address] = (count, monotonic())
+        if len(self._attempts) > self._max_size:
+            del self._attempts[next(iter(self._attempts))]
+        return count
+
+    def pop(self, address: IPAddress) -> None:
+        """Forget the failed attempts of an address."""
+        self._attempts.pop(address, None)
+
+
 class IpBan:
-    """Represents banned IP address."""
+    """Represents banned IP address or network."""
 
-    def __init__(self, ip_ban: str, banned_at: Optional[datetime] = None) -> None:
+    def __init__(
+        self,
+        ip_ban: Union[str, IPAddress],
+        banned_at: Optional[datetime] = None,
+    ) -> None:
         """Initialize IP Ban object."""
-        self.ip_address = ip_address(ip_ban)
+        self.ip_network = ip_network(ip_ban, strict=False)
+        self.ip_address: Optional[IPAddress] = None
+        if self.ip_network.num_addresses == 1:
+            self.ip_address = self.ip_network.network_address
         self.banned_at = banned_at or dt_util.utcnow()
 
+    def __str__(self) -> str:
+        """Return the banned address or network."""
+        if self.ip_address is not None:
+            return str(self.ip_address)
+        return str(self.ip_network)
+
+
+class IpBans:
+    """Banned IP addresses and networks with constant time lookups.
+
+    Single addresses are kept in a set of strings so the remote address of
+    a request can be checked without parsing it. Networks are kept in a
+    table per IP version and prefix length with the network bits as keys.
+    New bans are written to the ip bans file in batches in the executor.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str, bans: Iterable[IpBan]) -> None:
+        """Initialize the banned IPs."""
+        self.hass = hass
+        self.path = path
+        self._bans: List[IpBan] = []
+        self._hosts: Set[str] = set()
+        # IP version -> prefix length -> network bits
+        self._networks: Dict[int, Dict[int, Set[int]]] = {}
+        self._pending: List[IpBan] = []
+        self._writing = False
+        for ip_ban in bans:
+            self._add(ip_ban)
+
+    def __contains__(self, address: Union[None, str, IPAddress]) -> bool:
+        """Return if an address is banned."""
+        if isinstance(address, str):
+            if address in self._hosts:
+                return True
+            if not self._networks:
+                return False
+            try:
+                address = ip_address(address)
+            except ValueError:
+                return False
+        elif address is None:
+            return False
+        elif str(address) in self._hosts:
+            return True
+
+        prefixes = self._networks.get(address.version)
+        if prefixes is None:
+            return False
+        packed = int(address)
+        max_prefixlen = address.max_prefixlen
+        for prefixlen, networks in prefixes.items():
+            if packed >> (max_prefixlen - prefixlen) in networks:
+                return True
+        return False
+
+    def __iter__(self) -> Iterator[IpBan]:
+        """Iterate over the bans."""
+        return iter(self._bans)
+
+    def __len__(self) -> int:
+        """Return the number of bans."""
+        return len(self._bans)
+
+    def _add(self, ip_ban: IpBan) -> None:
+        """Add a ban to the lookup tables."""
+        self._bans.append(ip_ban)
+        if ip_ban.ip_address is not None:
+            self._hosts.add(str(ip_ban.ip_address))
+            return
+        network = ip_ban.ip_network
+        self._networks.setdefault(network.version, {}).setdefault(
+            network.prefixlen, set()
+        ).add(
+            int(network.network_address) >> (network.max_prefixlen - network.prefixlen)
+        )
+
+    @callback
+    def async_add(self, ip_ban: IpBan) -> None:
+        """Ban an address or network and schedule writing it to the file."""
+        self._add(ip_ban)
+        self._pending.append(ip_ban)
+        if not self._writing:
+            self._writing = True
+            self.hass.async_create_task(self._async_write())
+
+    async def _async_write(self) -> None:
+        """Write pending bans to the file until none are left."""
+        try:
+            while self._pending:
+                pending, self._pending = self._pending, []
+                await self.hass.async_add_executor_job(
+                    update_ip_bans_config, self.path, pending
+                )
+        finally:
+            self._writing = False
+
 
 async def async_load_ip_bans_config(hass: HomeAssistant, path: str) -> List[IpBan]:
     """Load list of banned IPs from config file."""
@@ -197,17 +345,20 @@ async def async_load_ip_bans_config(hass: HomeAssistant, path: str) -> List[IpBa
     for ip_ban, ip_info in list_.items():
         try:
             ip_info = SCHEMA_IP_BAN_ENTRY(ip_info)
-            ip_list.append(IpBan(ip_ban, ip_info["banned_at"]))
-        except vol.Invalid as err:
+            ip_list.append(IpBan(ip_ban, ip_info.get("banned_at")))
+        except (vol.Invalid, ValueError) as err:
             _LOGGER.error("Failed to load IP ban %s: %s", ip_info, err)
             continue
 
     return ip_list
 
 
-def update_ip_bans_config(path: str, ip_ban: IpBan) -> None:
-    """Update config file with new banned IP address."""
+def update_ip_bans_config(path: str, ip_bans: List[IpBan]) -> None:
+    """Update config file with new banned IP addresses."""
+    ip_ = {
+        str(ip_ban): {ATTR_BANNED_AT: ip_ban.banned_at.isoformat()}
+        for ip_ban in ip_bans
+    }
     with open(path, "a") as out:
-        ip_ = {str(ip_ban.ip_address): {ATTR_BANNED_AT: ip_ban.banned_at.isoformat()}}
         out.write("\n")
         out.write(yaml.dump(ip_))
@@ -0,0 +1,184 @@
+"""Middleware that collects request statistics per route.
+
+Every route keeps a few counters and a fixed bucket latency histogram, so
+recording a request does not allocate or log anything. Percentiles are
+estimated from the histogram when the statistics are read.
+"""
+from bisect import bisect_left
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+
+from aiohttp.web import HTTPException, Request, StreamResponse, middleware
+
+from homeassistant.core import HomeAssistant, callback
+
+# mypy: allow-untyped-defs
+
+DATA_REQUEST_STATS = "http.request_stats"
+
+# Upper bounds of the latency buckets in seconds, the last bucket is +Inf
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+PERCENTILES = (50, 90, 99)
+
+# Requests that did not match a route are grouped together
+ROUTE_UNMATCHED = "unmatched"
+
+SERVER_TIMING = "Server-Timing"
+
+
+class RouteStats:
+    """Statistics of the requests to a single route."""
+
+    __slots__ = ("route", "requests", "statuses", "bytes_sent", "total_time", "buckets")
+
+    def __init__(self, route: str) -> None:
+        """Initialize the statistics."""
+        self.route = route
+        self.requests = 0
+        self.statuses: Dict[int, int] = {}
+        self.bytes_sent = 0
+        # Sum and buckets only contain requests with a known duration
+        self.total_time = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    @callback
+    def async_record(self, status: int, size: int, duration: Optional[float]) -> None:
+        """Record a handled request."""
+        self.requests += 1
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.bytes_sent += size
+        if duration is not None:
+            self.total_time += duration
+            self.buckets[bisect_left(LATENCY_BUCKETS, duration)] += 1
+
+    @property
+    def timed_requests(self) -> int:
+        """Return the number of requests with a known duration."""
+        return sum(self.buckets)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Estimate a latency percentile from the histogram.
+
+        Returns the upper bound of the bucket the percentile falls in, or
+        None if there are no timed requests or it falls in the last bucket.
+        """
+        total = self.timed_requests
+        if not total:
+            return None
+        needed = total * percent / 100
+        seen = 0
+        for upper_bound, count in zip(LATENCY_BUCKETS, self.buckets):
+            seen += count
+            if seen >= needed:
+                return upper_bound
+        return None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a dictionary version of the statistics."""
+        timed_requests = self.timed_requests
+        return {
+            "route": self.route,
+            "requests": self.requests,
+            "statuses": {str(status): count for status, count in self.statuses.items()},
+            "bytes_sent": self.bytes_sent,
+            "average_time": (
+                round(self.total_time / timed_requests, 6) if timed_requests else None
+            ),
+            "percentiles": {
+                f"p{percent}": self.percentile(percent) for percent in PERCENTILES
+            },
+        }
+
+
+class RequestStats:
+    """Statistics of the requests handled by the HTTP server."""
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.routes: Dict[str, RouteStats] = {}
+
+    @callback
+    def async_record(
+        self, route: str, status: int, size: int, duration: Optional[float]
+    ) -> None:
+        """Record a handled request."""
+        stats = self.routes.get(route)
+        if stats is None:
+            stats = self.routes[route] = RouteStats(route)
+        stats.async_record(status, size, duration)
+
+    def as_list(self) -> List[Dict[str, Any]]:
+        """Return the statistics of all routes, busiest first."""
+        return [
+            stats.as_dict()
+            for stats in sorted(
+                self.routes.values(), key=lambda stats: stats.total_time, reverse=True
+            )
+        ]
+
+
+def _route_name(request: Request) -> str:
+    """Return the name a request is recorded under."""
+    route = request.match_info.route
+    resource = route.resource
+    if resource is None:
+        return ROUTE_UNMATCHED
+    return resource.canonical
+
+
+@callback
+def async_get_request_stats(hass: HomeAssistant) -> Optional[RequestStats]:
+    """Return the request statistics if they are collected."""
+    return hass.data.get(DATA_REQUEST_STATS)
+
+
+@callback
+def setup_instrumentation(hass: HomeAssistant, app):
+    """Create request statistics middleware for the app."""
+    stats = hass.data[DATA_REQUEST_STATS] = RequestStats()
+
+    @middleware
+    async def instrumentation_middleware(request, handler):
+        """Record the status, size and duration of the request."""
+        start = perf_counter()
+        try:
+            response: StreamResponse = await handler(request)
+        except HTTPException as err:
+            stats.async_record(
+                _route_name(request), err.status, 0, perf_counter() - start
+            )
+            raise
+        except Exception:
+            # Unhandled errors are turned into a 500 by aiohttp
+            stats.async_record(_route_name(request), 500, 0, perf_counter() - start)
+            raise
+
+        duration: Optional[float] = perf_counter() - start
+
+        # The body length is only known once the response has been sent
+        if response.prepared or response.body_length:
+            # Streams and websockets have been sent already, their duration
+            # is the length of the connection and would skew the histogram.
+            duration = None
+            size = response.body_length
+        else:
+            size = response.content_length or 0
+            response.headers[SERVER_TIMING] = f"handler;dur={duration * 1000:.1f}"
+
+        stats.async_record(_route_name(request), response.status, size, duration)
+        return response
+
+    app.middlewares.append(instrumentation_middleware)
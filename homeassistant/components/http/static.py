@@ -1,48 +1,316 @@
 """Static file handling for HTTP component."""
+import asyncio
+from collections import OrderedDict
+from functools import partial
+import mimetypes
+import os
 from pathlib import Path
+from stat import S_ISREG
+from time import monotonic
+from typing import IO, Any, Callable, Dict, Optional, Tuple
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
 from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
 from aiohttp.web_urldispatcher import StaticResource
+import attr
 
 # mypy: allow-untyped-defs
 
 CACHE_TIME = 31 * 86400  # = 1 month
 CACHE_HEADERS = {hdrs.CACHE_CONTROL: f"public, max-age={CACHE_TIME}"}
 
+# Seconds before a cached path is resolved and checked on disk again
+PATH_CACHE_TIME = 60
+PATH_CACHE_SIZE = 2048
+
+# Pre-compressed siblings in order of preference
+COMPRESSED_VARIANTS = (("br", ".br"), ("gzip", ".gz"))
+
+# Headers dropped from responses for files that changed since resolving
+_VALIDATOR_HEADERS = (hdrs.ETAG, hdrs.LAST_MODIFIED, hdrs.CACHE_CONTROL)
+_CONTENT_HEADERS = (hdrs.CONTENT_ENCODING, hdrs.CONTENT_TYPE, hdrs.VARY)
+
+
+@attr.s(slots=True, frozen=True)
+class StaticFile:
+    """Resolved static file with the result of checking it on disk."""
+
+    path: Optional[Path] = attr.ib()
+    is_dir: bool = attr.ib(default=False)
+    etag: str = attr.ib(default="")
+    mtime: float = attr.ib(default=0)
+    content_type: str = attr.ib(default="application/octet-stream")
+    content_encoding: Optional[str] = attr.ib(default=None)
+    # Content-Encoding -> path of the pre-compressed sibling
+    variants: Dict[str, Path] = attr.ib(factory=dict)
+    # Path -> (mtime in ns, size) of the file and its siblings when resolved
+    signatures: Dict[Path, Tuple[int, int]] = attr.ib(factory=dict)
+    expires: float = attr.ib(factory=lambda: monotonic() + PATH_CACHE_TIME)
+
+
+class CachedFileResponse(FileResponse):
+    """Send a static file that has been resolved before.
+
+    Unlike FileResponse it does not check the disk for compressed files
+    in the event loop, Range requests are handled by FileResponse.
+
+    If the file was removed since it was resolved a 404 is sent, if it
+    changed it is sent without validators. In both cases on_stale is
+    called so the file is resolved again on the next request.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        signature: Optional[Tuple[int, int]],
+        on_stale: Callable[[], None],
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the response."""
+        super().__init__(path, **kwargs)
+        self._signature = signature
+        self._on_stale = on_stale
+
+    async def prepare(self, request: Request) -> Any:
+        """Send the file."""
+        loop = asyncio.get_event_loop()
+        try:
+            fobj, stat = await loop.run_in_executor(None, _open_file, self._path)
+        except (FileNotFoundError, NotADirectoryError):
+            self._on_stale()
+            for header in _VALIDATOR_HEADERS + _CONTENT_HEADERS:
+                self.headers.popall(header, None)
+            self.set_status(HTTPNotFound.status_code)
+            self.content_length = 0
+            return await StreamResponse.prepare(self, request)
+
+        try:
+            if (stat.st_mtime_ns, stat.st_size) != self._signature:
+                self._on_stale()
+                for header in _VALIDATOR_HEADERS:
+                    self.headers.popall(header, None)
+            self.content_length = stat.st_size
+            self.headers[hdrs.ACCEPT_RANGES] = "bytes"
+            if request.method == hdrs.METH_HEAD:
+                return await StreamResponse.prepare(self, request)
+            # _sendfile is private API of aiohttp, its signature
+            # (request, fobj, offset, count) is the one of aiohttp 3.7.
+            # Check it when upgrading aiohttp.
+            return await self._sendfile(request, fobj, 0, stat.st_size)
+        finally:
+            await loop.run_in_executor(None, fobj.close)
+
+
+def _open_file(path: Path) -> Tuple[IO[Any], os.stat_result]:
+    """Open a file and return it with its current status."""
+    fobj = path.open("rb")
+    return fobj, os.fstat(fobj.fileno())
+
+
+def _parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+    """Return the quality values of the codings in an Accept-Encoding header."""
+    qualities = {}
+    for coding in accept_encoding.lower().split(","):
+        name, _, params = coding.partition(";")
+        name = name.strip()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name] = quality
+    return qualities
+
+
+def _select_variant(
+    variants: Dict[str, Path], accept_encoding: str
+) -> Optional[Tuple[str, Path]]:
+    """Select the variant with the highest quality the client accepts.
+
+    Variants are in order of preference, which breaks ties.
+    """
+    qualities = _parse_accept_encoding(accept_encoding)
+    wildcard = qualities.get("*", 0.0)
+    best: Optional[Tuple[str, Path]] = None
+    best_quality = 0.0
+    for encoding, variant in variants.items():
+        quality = qualities.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = (encoding, variant), quality
+    return best
+
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    """Return if the ETag is in the If-None-Match header."""
+    if if_none_match.strip() == "*":
+        return True
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
 
 class CachingStaticResource(StaticResource):
-    """Static Resource handler that will add cache headers."""
+    """Static Resource handler that will add cache headers.
+
+    Resolved paths and the result of checking them on disk are cached,
+    so most requests do not touch the file system in the event loop.
+    Pre-compressed .br and .gz siblings are served to clients that
+    accept them and requests with a matching ETag get a 304.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the resource."""
+        super().__init__(*args, **kwargs)
+        self._path_cache: "OrderedDict[str, StaticFile]" = OrderedDict()
+
+    def clear_cache(self) -> None:
+        """Forget all resolved paths."""
+        self._path_cache.clear()
+
+    def _evict(self, rel_url: str, static_file: StaticFile) -> None:
+        """Forget a resolved path if it was not resolved again since."""
+        if self._path_cache.get(rel_url) is static_file:
+            del self._path_cache[rel_url]
 
     async def _handle(self, request):
         rel_url = request.match_info["filename"]
-        try:
-            filename = Path(rel_url)
-            if filename.anchor:
+        static_file = self._path_cache.get(rel_url)
+
+        if static_file is None or static_file.expires < monotonic():
+            if Path(rel_url).anchor:
                 # rel_url is an absolute name like
                 # /static/\\machine_name\c$ or /static/D:\path
                 # where the static dir is totally different
                 raise HTTPForbidden()
-            filepath = self._directory.joinpath(filename).resolve()
+            try:
+                static_file = await asyncio.get_running_loop().run_in_executor(
+                    None, self._resolve, rel_url
+                )
+            except Exception as error:
+                # perm error or other kind!
+                request.app.logger.exception(error)
+                raise HTTPNotFound() from error
+
+            self._path_cache[rel_url] = static_file
+            self._path_cache.move_to_end(rel_url)
+            if len(self._path_cache) > PATH_CACHE_SIZE:
+                self._path_cache.popitem(last=False)
+
+        # on opening a dir, load its contents if allowed
+        if static_file.is_dir:
+            return await super()._handle(request)
+        if static_file.path is None:
+            raise HTTPNotFound
+
+        return self._file_response(request, static_file)
+
+    def _resolve(self, rel_url: str) -> StaticFile:
+        """Resolve a path and check it on disk.
+
+        Must be run in the executor.
+        """
+        try:
+            filepath = self._directory.joinpath(rel_url).resolve()
             if not self._follow_symlinks:
                 filepath.relative_to(self._directory)
-        except (ValueError, FileNotFoundError) as error:
+        except (ValueError, FileNotFoundError):
             # relatively safe
-            raise HTTPNotFound() from error
-        except Exception as error:
-            # perm error or other kind!
-            request.app.logger.exception(error)
-            raise HTTPNotFound() from error
+            return StaticFile(None)
 
-        # on opening a dir, load its contents if allowed
         if filepath.is_dir():
-            return await super()._handle(request)
-        if filepath.is_file():
+            return StaticFile(filepath, is_dir=True)
+
+        try:
+            stat = filepath.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return StaticFile(None)
+
+        if not filepath.is_file():
+            return StaticFile(None)
+
+        content_type, content_encoding = mimetypes.guess_type(str(filepath))
+        variants = {}
+        signatures = {filepath: (stat.st_mtime_ns, stat.st_size)}
+        for encoding, suffix in COMPRESSED_VARIANTS:
+            variant = filepath.with_name(filepath.name + suffix)
+            try:
+                variant_stat = variant.stat()
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            if S_ISREG(variant_stat.st_mode):
+                variants[encoding] = variant
+                signatures[variant] = (variant_stat.st_mtime_ns, variant_stat.st_size)
+
+        return StaticFile(
+            filepath,
+            etag=f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+            mtime=stat.st_mtime,
+            content_type=content_type or "application/octet-stream",
+            content_encoding=content_encoding,
+            variants=variants,
+            signatures=signatures,
+        )
+
+    def _file_response(self, request: Request, static_file: StaticFile) -> Any:
+        """Return the response for a static file."""
+        assert static_file.path is not None
+
+        if hdrs.RANGE in request.headers:
             return FileResponse(
-                filepath,
+                static_file.path,
                 chunk_size=self._chunk_size,
                 # type ignore: https://github.com/aio-libs/aiohttp/pull/3976
                 headers=CACHE_HEADERS,  # type: ignore
             )
-        raise HTTPNotFound
+
+        path = static_file.path
+        etag = static_file.etag
+        headers = {
+            **CACHE_HEADERS,
+            hdrs.CONTENT_TYPE: static_file.content_type,
+        }
+        content_encoding = static_file.content_encoding
+
+        if static_file.variants:
+            headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+            selected = _select_variant(
+                static_file.variants, request.headers.get(hdrs.ACCEPT_ENCODING, "")
+            )
+            if selected is not None:
+                content_encoding, path = selected
+                etag = f'{etag[:-1]}-{content_encoding}"'
+
+        if content_encoding is not None:
+            headers[hdrs.CONTENT_ENCODING] = content_encoding
+        headers[hdrs.ETAG] = etag
+
+        if_none_match = request.headers.get(hdrs.IF_NONE_MATCH)
+        if if_none_match is not None:
+            if etag_matches(etag, if_none_match):
+                return Response(status=304, headers=headers)
+        else:
+            modsince = request.if_modified_since
+            if modsince is not None and static_file.mtime <= modsince.timestamp():
+                return Response(status=304, headers=headers)
+
+        rel_url = request.match_info["filename"]
+        response = CachedFileResponse(
+            path,
+            static_file.signatures.get(path),
+            partial(self._evict, rel_url, static_file),
+            chunk_size=self._chunk_size,
+            # type ignore: https://github.com/aio-libs/aiohttp/pull/3976
+            headers=headers,  # type: ignore
+        )
+        response.last_modified = static_file.mtime  # type: ignore
+        return response
@@ -15,6 +15,10 @@ from homeassistant.core import HomeAssistant, ServiceCall
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.template import (
+    async_disable_render_profiling,
+    async_enable_render_profiling,
+)
 from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN
@@ -24,6 +28,8 @@ SERVICE_MEMORY = "memory"
 SERVICE_START_LOG_OBJECTS = "start_log_objects"
 SERVICE_STOP_LOG_OBJECTS = "stop_log_objects"
 SERVICE_DUMP_LOG_OBJECTS = "dump_log_objects"
+SERVICE_START_TEMPLATE_PROFILING = "start_template_profiling"
+SERVICE_STOP_TEMPLATE_PROFILING = "stop_template_profiling"
 
 SERVICES = (
     SERVICE_START,
@@ -31,6 +37,8 @@ SERVICES = (
     SERVICE_START_LOG_OBJECTS,
     SERVICE_STOP_LOG_OBJECTS,
     SERVICE_DUMP_LOG_OBJECTS,
+    SERVICE_START_TEMPLATE_PROFILING,
+    SERVICE_STOP_TEMPLATE_PROFILING,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -38,8 +46,10 @@ DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 CONF_SECONDS = "seconds"
 CONF_SCAN_INTERVAL = "scan_interval"
 CONF_TYPE = "type"
+CONF_LIMIT = "limit"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
+TEMPLATE_PROFILING = "template_profiling"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -99,6 +109,31 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             notification_id="profile_object_dump",
         )
 
+    async def _async_start_template_profiling(call: ServiceCall):
+        domain_data[TEMPLATE_PROFILING] = True
+        async_enable_render_profiling(hass)
+
+        hass.components.persistent_notification.async_create(
+            "Template render profiling has started. Stop it to log the most expensive templates to [the logs](/config/logs).",
+            title="Template profiling started",
+            notification_id="profile_template_rendering",
+        )
+
+    async def _async_stop_template_profiling(call: ServiceCall):
+        if not domain_data.pop(TEMPLATE_PROFILING, False):
+            return
+
+        hass.components.persistent_notification.async_dismiss(
+            "profile_template_rendering"
+        )
+        profile = async_disable_render_profiling(hass)
+        if profile is None:
+            return
+
+        _LOGGER.critical(
+            "Most expensive templates: %s", profile.as_list()[: call.data[CONF_LIMIT]]
+        )
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -149,6 +184,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         schema=vol.Schema({vol.Required(CONF_TYPE): str}),
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_TEMPLATE_PROFILING,
+        _async_start_template_profiling,
+        schema=vol.Schema({}),
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_TEMPLATE_PROFILING,
+        _async_stop_template_profiling,
+        schema=vol.Schema({vol.Optional(CONF_LIMIT, default=25): cv.positive_int}),
+    )
+
     return True
 
 
@@ -158,6 +209,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    if hass.data[DOMAIN].get(TEMPLATE_PROFILING):
+        async_disable_render_profiling(hass)
     hass.data.pop(DOMAIN)
     return True
 
@@ -4,6 +4,7 @@ import string
 
 from aiohttp import web
 import prometheus_client
+from prometheus_client.core import CounterMetricFamily, HistogramMetricFamily
 import voluptuous as vol
 
 from homeassistant import core as hacore
@@ -13,6 +14,10 @@ from homeassistant.components.climate.const import (
     CURRENT_HVAC_ACTIONS,
 )
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.http.instrumentation import (
+    LATENCY_BUCKETS,
+    async_get_request_stats,
+)
 from homeassistant.components.humidifier.const import (
     ATTR_AVAILABLE_MODES,
     ATTR_HUMIDITY,
@@ -79,11 +84,16 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass, config):
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(prometheus_client))
-
     conf = config[DOMAIN]
     entity_filter = conf[CONF_FILTER]
     namespace = conf.get(CONF_PROM_NAMESPACE)
+
+    # Request statistics are collected per instance, keep them out of the
+    # process wide default registry.
+    request_registry = prometheus_client.CollectorRegistry(auto_describe=False)
+    request_registry.register(RequestStatsCollector(hass, namespace))
+
+    hass.http.register_view(PrometheusView(prometheus_client, request_registry))
     climate_units = hass.config.units.temperature_unit
     override_metric = conf.get(CONF_OVERRIDE_METRIC)
     default_metric = conf.get(CONF_DEFAULT_METRIC)
@@ -473,21 +483,75 @@ class PrometheusMetrics:
         metric.labels(**self._labels(state)).inc()
 
 
+class RequestStatsCollector:
+    """Export the statistics of the HTTP request instrumentation."""
+
+    def __init__(self, hass, namespace):
+        """Initialize the collector."""
+        self.hass = hass
+        self.metrics_prefix = f"{namespace}_" if namespace else ""
+
+    def collect(self):
+        """Return the request metrics if request statistics are enabled."""
+        stats = async_get_request_stats(self.hass)
+        if stats is None:
+            return
+
+        requests = CounterMetricFamily(
+            f"{self.metrics_prefix}http_requests",
+            "The number of handled HTTP requests",
+            labels=["route", "status"],
+        )
+        response_bytes = CounterMetricFamily(
+            f"{self.metrics_prefix}http_response_bytes",
+            "The number of bytes sent in HTTP responses",
+            labels=["route"],
+        )
+        duration = HistogramMetricFamily(
+            f"{self.metrics_prefix}http_request_duration_seconds",
+            "The time it took to handle HTTP requests",
+            labels=["route"],
+        )
+
+        for route_stats in list(stats.routes.values()):
+            route = route_stats.route
+            for status, count in route_stats.statuses.items():
+                requests.add_metric([route, str(status)], count)
+            response_bytes.add_metric([route], route_stats.bytes_sent)
+
+            buckets = []
+            seen = 0
+            for upper_bound, count in zip(LATENCY_BUCKETS, route_stats.buckets):
+                seen += count
+                buckets.append((str(upper_bound), seen))
+            buckets.append(("+Inf", seen + route_stats.buckets[-1]))
+            duration.add_metric([route], buckets, route_stats.total_time)
+
+        yield requests
+        yield response_bytes
+        yield duration
+
+
 class PrometheusView(HomeAssistantView):
     """Handle Prometheus requests."""
 
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, prometheus_cli):
+    def __init__(self, prometheus_cli, request_registry=None):
         """Initialize Prometheus view."""
         self.prometheus_cli = prometheus_cli
+        self.request_registry = request_registry
 
     async def get(self, request):
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
+        body = self.prometheus_cli.generate_latest()
+        if self.request_registry is not None:
+            body += self.prometheus_cli.generate_latest(self.request_registry)
+
         return web.Response(
-            body=self.prometheus_cli.generate_latest(),
+            body=body,
             content_type=CONTENT_TYPE_TEXT_PLAIN,
         )
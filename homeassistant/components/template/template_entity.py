@@ -254,6 +254,7 @@ class TemplateEntity(Entity):
     async def _async_template_startup(self, *_) -> None:
         template_var_tups = []
         for template, attributes in self._template_attrs.items():
+            template.owner = self.entity_id
             template_var_tups.append(TrackTemplate(template, None))
             for attribute in attributes:
                 attribute.async_setup()
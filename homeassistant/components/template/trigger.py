@@ -33,6 +33,7 @@ async def async_attach_trigger(
     """Listen for state changes based on configuration."""
     value_template = config.get(CONF_VALUE_TEMPLATE)
     value_template.hass = hass
+    value_template.owner = f"{automation_info['domain']}: {automation_info['name']}"
     time_delta = config.get(CONF_FOR)
     template.attach(hass, time_delta)
     delay_cancel = None
@@ -21,6 +21,7 @@ AUTH_MESSAGE_SCHEMA = vol.Schema(
         vol.Required("type"): TYPE_AUTH,
         vol.Exclusive("api_password", "auth"): str,
         vol.Exclusive("access_token", "auth"): str,
+        vol.Optional("coalesce_messages", default=False): bool,
     }
 )
 
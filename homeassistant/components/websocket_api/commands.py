@@ -4,9 +4,10 @@ import asyncio
 import voluptuous as vol
 
 from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_READ
+from homeassistant.components.http.instrumentation import async_get_request_stats
 from homeassistant.components.websocket_api.const import ERR_NOT_FOUND
 from homeassistant.const import EVENT_STATE_CHANGED, EVENT_TIME_CHANGED, MATCH_ALL
-from homeassistant.core import DOMAIN as HASS_DOMAIN, callback
+from homeassistant.core import DOMAIN as HASS_DOMAIN, callback, states_to_json
 from homeassistant.exceptions import (
     HomeAssistantError,
     ServiceNotFound,
@@ -14,10 +15,18 @@ from homeassistant.exceptions import (
     Unauthorized,
 )
 from homeassistant.helpers import config_validation as cv, entity
-from homeassistant.helpers.event import TrackTemplate, async_track_template_result
+from homeassistant.helpers.entity_platform import async_get_polling_scheduler
+from homeassistant.helpers.event import (
+    TrackTemplate,
+    async_track_filtered_events,
+    async_track_template_result,
+)
 from homeassistant.helpers.service import async_get_all_descriptions
-from homeassistant.helpers.template import Template
+from homeassistant.helpers.storage import async_get_storage_writer
+from homeassistant.helpers.template import Template, async_get_render_profile
+from homeassistant.helpers.update_coordinator import async_get_update_coordinators
 from homeassistant.loader import IntegrationNotFound, async_get_integration
+from homeassistant.setup import async_get_setup_report
 
 from . import const, decorators, messages
 
@@ -28,6 +37,7 @@ from . import const, decorators, messages
 def async_register_commands(hass, async_reg):
     """Register commands."""
     async_reg(hass, handle_subscribe_events)
+    async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_unsubscribe_events)
     async_reg(hass, handle_call_service)
     async_reg(hass, handle_get_states)
@@ -40,6 +50,13 @@ def async_register_commands(hass, async_reg):
     async_reg(hass, handle_entity_source)
     async_reg(hass, handle_subscribe_trigger)
     async_reg(hass, handle_test_condition)
+    async_reg(hass, handle_connection_stats)
+    async_reg(hass, handle_request_stats)
+    async_reg(hass, handle_template_render_stats)
+    async_reg(hass, handle_poll_stats)
+    async_reg(hass, handle_storage_write_stats)
+    async_reg(hass, handle_update_coordinator_stats)
+    async_reg(hass, handle_startup_trace)
 
 
 def pong_message(iden):
@@ -47,12 +64,29 @@ def pong_message(iden):
     return {"id": iden, "type": "pong"}
 
 
+def _attributes_require_state_changed(msg):
+    """Validate attribute filters are only used for state changed events."""
+    if "attributes" in msg and msg["event_type"] != EVENT_STATE_CHANGED:
+        raise vol.Invalid(
+            f"attributes can only be filtered for {EVENT_STATE_CHANGED} events"
+        )
+    return msg
+
+
 @callback
 @decorators.websocket_command(
-    {
-        vol.Required("type"): "subscribe_events",
-        vol.Optional("event_type", default=MATCH_ALL): str,
-    }
+    vol.All(
+        vol.Schema(
+            {
+                vol.Required("type"): "subscribe_events",
+                vol.Optional("event_type", default=MATCH_ALL): str,
+                vol.Optional("entity_ids"): cv.entity_ids,
+                vol.Optional("domains"): vol.All(cv.ensure_list, [cv.string]),
+                vol.Optional("attributes"): vol.All(cv.ensure_list, [cv.string]),
+            }
+        ),
+        _attributes_require_state_changed,
+    )
 )
 def handle_subscribe_events(hass, connection, msg):
     """Handle subscribe events command."""
@@ -87,12 +121,79 @@ def handle_subscribe_events(hass, connection, msg):
 
             connection.send_message(messages.cached_event_message(msg["id"], event))
 
+    if "entity_ids" in msg or "domains" in msg or "attributes" in msg:
+        # Filters are evaluated centrally via an index, events without
+        # an entity_id never reach the connection.
+        connection.subscriptions[msg["id"]] = async_track_filtered_events(
+            hass,
+            event_type,
+            forward_events,
+            entity_ids=msg.get("entity_ids"),
+            domains=msg.get("domains"),
+            attributes=msg.get("attributes"),
+        )
+    else:
+        connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+            event_type, forward_events
+        )
+
+    connection.send_message(messages.result_message(msg["id"]))
+
+
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "subscribe_entities",
+        vol.Optional("entity_ids"): cv.entity_ids,
+    }
+)
+def handle_subscribe_entities(hass, connection, msg):
+    """Handle subscribe entities command.
+
+    Sends a compact snapshot of all states followed by per entity diffs.
+    """
+    entity_ids = set(msg.get("entity_ids", []))
+    entity_perm = connection.user.permissions.check_entity
+
+    @callback
+    def forward_entity_changes(event):
+        """Forward entity state changes to websocket."""
+        entity_id = event.data["entity_id"]
+        if entity_ids and entity_id not in entity_ids:
+            return
+
+        if not entity_perm(entity_id, POLICY_READ):
+            return
+
+        connection.send_message(messages.cached_state_diff_message(msg["id"], event))
+
     connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        event_type, forward_events
+        EVENT_STATE_CHANGED, forward_entity_changes
     )
-
     connection.send_message(messages.result_message(msg["id"]))
 
+    if entity_ids:
+        states = [
+            state
+            for state in (hass.states.get(entity_id) for entity_id in entity_ids)
+            if state is not None
+        ]
+    else:
+        states = hass.states.async_all()
+
+    connection.send_message(
+        messages.event_message(
+            msg["id"],
+            {
+                messages.ENTITY_EVENT_ADD: {
+                    state.entity_id: messages.compressed_state_dict(state)
+                    for state in states
+                    if entity_perm(state.entity_id, POLICY_READ)
+                }
+            },
+        )
+    )
+
 
 @callback
 @decorators.websocket_command(
@@ -173,7 +274,7 @@ async def handle_call_service(hass, connection, msg):
 def handle_get_states(hass, connection, msg):
     """Handle get states command."""
     if connection.user.permissions.access_all_entities("read"):
-        states = hass.states.async_all()
+        states = None
     else:
         entity_perm = connection.user.permissions.check_entity
         states = [
@@ -182,7 +283,23 @@ def handle_get_states(hass, connection, msg):
             if entity_perm(state.entity_id, "read")
         ]
 
-    connection.send_message(messages.result_message(msg["id"], states))
+    try:
+        if states is None:
+            states_json = hass.states.async_all_json()
+        else:
+            states_json = states_to_json(states)
+    except (ValueError, TypeError):
+        # Let the message serializer report the bad data
+        connection.send_message(
+            messages.result_message(
+                msg["id"], hass.states.async_all() if states is None else states
+            )
+        )
+        return
+
+    connection.send_message(
+        messages.construct_result_message(msg["id"], states_json.decode("utf-8"))
+    )
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -410,3 +527,81 @@ async def handle_test_condition(hass, connection, msg):
     connection.send_result(
         msg["id"], {"result": check_condition(hass, msg.get("variables"))}
     )
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "websocket/connection_stats"})
+@decorators.require_admin
+def handle_connection_stats(hass, connection, msg):
+    """Handle connection stats command."""
+    connection.send_result(
+        msg["id"],
+        [
+            stats.as_dict()
+            for stats in hass.data.get(const.DATA_CONNECTION_STATS, {}).values()
+        ],
+    )
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "http/request_stats"})
+@decorators.require_admin
+def handle_request_stats(hass, connection, msg):
+    """Handle HTTP request stats command."""
+    stats = async_get_request_stats(hass)
+
+    if stats is None:
+        connection.send_error(
+            msg["id"], const.ERR_NOT_FOUND, "HTTP request statistics are not enabled"
+        )
+        return
+
+    connection.send_result(msg["id"], stats.as_list())
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "template/render_stats"})
+@decorators.require_admin
+def handle_template_render_stats(hass, connection, msg):
+    """Handle template render stats command."""
+    profile = async_get_render_profile(hass)
+
+    if profile is None:
+        connection.send_error(
+            msg["id"], const.ERR_NOT_FOUND, "Template render profiling is not enabled"
+        )
+        return
+
+    connection.send_result(msg["id"], profile.as_list())
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "entity_platform/poll_stats"})
+@decorators.require_admin
+def handle_poll_stats(hass, connection, msg):
+    """Handle entity platform poll stats command."""
+    connection.send_result(msg["id"], async_get_polling_scheduler(hass).as_list())
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "storage/write_stats"})
+@decorators.require_admin
+def handle_storage_write_stats(hass, connection, msg):
+    """Handle storage write stats command."""
+    connection.send_result(msg["id"], async_get_storage_writer(hass).as_list())
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "update_coordinator/stats"})
+@decorators.require_admin
+def handle_update_coordinator_stats(hass, connection, msg):
+    """Handle update coordinator stats command."""
+    connection.send_result(msg["id"], async_get_update_coordinators(hass).as_list())
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "startup/trace"})
+@decorators.require_admin
+def handle_startup_trace(hass, connection, msg):
+    """Handle startup trace command."""
+    connection.send_result(msg["id"], async_get_setup_report(hass))
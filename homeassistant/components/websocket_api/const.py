@@ -1,12 +1,10 @@
 """Websocket constants."""
 import asyncio
 from concurrent import futures
-from functools import partial
-import json
 from typing import TYPE_CHECKING, Callable
 
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import json_dumps
 
 if TYPE_CHECKING:
     from .connection import ActiveConnection  # noqa
@@ -44,5 +42,10 @@ SIGNAL_WEBSOCKET_DISCONNECTED = "websocket_disconnected"
 
 # Data used to store the current connection list
 DATA_CONNECTIONS = f"{DOMAIN}.connections"
+# Data used to store the send statistics of the active connections
+DATA_CONNECTION_STATS = f"{DOMAIN}.connection_stats"
 
-JSON_DUMP = partial(json.dumps, cls=JSONEncoder, allow_nan=False)
+# Maximum number of queued messages sent together in one coalesced frame
+MAX_COALESCED_MSG = 256
+
+JSON_DUMP = json_dumps
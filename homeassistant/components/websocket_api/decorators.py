@@ -1,7 +1,9 @@
 """Decorators for the Websocket API."""
 import asyncio
 from functools import wraps
-from typing import Awaitable, Callable
+from typing import Awaitable, Callable, Union
+
+import voluptuous as vol
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import Unauthorized
@@ -109,15 +111,27 @@ def ws_require_user(
 
 
 def websocket_command(
-    schema: dict,
+    schema: Union[dict, vol.All],
 ) -> Callable[[const.WebSocketCommandHandler], const.WebSocketCommandHandler]:
-    """Tag a function as a websocket command."""
-    command = schema["type"]
+    """Tag a function as a websocket command.
+
+    The schema is either a dict or a vol.All that starts with a vol.Schema,
+    the latter allows validating fields against each other.
+    """
+    if isinstance(schema, dict):
+        command = schema["type"]
+        ws_schema = messages.BASE_COMMAND_MESSAGE_SCHEMA.extend(schema)
+    else:
+        base, *validators = schema.validators
+        command = base.schema["type"]
+        ws_schema = vol.All(
+            messages.BASE_COMMAND_MESSAGE_SCHEMA.extend(base.schema), *validators
+        )
 
     def decorate(func):
         """Decorate ws command function."""
         # pylint: disable=protected-access
-        func._ws_schema = messages.BASE_COMMAND_MESSAGE_SCHEMA.extend(schema)
+        func._ws_schema = ws_schema
         func._ws_command = command
         return func
 
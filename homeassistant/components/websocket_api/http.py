@@ -2,7 +2,8 @@
 import asyncio
 from contextlib import suppress
 import logging
-from typing import Optional
+from time import monotonic
+from typing import Any, Dict, Optional
 
 from aiohttp import WSMsgType, web
 import async_timeout
@@ -11,11 +12,14 @@ from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import callback
 from homeassistant.helpers.event import async_call_later
+import homeassistant.util.dt as dt_util
 
 from .auth import AuthPhase, auth_required_message
 from .const import (
     CANCELLATION_ERRORS,
+    DATA_CONNECTION_STATS,
     DATA_CONNECTIONS,
+    MAX_COALESCED_MSG,
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -50,6 +54,75 @@ class WebSocketAdapter(logging.LoggerAdapter):
         return f'[{self.extra["connid"]}] {msg}', kwargs
 
 
+class ConnectionStats:
+    """Statistics of the messages sent to a websocket client."""
+
+    def __init__(self, connid: int, remote: Optional[str], queue: asyncio.Queue):
+        """Initialize the statistics."""
+        self.connid = connid
+        self.remote = remote
+        self.user_id: Optional[str] = None
+        self.coalesce_messages = False
+        self.connected = dt_util.utcnow()
+        self.max_queue_size = 0
+        self.messages_sent = 0
+        self.frames_sent = 0
+        self.bytes_sent = 0
+        self.dropped_messages = 0
+        self.messages_per_second = 0.0
+        self._queue = queue
+        self._rate_start = monotonic()
+        self._rate_messages = 0
+
+    @callback
+    def async_record_queued(self) -> None:
+        """Record that a message was queued."""
+        queue_size = self._queue.qsize()
+        if queue_size > self.max_queue_size:
+            self.max_queue_size = queue_size
+
+    @callback
+    def async_record_frame(self, messages: int, size: int) -> None:
+        """Record that a frame with one or more messages was sent.
+
+        The size is the length of the text frame.
+        """
+        self.messages_sent += messages
+        self.frames_sent += 1
+        self.bytes_sent += size
+        self._rate_messages += messages
+        self._async_update_rate(monotonic())
+
+    @callback
+    def _async_update_rate(self, now: float) -> None:
+        """Update the messages per second once a second has passed."""
+        elapsed = now - self._rate_start
+        if elapsed < 1:
+            return
+        self.messages_per_second = round(self._rate_messages / elapsed, 1)
+        self._rate_start = now
+        self._rate_messages = 0
+
+    @callback
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        self._async_update_rate(monotonic())
+        return {
+            "id": self.connid,
+            "remote": self.remote,
+            "user_id": self.user_id,
+            "connected": self.connected.isoformat(),
+            "coalesce_messages": self.coalesce_messages,
+            "queue_size": self._queue.qsize(),
+            "max_queue_size": self.max_queue_size,
+            "messages_sent": self.messages_sent,
+            "frames_sent": self.frames_sent,
+            "bytes_sent": self.bytes_sent,
+            "messages_per_second": self.messages_per_second,
+            "dropped_messages": self.dropped_messages,
+        }
+
+
 class WebSocketHandler:
     """Handle an active websocket client connection."""
 
@@ -63,22 +136,50 @@ class WebSocketHandler:
         self._writer_task = None
         self._logger = WebSocketAdapter(_WS_LOGGER, {"connid": id(self)})
         self._peak_checker_unsub = None
+        self._coalesce_messages = False
+        self.stats = ConnectionStats(id(self), request.remote, self._to_write)
 
     async def _writer(self):
-        """Write outgoing messages."""
+        """Write outgoing messages.
+
+        If the client negotiated it during auth, all messages that are
+        queued at the time of writing are sent as one JSON array.
+        """
+        to_write = self._to_write
         # Exceptions if Socket disconnected or cancelled by connection handler
         with suppress(RuntimeError, ConnectionResetError, *CANCELLATION_ERRORS):
             while not self.wsock.closed:
-                message = await self._to_write.get()
+                message = await to_write.get()
                 if message is None:
                     break
 
-                self._logger.debug("Sending %s", message)
-
                 if not isinstance(message, str):
                     message = message_to_json(message)
 
-                await self.wsock.send_str(message)
+                if not self._coalesce_messages or to_write.empty():
+                    self._logger.debug("Sending %s", message)
+                    await self.wsock.send_str(message)
+                    self.stats.async_record_frame(1, len(message))
+                    continue
+
+                messages = [message]
+                closing = False
+                while not to_write.empty() and len(messages) < MAX_COALESCED_MSG:
+                    message = to_write.get_nowait()
+                    if message is None:
+                        closing = True
+                        break
+                    if not isinstance(message, str):
+                        message = message_to_json(message)
+                    messages.append(message)
+
+                coalesced = f"[{','.join(messages)}]"
+                self._logger.debug("Sending %s", coalesced)
+                await self.wsock.send_str(coalesced)
+                self.stats.async_record_frame(len(messages), len(coalesced))
+
+                if closing:
+                    break
 
         # Clean up the peaker checker when we shut down the writer
         if self._peak_checker_unsub:
@@ -96,11 +197,14 @@ class WebSocketHandler:
         try:
             self._to_write.put_nowait(message)
         except asyncio.QueueFull:
+            self.stats.dropped_messages += 1
             self._logger.error(
                 "Client exceeded max pending messages [2]: %s", MAX_PENDING_MSG
             )
 
             self._cancel()
+        else:
+            self.stats.async_record_queued()
 
         if self._to_write.qsize() < PENDING_MSG_PEAK:
             if self._peak_checker_unsub:
@@ -185,9 +289,16 @@ class WebSocketHandler:
 
             self._logger.debug("Received %s", msg_data)
             connection = await auth.async_handle(msg_data)
+            self._coalesce_messages = self.stats.coalesce_messages = bool(
+                msg_data.get("coalesce_messages")
+            )
+            self.stats.user_id = connection.user.id
             self.hass.data[DATA_CONNECTIONS] = (
                 self.hass.data.get(DATA_CONNECTIONS, 0) + 1
             )
+            self.hass.data.setdefault(DATA_CONNECTION_STATS, {})[
+                self.stats.connid
+            ] = self.stats
             self.hass.helpers.dispatcher.async_dispatcher_send(
                 SIGNAL_WEBSOCKET_CONNECTED
             )
@@ -243,6 +354,7 @@ class WebSocketHandler:
 
                 if connection is not None:
                     self.hass.data[DATA_CONNECTIONS] -= 1
+                    self.hass.data[DATA_CONNECTION_STATS].pop(self.stats.connid)
                 self.hass.helpers.dispatcher.async_dispatcher_send(
                     SIGNAL_WEBSOCKET_DISCONNECTED
                 )
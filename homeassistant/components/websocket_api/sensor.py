@@ -4,6 +4,7 @@ from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
 
 from .const import (
+    DATA_CONNECTION_STATS,
     DATA_CONNECTIONS,
     SIGNAL_WEBSOCKET_CONNECTED,
     SIGNAL_WEBSOCKET_DISCONNECTED,
@@ -14,9 +15,7 @@ from .const import (
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up the API streams platform."""
-    entity = APICount()
-
-    async_add_entities([entity])
+    async_add_entities([APICount(), APIPendingMessages()])
 
 
 class APICount(Entity):
@@ -58,3 +57,48 @@ class APICount(Entity):
     def _update_count(self):
         self.count = self.hass.data.get(DATA_CONNECTIONS, 0)
         self.async_write_ha_state()
+
+
+class APIPendingMessages(Entity):
+    """Entity to represent the send queue of the slowest websocket client."""
+
+    def __init__(self):
+        """Initialize the pending messages sensor."""
+        self.pending = 0
+        self.attrs = {}
+
+    @property
+    def name(self):
+        """Return name of entity."""
+        return "Websocket pending messages"
+
+    @property
+    def state(self):
+        """Return the largest number of pending messages of a client."""
+        return self.pending
+
+    @property
+    def unit_of_measurement(self):
+        """Return the unit of measurement."""
+        return "messages"
+
+    @property
+    def device_state_attributes(self):
+        """Return the totals of all connections."""
+        return self.attrs
+
+    async def async_update(self):
+        """Update the statistics of all connections."""
+        all_stats = [
+            stats.as_dict()
+            for stats in self.hass.data.get(DATA_CONNECTION_STATS, {}).values()
+        ]
+        slowest = max(all_stats, key=lambda stats: stats["queue_size"], default=None)
+        self.pending = 0 if slowest is None else slowest["queue_size"]
+        self.attrs = {
+            "slowest_client": None if slowest is None else slowest["remote"],
+            "messages_per_second": round(
+                sum(stats["messages_per_second"] for stats in all_stats), 1
+            ),
+            "dropped_messages": sum(stats["dropped_messages"] for stats in all_stats),
+        }
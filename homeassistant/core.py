@@ -73,6 +73,7 @@ from homeassistant.exceptions import (
 from homeassistant.util import location, network
 from homeassistant.util.async_ import fire_coroutine_threadsafe, run_callback_threadsafe
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json_encoder import json_bytes
 from homeassistant.util.timeout import TimeoutManager
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM, UnitSystem
 import homeassistant.util.uuid as uuid_util
@@ -838,6 +839,7 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_as_dict_json",
     ]
 
     def __init__(
@@ -873,6 +875,7 @@ class State:
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: Optional[Dict[str, Collection[Any]]] = None
+        self._as_dict_json: Optional[bytes] = None
 
     @property
     def name(self) -> str:
@@ -905,6 +908,17 @@ class State:
             }
         return self._as_dict
 
+    @property
+    def as_dict_json(self) -> bytes:
+        """Return the JSON representation of the State.
+
+        The serialized fragment is cached since a State never changes,
+        a new State object is created instead.
+        """
+        if self._as_dict_json is None:
+            self._as_dict_json = json_bytes(self.as_dict())
+        return self._as_dict_json
+
     @classmethod
     def from_dict(cls, json_dict: Dict) -> Any:
         """Initialize a state from a dict.
@@ -965,9 +979,19 @@ class StateMachine:
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: Dict[str, State] = {}
+        self._domain_index: Dict[str, Dict[str, State]] = {}
+        # Entity ids sorted per domain, None holds all of them
+        self._sorted_entity_ids: Dict[Optional[str], List[str]] = {}
         self._reservations: Set[str] = set()
         self._bus = bus
         self._loop = loop
+        self._version = 0
+        self._all_json: Optional[bytes] = None
+
+    @property
+    def version(self) -> int:
+        """Return a number that changes every time a state is set or removed."""
+        return self._version
 
     def entity_ids(self, domain_filter: Optional[str] = None) -> List[str]:
         """List of entity ids that are being tracked."""
@@ -988,7 +1012,7 @@ class StateMachine:
             return list(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), ()))
 
         return [
             state.entity_id
@@ -1008,7 +1032,7 @@ class StateMachine:
             return len(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return len(self._domain_index.get(domain_filter.lower(), ()))
 
         return len(
             [None for state in self._states.values() if state.domain in domain_filter]
@@ -1032,12 +1056,44 @@ class StateMachine:
             return list(self._states.values())
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), {}).values())
 
         return [
             state for state in self._states.values() if state.domain in domain_filter
         ]
 
+    @callback
+    def async_all_sorted(self, domain: Optional[str] = None) -> List[State]:
+        """Return all states, or those of a domain, sorted by entity id.
+
+        The order is kept until an entity is added or removed, so updating
+        states does not sort them again.
+
+        This method must be run in the event loop.
+        """
+        if domain is not None:
+            domain = domain.lower()
+        entity_ids = self._sorted_entity_ids.get(domain)
+        if entity_ids is None:
+            entity_ids = self._sorted_entity_ids[domain] = sorted(
+                self._states if domain is None else self._domain_index.get(domain, ())
+            )
+        states = self._states
+        return [states[entity_id] for entity_id in entity_ids]
+
+    @callback
+    def async_all_json(self) -> bytes:
+        """Return all states serialized as a JSON array.
+
+        The snapshot is joined from the JSON cached on each State and is
+        reused until the next state is set or removed.
+
+        This method must be run in the event loop.
+        """
+        if self._all_json is None:
+            self._all_json = states_to_json(self._states.values())
+        return self._all_json
+
     def get(self, entity_id: str) -> Optional[State]:
         """Retrieve state of entity_id or None if not found.
 
@@ -1079,6 +1135,12 @@ class StateMachine:
         if old_state is None:
             return False
 
+        domain_states = self._domain_index[old_state.domain]
+        del domain_states[entity_id]
+        if not domain_states:
+            del self._domain_index[old_state.domain]
+        self._async_entities_changed(old_state.domain)
+        self._async_state_changed()
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": None},
@@ -1184,6 +1246,10 @@ class StateMachine:
             old_state is None,
         )
         self._states[entity_id] = state
+        self._domain_index.setdefault(state.domain, {})[entity_id] = state
+        if old_state is None:
+            self._async_entities_changed(state.domain)
+        self._async_state_changed()
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
@@ -1192,6 +1258,23 @@ class StateMachine:
             time_fired=now,
         )
 
+    @callback
+    def _async_entities_changed(self, domain: str) -> None:
+        """Invalidate the sorted entity ids after an entity was added or removed."""
+        self._sorted_entity_ids.pop(None, None)
+        self._sorted_entity_ids.pop(domain, None)
+
+    @callback
+    def _async_state_changed(self) -> None:
+        """Invalidate the serialized snapshot of all states."""
+        self._version += 1
+        self._all_json = None
+
+
+def states_to_json(states: Iterable[State]) -> bytes:
+    """Join the cached JSON of states into a JSON array."""
+    return b"[" + b",".join([state.as_dict_json for state in states]) + b"]"
+
 
 class Service:
     """Representation of a callable service."""
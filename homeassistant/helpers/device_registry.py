@@ -1,7 +1,19 @@
 """Provide a way to connect entities belonging to one device."""
 from collections import OrderedDict
+from contextlib import contextmanager
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import attr
 
@@ -36,6 +48,9 @@ IDX_IDENTIFIERS = "identifiers"
 REGISTERED_DEVICE = "registered"
 DELETED_DEVICE = "deleted"
 
+# Attributes registered devices can be looked up by without scanning the registry
+INDEXED_ATTRIBUTES = ("area_id", "config_entries")
+
 DISABLED_INTEGRATION = "integration"
 DISABLED_USER = "user"
 
@@ -127,11 +142,15 @@ class DeviceRegistry:
     devices: Dict[str, DeviceEntry]
     deleted_devices: Dict[str, DeletedDeviceEntry]
     _devices_index: Dict[str, Dict[str, Dict[Tuple[str, str], str]]]
+    # Device IDs by attribute and value, the dicts are used as ordered sets
+    _indexes: Dict[str, Dict[str, Dict[str, None]]]
 
     def __init__(self, hass: HomeAssistantType) -> None:
         """Initialize the device registry."""
         self.hass = hass
         self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._save_deferrals = 0
+        self._save_pending = False
         self._clear_index()
 
     @callback
@@ -153,6 +172,14 @@ class DeviceRegistry:
             return None
         return self.devices[device_id]
 
+    @callback
+    def async_entries_for(self, attribute: str, value: str) -> List[DeviceEntry]:
+        """Return the registered devices with a value for an indexed attribute."""
+        return [
+            self.devices[device_id]
+            for device_id in self._indexes[attribute].get(value, ())
+        ]
+
     def _async_get_deleted_device(
         self,
         identifiers: Set[Tuple[str, str]],
@@ -192,6 +219,7 @@ class DeviceRegistry:
         else:
             devices_index = self._devices_index[REGISTERED_DEVICE]
             self.devices[device.id] = device
+            self._add_to_indexes(device)
 
         _add_device_to_index(devices_index, device)
 
@@ -203,6 +231,7 @@ class DeviceRegistry:
         else:
             devices_index = self._devices_index[REGISTERED_DEVICE]
             self.devices.pop(device.id)
+            self._remove_from_indexes(device)
 
         _remove_device_from_index(devices_index, device)
 
@@ -213,6 +242,23 @@ class DeviceRegistry:
         devices_index = self._devices_index[REGISTERED_DEVICE]
         _remove_device_from_index(devices_index, old_device)
         _add_device_to_index(devices_index, new_device)
+        self._remove_from_indexes(old_device)
+        self._add_to_indexes(new_device)
+
+    def _add_to_indexes(self, device: DeviceEntry) -> None:
+        """Add a registered device to the attribute indexes."""
+        for attribute, index in self._indexes.items():
+            for value in _index_values(getattr(device, attribute)):
+                index.setdefault(value, {})[device.id] = None
+
+    def _remove_from_indexes(self, device: DeviceEntry) -> None:
+        """Remove a registered device from the attribute indexes."""
+        for attribute, index in self._indexes.items():
+            for value in _index_values(getattr(device, attribute)):
+                device_ids = index[value]
+                del device_ids[device.id]
+                if not device_ids:
+                    del index[value]
 
     def _clear_index(self) -> None:
         """Clear the index."""
@@ -220,12 +266,14 @@ class DeviceRegistry:
             REGISTERED_DEVICE: {IDX_IDENTIFIERS: {}, IDX_CONNECTIONS: {}},
             DELETED_DEVICE: {IDX_IDENTIFIERS: {}, IDX_CONNECTIONS: {}},
         }
+        self._indexes = {attribute: {} for attribute in INDEXED_ATTRIBUTES}
 
     def _rebuild_index(self) -> None:
         """Create the index after loading devices."""
         self._clear_index()
         for device in self.devices.values():
             _add_device_to_index(self._devices_index[REGISTERED_DEVICE], device)
+            self._add_to_indexes(device)
         for deleted_device in self.deleted_devices.values():
             _add_device_to_index(self._devices_index[DELETED_DEVICE], deleted_device)
 
@@ -498,8 +546,27 @@ class DeviceRegistry:
     @callback
     def async_schedule_save(self) -> None:
         """Schedule saving the device registry."""
+        if self._save_deferrals:
+            self._save_pending = True
+            return
         self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
 
+    @contextmanager
+    def async_defer_save(self) -> Iterator[None]:
+        """Defer scheduling a save until the block is left.
+
+        Changes made inside the block result in a single scheduled save.
+        This method must be run in the event loop.
+        """
+        self._save_deferrals += 1
+        try:
+            yield
+        finally:
+            self._save_deferrals -= 1
+            if not self._save_deferrals and self._save_pending:
+                self._save_pending = False
+                self.async_schedule_save()
+
     @callback
     def _data_to_save(self) -> Dict[str, List[Dict[str, Any]]]:
         """Return data of device registry to store in a file."""
@@ -538,7 +605,7 @@ class DeviceRegistry:
     @callback
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
-        for device in list(self.devices.values()):
+        for device in self.async_entries_for("config_entries", config_entry_id):
             self._async_update_device(device.id, remove_config_entry_id=config_entry_id)
         for deleted_device in list(self.deleted_devices.values()):
             config_entries = deleted_device.config_entries
@@ -559,9 +626,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self._async_update_device(dev_id, area_id=None)
+        for device in self.async_entries_for("area_id", area_id):
+            self._async_update_device(device.id, area_id=None)
 
 
 @singleton(DATA_REGISTRY)
@@ -575,7 +641,7 @@ async def async_get_registry(hass: HomeAssistantType) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> List[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return registry.async_entries_for("area_id", area_id)
 
 
 @callback
@@ -583,11 +649,7 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> List[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    return registry.async_entries_for("config_entries", config_entry_id)
 
 
 @callback
@@ -664,6 +726,15 @@ def async_setup_cleanup(hass: HomeAssistantType, dev_reg: DeviceRegistry) -> Non
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, startup_clean)
 
 
+def _index_values(value: Union[str, Set[str], None]) -> Iterable[str]:
+    """Return the values a device is indexed under for an attribute value."""
+    if value is None:
+        return ()
+    if isinstance(value, set):
+        return value
+    return (value,)
+
+
 def _normalize_connections(connections: Set[Tuple[str, str]]) -> Set[Tuple[str, str]]:
     """Normalize connections to ensure we can match mac addresses."""
     return {
@@ -5,7 +5,7 @@ from datetime import datetime, timedelta
 import functools as ft
 import logging
 from timeit import default_timer as timer
-from typing import Any, Awaitable, Dict, Iterable, List, Optional
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Tuple
 
 from homeassistant.config import DATA_CUSTOMIZE
 from homeassistant.const import (
@@ -110,6 +110,16 @@ class Entity(ABC):
     # Process updates in parallel
     parallel_updates: Optional[asyncio.Semaphore] = None
 
+    # Read the capability attributes, unit of measurement, name, icon,
+    # entity picture, assumed state, supported features and device class
+    # once instead of on every state write. They are read again after the
+    # registry entry is updated or async_invalidate_static_attributes is
+    # called.
+    cache_static_attributes = False
+
+    # Capability attributes and other static attributes when cached
+    _static_attributes: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
+
     # Entry in the entity registry
     registry_entry: Optional[RegistryEntry] = None
 
@@ -311,8 +321,14 @@ class Entity(ABC):
 
         start = timer()
 
-        attr = self.capability_attributes
-        attr = dict(attr) if attr else {}
+        cached = self._static_attributes if self.cache_static_attributes else None
+        if cached is None:
+            capability_attr = self.capability_attributes
+            attr = dict(capability_attr) if capability_attr else {}
+            if self.cache_static_attributes:
+                capability_attr = dict(attr)
+        else:
+            attr = dict(cached[0])
 
         if not self.available:
             state = STATE_UNAVAILABLE
@@ -322,35 +338,13 @@ class Entity(ABC):
             attr.update(self.state_attributes or {})
             attr.update(self.device_state_attributes or {})
 
-        unit_of_measurement = self.unit_of_measurement
-        if unit_of_measurement is not None:
-            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
-
-        entry = self.registry_entry
-        # pylint: disable=consider-using-ternary
-        name = (entry and entry.name) or self.name
-        if name is not None:
-            attr[ATTR_FRIENDLY_NAME] = name
-
-        icon = (entry and entry.icon) or self.icon
-        if icon is not None:
-            attr[ATTR_ICON] = icon
-
-        entity_picture = self.entity_picture
-        if entity_picture is not None:
-            attr[ATTR_ENTITY_PICTURE] = entity_picture
-
-        assumed_state = self.assumed_state
-        if assumed_state:
-            attr[ATTR_ASSUMED_STATE] = assumed_state
-
-        supported_features = self.supported_features
-        if supported_features is not None:
-            attr[ATTR_SUPPORTED_FEATURES] = supported_features
-
-        device_class = self.device_class
-        if device_class is not None:
-            attr[ATTR_DEVICE_CLASS] = str(device_class)
+        if cached is None:
+            static_attr = self._async_static_attributes()
+            if self.cache_static_attributes:
+                self._static_attributes = (capability_attr, static_attr)  # type: ignore
+        else:
+            static_attr = cached[1]
+        attr.update(static_attr)
 
         end = timer()
 
@@ -409,6 +403,51 @@ class Entity(ABC):
             self.entity_id, state, attr, self.force_update, self._context
         )
 
+    @callback
+    def _async_static_attributes(self) -> Dict[str, Any]:
+        """Return the attributes that don't change with the state."""
+        attr: Dict[str, Any] = {}
+
+        unit_of_measurement = self.unit_of_measurement
+        if unit_of_measurement is not None:
+            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
+
+        entry = self.registry_entry
+        # pylint: disable=consider-using-ternary
+        name = (entry and entry.name) or self.name
+        if name is not None:
+            attr[ATTR_FRIENDLY_NAME] = name
+
+        icon = (entry and entry.icon) or self.icon
+        if icon is not None:
+            attr[ATTR_ICON] = icon
+
+        entity_picture = self.entity_picture
+        if entity_picture is not None:
+            attr[ATTR_ENTITY_PICTURE] = entity_picture
+
+        assumed_state = self.assumed_state
+        if assumed_state:
+            attr[ATTR_ASSUMED_STATE] = assumed_state
+
+        supported_features = self.supported_features
+        if supported_features is not None:
+            attr[ATTR_SUPPORTED_FEATURES] = supported_features
+
+        device_class = self.device_class
+        if device_class is not None:
+            attr[ATTR_DEVICE_CLASS] = str(device_class)
+
+        return attr
+
+    @callback
+    def async_invalidate_static_attributes(self) -> None:
+        """Read the static attributes again on the next state write.
+
+        Only needed by entities that cache their static attributes.
+        """
+        self._static_attributes = None
+
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
 
@@ -616,6 +655,7 @@ class Entity(ABC):
         old = self.registry_entry
         self.registry_entry = ent_reg.async_get(data["entity_id"])
         assert self.registry_entry is not None
+        self._static_attributes = None
 
         if self.registry_entry.disabled_by is not None:
             await self.async_remove()
@@ -3,13 +3,26 @@ import asyncio
 from contextvars import ContextVar
 from datetime import datetime, timedelta
 from logging import Logger
+from time import perf_counter
 from types import ModuleType
-from typing import TYPE_CHECKING, Callable, Coroutine, Dict, Iterable, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+from zlib import crc32
 
 from homeassistant import config_entries
 from homeassistant.const import ATTR_RESTORED, DEVICE_DEFAULT_NAME
 from homeassistant.core import (
     CALLBACK_TYPE,
+    HassJob,
     ServiceCall,
     callback,
     split_entity_id,
@@ -18,12 +31,15 @@ from homeassistant.core import (
 from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
 from homeassistant.helpers import config_validation as cv, service
 from homeassistant.helpers.typing import HomeAssistantType
+from homeassistant.loader import bind_hass
+from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 
 from .entity_registry import DISABLED_INTEGRATION
-from .event import async_call_later, async_track_time_interval
+from .event import async_call_later, async_track_point_in_utc_time
 
 if TYPE_CHECKING:
+    from .device_registry import DeviceRegistry
     from .entity import Entity
 
 
@@ -34,8 +50,16 @@ SLOW_ADD_MIN_TIMEOUT = 500
 
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
+DATA_POLLING_SCHEDULER = "entity_platform_polling_scheduler"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
+# Platforms with the same scan interval are spread over this part of it
+POLL_JITTER_SPREAD = 0.5
+# Leave executor threads for other jobs when many entities poll at once
+MAX_PARALLEL_EXECUTOR_POLLS = 16
+# A platform that keeps overrunning is polled at most this much less often
+MAX_POLL_BACKOFF = 8
+
 
 class EntityPlatform:
     """Manage the entities for a single platform."""
@@ -69,6 +93,7 @@ class EntityPlatform:
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: Optional[CALLBACK_TYPE] = None
         self._process_updates: Optional[asyncio.Lock] = None
+        self.poll_stats: Optional[PlatformPollStats] = None
 
         self.parallel_updates: Optional[asyncio.Semaphore] = None
 
@@ -298,9 +323,11 @@ class EntityPlatform:
 
         device_registry = await hass.helpers.device_registry.async_get_registry()
         entity_registry = await hass.helpers.entity_registry.async_get_registry()
+        # Entities added together usually share their devices
+        device_ids: Dict[Tuple, Optional[str]] = {}
         tasks = [
             self._async_add_entity(  # type: ignore
-                entity, update_before_add, entity_registry, device_registry
+                entity, update_before_add, entity_registry, device_registry, device_ids
             )
             for entity in new_entities
         ]
@@ -311,8 +338,10 @@ class EntityPlatform:
 
         timeout = max(SLOW_ADD_ENTITY_MAX_WAIT * len(tasks), SLOW_ADD_MIN_TIMEOUT)
         try:
-            async with self.hass.timeout.async_timeout(timeout, self.domain):
-                await asyncio.gather(*tasks)
+            # Schedule a single save of the registries for the whole batch
+            with entity_registry.async_defer_save(), device_registry.async_defer_save():
+                async with self.hass.timeout.async_timeout(timeout, self.domain):
+                    await asyncio.gather(*tasks)
         except asyncio.TimeoutError:
             self.logger.warning(
                 "Timed out adding entities for domain %s with platform %s after %ds",
@@ -333,14 +362,12 @@ class EntityPlatform:
         ):
             return
 
-        self._async_unsub_polling = async_track_time_interval(
-            self.hass,
-            self._update_entity_states,
-            self.scan_interval,
-        )
+        self._async_unsub_polling = async_get_polling_scheduler(
+            self.hass
+        ).async_add_platform(self)
 
     async def _async_add_entity(  # type: ignore[no-untyped-def]
-        self, entity, update_before_add, entity_registry, device_registry
+        self, entity, update_before_add, entity_registry, device_registry, device_ids
     ):
         """Add an entity to the platform."""
         if entity is None:
@@ -401,9 +428,9 @@ class EntityPlatform:
                     if key in device_info:
                         processed_dev_info[key] = device_info[key]
 
-                device = device_registry.async_get_or_create(**processed_dev_info)
-                if device:
-                    device_id = device.id
+                device_id = _async_get_device_id(
+                    device_registry, processed_dev_info, device_ids
+                )
 
             disabled_by: Optional[str] = None
             if not entity.entity_registry_enabled_default:
@@ -588,6 +615,16 @@ class EntityPlatform:
             self.platform_name, name, handle_service, schema
         )
 
+    @property
+    def poll_name(self) -> str:
+        """Return the name the polling of the platform is known by."""
+        name = f"{self.domain}.{self.platform_name}"
+        if self.config_entry is not None:
+            return f"{name}/{self.config_entry.entry_id}"
+        if self.entity_namespace is not None:
+            return f"{name}/{self.entity_namespace}"
+        return name
+
     async def _update_entity_states(self, now: datetime) -> None:
         """Update the states of all the polling entities.
 
@@ -607,16 +644,209 @@ class EntityPlatform:
             )
             return
 
+        scheduler = async_get_polling_scheduler(self.hass)
+        start = perf_counter()
+
         async with self._process_updates:
             tasks = []
             for entity in self.entities.values():
                 if not entity.should_poll:
                     continue
-                tasks.append(entity.async_update_ha_state(True))
+                if hasattr(entity, "async_update") or not hasattr(entity, "update"):
+                    tasks.append(entity.async_update_ha_state(True))
+                else:
+                    tasks.append(scheduler.async_executor_poll(entity))
 
             if tasks:
                 await asyncio.gather(*tasks)
 
+        self._async_record_poll(perf_counter() - start)
+
+    @callback
+    def _async_record_poll(self, duration: float) -> None:
+        """Record a poll and adapt the poll interval to its duration."""
+        stats = self.poll_stats
+        if stats is None:
+            # Polling stopped while updating
+            return
+
+        stats.async_record(duration)
+        interval = stats.interval
+
+        if duration > interval.total_seconds():
+            stats.overruns += 1
+            stats.interval = min(interval * 2, self.scan_interval * MAX_POLL_BACKOFF)
+            if stats.interval != interval:
+                self.logger.debug(
+                    "Polling %s took %.3f seconds, polling every %s",
+                    self.poll_name,
+                    duration,
+                    stats.interval,
+                )
+        elif interval > self.scan_interval and duration < interval.total_seconds() / 4:
+            stats.interval = max(interval / 2, self.scan_interval)
+
+
+@callback
+def _async_get_device_id(
+    device_registry: "DeviceRegistry",
+    device_info: Dict[str, Any],
+    device_ids: Dict[Tuple, Optional[str]],
+) -> Optional[str]:
+    """Return the id of the device of an entity, create it if needed.
+
+    Devices are looked up once per batch of added entities in device_ids.
+    """
+    key: Optional[Tuple] = None
+    # The device linked to can be created by a later entity of the batch
+    if "via_device" not in device_info:
+        key = tuple(
+            (item, frozenset(value) if isinstance(value, set) else value)
+            for item, value in device_info.items()
+        )
+        try:
+            return device_ids[key]
+        except KeyError:
+            pass
+        except TypeError:
+            key = None
+
+    device = device_registry.async_get_or_create(**device_info)
+    device_id = device.id if device else None
+    if key is not None:
+        device_ids[key] = device_id
+    return device_id
+
+
+class PlatformPollStats:
+    """Statistics of polling a single entity platform."""
+
+    __slots__ = ("name", "interval", "polls", "overruns", "total_time", "max_time")
+
+    def __init__(self, name: str, interval: timedelta) -> None:
+        """Initialize the statistics."""
+        self.name = name
+        # The interval is increased while polls take longer than it
+        self.interval = interval
+        self.polls = 0
+        self.overruns = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    @callback
+    def async_record(self, duration: float) -> None:
+        """Record a poll."""
+        self.polls += 1
+        self.total_time += duration
+        if duration > self.max_time:
+            self.max_time = duration
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a dictionary version of the statistics."""
+        return {
+            "platform": self.name,
+            "interval": self.interval.total_seconds(),
+            "polls": self.polls,
+            "overruns": self.overruns,
+            "average_time": (
+                round(self.total_time / self.polls, 6) if self.polls else None
+            ),
+            "max_time": round(self.max_time, 6),
+        }
+
+
+def _poll_offset(name: str, interval: timedelta) -> timedelta:
+    """Return how much earlier in its interval a platform is polled.
+
+    The offset is derived from the name, so a platform keeps its place
+    between restarts.
+    """
+    return interval * (POLL_JITTER_SPREAD * crc32(name.encode()) / 2 ** 32)
+
+
+class PollingScheduler:
+    """Schedule the polling of all entity platforms.
+
+    Each platform is polled at its own phase within its scan interval, so
+    platforms that share an interval don't all poll at the same moment.
+    Entities that update in the executor share a limit of parallel updates.
+    """
+
+    def __init__(self, hass: HomeAssistantType) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.executor_polls = asyncio.Semaphore(MAX_PARALLEL_EXECUTOR_POLLS)
+        self.platforms: List[EntityPlatform] = []
+
+    @callback
+    def async_add_platform(self, platform: EntityPlatform) -> CALLBACK_TYPE:
+        """Start polling a platform."""
+        hass = self.hass
+        stats = platform.poll_stats = PlatformPollStats(
+            platform.poll_name, platform.scan_interval
+        )
+        # pylint: disable=protected-access
+        update_job = HassJob(platform._update_entity_states)
+        cancel_poll: Optional[CALLBACK_TYPE] = None
+
+        @callback
+        def _async_poll(now: datetime) -> None:
+            """Poll the platform and schedule the next poll."""
+            nonlocal cancel_poll
+            cancel_poll = async_track_point_in_utc_time(
+                hass, poll_job, dt_util.utcnow() + stats.interval
+            )
+            hass.async_run_hass_job(update_job, now)
+
+        poll_job = HassJob(_async_poll)
+        cancel_poll = async_track_point_in_utc_time(
+            hass,
+            poll_job,
+            dt_util.utcnow()
+            + stats.interval
+            - _poll_offset(stats.name, stats.interval),
+        )
+        self.platforms.append(platform)
+
+        @callback
+        def remove_platform() -> None:
+            """Stop polling the platform."""
+            cancel_poll()  # type: ignore
+            self.platforms.remove(platform)
+            platform.poll_stats = None
+
+        return remove_platform
+
+    async def async_executor_poll(self, entity: "Entity") -> None:
+        """Poll an entity that updates in the executor."""
+        async with self.executor_polls:
+            await entity.async_update_ha_state(True)
+
+    def as_list(self) -> List[Dict[str, Any]]:
+        """Return the poll statistics of all platforms, busiest first."""
+        return [
+            stats.as_dict()
+            for stats in sorted(
+                (
+                    platform.poll_stats
+                    for platform in self.platforms
+                    if platform.poll_stats is not None
+                ),
+                key=lambda stats: stats.total_time,
+                reverse=True,
+            )
+        ]
+
+
+@callback
+@bind_hass
+def async_get_polling_scheduler(hass: HomeAssistantType) -> PollingScheduler:
+    """Return the scheduler polling the entity platforms."""
+    scheduler: Optional[PollingScheduler] = hass.data.get(DATA_POLLING_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[DATA_POLLING_SCHEDULER] = PollingScheduler(hass)
+    return scheduler
+
 
 current_platform: ContextVar[Optional[EntityPlatform]] = ContextVar(
     "current_platform", default=None
@@ -8,6 +8,7 @@ registered. Registering a new entity while a timer is in progress resets the
 timer.
 """
 from collections import OrderedDict
+from contextlib import contextmanager
 import logging
 from typing import (
     TYPE_CHECKING,
@@ -15,6 +16,7 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -58,6 +60,9 @@ DISABLED_USER = "user"
 STORAGE_VERSION = 1
 STORAGE_KEY = "core.entity_registry"
 
+# Attributes entries can be looked up by without scanning the registry
+INDEXED_ATTRIBUTES = ("config_entry_id", "device_id", "area_id", "domain", "platform")
+
 # Attributes relevant to describing entity
 # to external services.
 ENTITY_DESCRIBING_ATTRIBUTES = {
@@ -124,7 +129,13 @@ class EntityRegistry:
         self.hass = hass
         self.entities: Dict[str, RegistryEntry]
         self._index: Dict[Tuple[str, str, str], str] = {}
+        # Entity IDs by attribute and value, the dicts are used as ordered sets
+        self._indexes: Dict[str, Dict[str, Dict[str, None]]] = {
+            attribute: {} for attribute in INDEXED_ATTRIBUTES
+        }
         self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._save_deferrals = 0
+        self._save_pending = False
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
         )
@@ -162,6 +173,14 @@ class EntityRegistry:
         """Check if an entity_id is currently registered."""
         return self._index.get((domain, platform, unique_id))
 
+    @callback
+    def async_entries_for(self, attribute: str, value: str) -> List[RegistryEntry]:
+        """Return the entries with a value for an indexed attribute."""
+        return [
+            self.entities[entity_id]
+            for entity_id in self._indexes[attribute].get(value, ())
+        ]
+
     @callback
     def async_generate_entity_id(
         self,
@@ -235,9 +254,9 @@ class EntityRegistry:
                 # stored entity IDs with either a __ or ending in _.
                 # Fix introduced in 0.86 (Jan 23, 2019). Next line can be
                 # removed when we release 1.0 or in 2020.
-                new_entity_id=".".join(
-                    slugify(part) for part in entity_id.split(".", 1)
-                ),
+                new_entity_id=entity_id
+                if valid_entity_id(entity_id)
+                else ".".join(slugify(part) for part in entity_id.split(".", 1)),
             )
 
         entity_id = self.async_generate_entity_id(
@@ -472,8 +491,27 @@ class EntityRegistry:
     @callback
     def async_schedule_save(self) -> None:
         """Schedule saving the entity registry."""
+        if self._save_deferrals:
+            self._save_pending = True
+            return
         self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
 
+    @contextmanager
+    def async_defer_save(self) -> Iterator[None]:
+        """Defer scheduling a save until the block is left.
+
+        Changes made inside the block result in a single scheduled save.
+        This method must be run in the event loop.
+        """
+        self._save_deferrals += 1
+        try:
+            yield
+        finally:
+            self._save_deferrals -= 1
+            if not self._save_deferrals and self._save_pending:
+                self._save_pending = False
+                self.async_schedule_save()
+
     @callback
     def _data_to_save(self) -> Dict[str, Any]:
         """Return data of entity registry to store in a file."""
@@ -505,19 +543,14 @@ class EntityRegistry:
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
+        for entity_id in list(self._indexes["config_entry_id"].get(config_entry, ())):
             self.async_remove(entity_id)
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if area_id == entry.area_id:
-                self._async_update_entity(entity_id, area_id=None)
+        for entity_id in list(self._indexes["area_id"].get(area_id, ())):
+            self._async_update_entity(entity_id, area_id=None)
 
     def _register_entry(self, entry: RegistryEntry) -> None:
         self.entities[entry.entity_id] = entry
@@ -525,6 +558,10 @@ class EntityRegistry:
 
     def _add_index(self, entry: RegistryEntry) -> None:
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        for attribute, index in self._indexes.items():
+            value = getattr(entry, attribute)
+            if value is not None:
+                index.setdefault(value, {})[entry.entity_id] = None
 
     def _unregister_entry(self, entry: RegistryEntry) -> None:
         self._remove_index(entry)
@@ -532,9 +569,19 @@ class EntityRegistry:
 
     def _remove_index(self, entry: RegistryEntry) -> None:
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        for attribute, index in self._indexes.items():
+            value = getattr(entry, attribute)
+            if value is None:
+                continue
+            entity_ids = index[value]
+            del entity_ids[entry.entity_id]
+            if not entity_ids:
+                del index[value]
 
     def _rebuild_index(self) -> None:
         self._index = {}
+        for index in self._indexes.values():
+            index.clear()
         for entry in self.entities.values():
             self._add_index(entry)
 
@@ -554,9 +601,8 @@ def async_entries_for_device(
     """Return entries that match a device."""
     return [
         entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
+        for entry in registry.async_entries_for("device_id", device_id)
+        if not entry.disabled_by or include_disabled_entities
     ]
 
 
@@ -565,7 +611,7 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> List[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    return registry.async_entries_for("area_id", area_id)
 
 
 @callback
@@ -573,11 +619,15 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> List[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return registry.async_entries_for("config_entry_id", config_entry_id)
+
+
+@callback
+def async_entries_for_domain(
+    registry: EntityRegistry, domain: str
+) -> List[RegistryEntry]:
+    """Return entries that match a domain."""
+    return registry.async_entries_for("domain", domain)
 
 
 async def _async_migrate(entities: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
@@ -658,10 +708,7 @@ async def async_migrate_entries(
     """Migrator of unique IDs."""
     ent_reg = await async_get_registry(hass)
 
-    for entry in ent_reg.entities.values():
-        if entry.config_entry_id != config_entry_id:
-            continue
-
+    for entry in async_entries_for_config_entry(ent_reg, config_entry_id):
         updates = entry_callback(entry)
 
         if updates is not None:
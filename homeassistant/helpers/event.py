@@ -11,8 +11,10 @@ from typing import (
     Awaitable,
     Callable,
     Dict,
+    FrozenSet,
     Iterable,
     List,
+    Mapping,
     Optional,
     Set,
     Tuple,
@@ -62,6 +64,14 @@ TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
+TRACK_FILTERED_EVENT_INDEXES = "track_filtered_event_indexes"
+
+TRACK_TEMPLATE_RENDER_SCHEDULER = "track_template_render_scheduler"
+
+# Seconds a flush of dirty templates may take before the remaining
+# templates are rendered in the next loop iteration
+TEMPLATE_RENDER_FLUSH_BUDGET = 0.05
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -640,6 +650,251 @@ def async_track_state_change_filtered(
     return tracker
 
 
+class _FilteredEventSubscription:
+    """A subscription that only wants events for some entities."""
+
+    __slots__ = ("action", "entity_ids", "domains", "attributes")
+
+    def __init__(
+        self,
+        action: Callable[[Event], None],
+        entity_ids: FrozenSet[str],
+        domains: FrozenSet[str],
+        attributes: FrozenSet[str],
+    ) -> None:
+        """Initialize the subscription."""
+        self.action = action
+        self.entity_ids = entity_ids
+        self.domains = domains
+        self.attributes = attributes
+
+    @property
+    def index_keys(self) -> List[str]:
+        """Return the domain index keys of this subscription."""
+        if self.entity_ids or self.domains:
+            return list(self.domains)
+        return [MATCH_ALL]
+
+
+class _FilteredEventIndex:
+    """Route events of a single type to filtered subscriptions.
+
+    Instead of every subscription checking every event, subscriptions are
+    indexed by entity_id and domain. A single bus listener routes each
+    event to the interested subscriptions with dict lookups.
+    """
+
+    def __init__(self, hass: HomeAssistant, event_type: str) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self.event_type = event_type
+        self.by_entity_id: Dict[str, List[_FilteredEventSubscription]] = {}
+        self.by_domain: Dict[str, List[_FilteredEventSubscription]] = {}
+        self._unsub: Optional[CALLBACK_TYPE] = None
+
+    @property
+    def empty(self) -> bool:
+        """Return if there are no subscriptions in the index."""
+        return not self.by_entity_id and not self.by_domain
+
+    @callback
+    def async_add(self, subscription: _FilteredEventSubscription) -> None:
+        """Add a subscription to the index."""
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(
+                self.event_type, self._async_dispatch
+            )
+        for entity_id in subscription.entity_ids:
+            self.by_entity_id.setdefault(entity_id, []).append(subscription)
+        for domain in subscription.index_keys:
+            self.by_domain.setdefault(domain, []).append(subscription)
+
+    @callback
+    def async_remove(self, subscription: _FilteredEventSubscription) -> None:
+        """Remove a subscription from the index."""
+        _remove_from_filtered_index(
+            self.by_entity_id, subscription.entity_ids, subscription
+        )
+        _remove_from_filtered_index(
+            self.by_domain, subscription.index_keys, subscription
+        )
+        if self.empty and self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_dispatch(self, event: Event) -> None:
+        """Dispatch an event to the subscriptions that want it."""
+        entity_id = event.data.get(ATTR_ENTITY_ID)
+        if not isinstance(entity_id, str):
+            return
+
+        by_entity_id = self.by_entity_id.get(entity_id)
+        by_domain = self.by_domain.get(entity_id.split(".", 1)[0])
+        match_all = self.by_domain.get(MATCH_ALL)
+
+        if by_entity_id is None and by_domain is None and match_all is None:
+            return
+
+        # A subscription can be indexed both by entity_id and domain
+        matched: Dict[int, _FilteredEventSubscription] = {}
+        for subscriptions in (by_entity_id, by_domain, match_all):
+            if subscriptions is not None:
+                for subscription in subscriptions:
+                    matched[id(subscription)] = subscription
+
+        changed: Optional[Set[str]] = None
+        diffed = False
+
+        for subscription in matched.values():
+            if subscription.attributes and event.event_type == EVENT_STATE_CHANGED:
+                if not diffed:
+                    changed = _changed_state_keys(event)
+                    diffed = True
+                if changed is not None and changed.isdisjoint(subscription.attributes):
+                    continue
+            try:
+                subscription.action(event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error while forwarding event for %s", entity_id)
+
+
+def _remove_from_filtered_index(
+    index: Dict[str, List[_FilteredEventSubscription]],
+    keys: Iterable[str],
+    subscription: _FilteredEventSubscription,
+) -> None:
+    """Remove a subscription from an index."""
+    for key in keys:
+        index[key].remove(subscription)
+        if not index[key]:
+            del index[key]
+
+
+def attributes_diff(
+    old_attributes: Mapping[str, Any], new_attributes: Mapping[str, Any]
+) -> Tuple[Dict[str, Any], List[str]]:
+    """Return the changed and removed attributes between two states."""
+    if old_attributes == new_attributes:
+        return {}, []
+    changed = {
+        key: value
+        for key, value in new_attributes.items()
+        if key not in old_attributes or old_attributes[key] != value
+    }
+    removed = [key for key in old_attributes if key not in new_attributes]
+    return changed, removed
+
+
+def _changed_state_keys(event: Event) -> Optional[Set[str]]:
+    """Return the attributes that changed in a state changed event.
+
+    The state value itself is reported as the "state" key. Returns None
+    when the entity was added or removed, which matches every filter.
+    """
+    old_state = event.data.get("old_state")
+    new_state = event.data.get("new_state")
+    if old_state is None or new_state is None:
+        return None
+
+    changed, removed = attributes_diff(old_state.attributes, new_state.attributes)
+    keys = set(changed).union(removed)
+    if old_state.state != new_state.state:
+        keys.add("state")
+    return keys
+
+
+@callback
+@bind_hass
+def async_track_filtered_events(
+    hass: HomeAssistant,
+    event_type: str,
+    action: Callable[[Event], None],
+    entity_ids: Optional[Iterable[str]] = None,
+    domains: Optional[Iterable[str]] = None,
+    attributes: Optional[Iterable[str]] = None,
+) -> CALLBACK_TYPE:
+    """Track events of a type for specific entities, domains or attributes.
+
+    Events without an entity_id are never passed to the action. Attribute
+    filters only apply to state changed events, the "state" attribute
+    matches changes of the state value.
+    """
+    indexes: Dict[str, _FilteredEventIndex] = hass.data.setdefault(
+        TRACK_FILTERED_EVENT_INDEXES, {}
+    )
+    index = indexes.get(event_type)
+    if index is None:
+        index = indexes[event_type] = _FilteredEventIndex(hass, event_type)
+
+    subscription = _FilteredEventSubscription(
+        action,
+        frozenset(entity_id.lower() for entity_id in entity_ids or ()),
+        frozenset(domain.lower() for domain in domains or ()),
+        frozenset(attributes or ()),
+    )
+    index.async_add(subscription)
+
+    @callback
+    def remove_subscription() -> None:
+        """Remove the filtered subscription."""
+        index.async_remove(subscription)  # type: ignore
+        if index.empty and indexes.get(event_type) is index:  # type: ignore
+            del indexes[event_type]
+
+    return remove_subscription
+
+
+@callback
+@bind_hass
+def async_track_state_attribute_change(
+    hass: HomeAssistant,
+    entity_attributes: Iterable[Tuple[str, str]],
+    action: Callable[[Event], Any],
+) -> CALLBACK_TYPE:
+    """Track changes of specific attributes of entities.
+
+    Takes (entity_id, attribute) pairs, the "state" attribute matches
+    changes of the state value. The action is called with the state changed
+    event when one of the attributes of the entity changed, or when the
+    entity is added or removed.
+    """
+    attributes_by_entity_id: Dict[str, Set[str]] = {}
+    for entity_id, attribute in entity_attributes:
+        attributes_by_entity_id.setdefault(entity_id.lower(), set()).add(attribute)
+
+    if not attributes_by_entity_id:
+        return _remove_empty_listener
+
+    job = HassJob(action)
+
+    @callback
+    def _async_attribute_changed(event: Event) -> None:
+        """Call the action for a changed attribute."""
+        hass.async_run_hass_job(job, event)
+
+    # The changed attributes are computed once per event by the index,
+    # however many entities and attributes are tracked.
+    unsubs = [
+        async_track_filtered_events(
+            hass,
+            EVENT_STATE_CHANGED,
+            _async_attribute_changed,
+            entity_ids=[entity_id],
+            attributes=attributes,
+        )
+        for entity_id, attributes in attributes_by_entity_id.items()
+    ]
+
+    @callback
+    def remove_listener() -> None:
+        """Remove the attribute change listeners."""
+        for unsub in unsubs:
+            unsub()
+
+    return remove_listener
+
+
 @callback
 @bind_hass
 def async_track_template(
@@ -730,6 +985,97 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+class TemplateRenderScheduler:
+    """Coalesce re-renders of tracked templates.
+
+    State changes mark the templates they trigger as dirty instead of
+    rendering them. Dirty templates are rendered once, in the next loop
+    iteration or after min_interval seconds since the previous flush,
+    cheapest first.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.min_interval = 0.0
+        self._pending: Dict[_TrackTemplateResultInfo, None] = {}
+        self._scheduled = False
+        self._last_flush = 0.0
+        self.marked = 0
+        self.renders = 0
+        self.renders_avoided = 0
+        self.flushes = 0
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Return the statistics of the scheduler."""
+        return {
+            "min_interval": self.min_interval,
+            "pending": len(self._pending),
+            "marked": self.marked,
+            "renders": self.renders,
+            "renders_avoided": self.renders_avoided,
+            "flushes": self.flushes,
+        }
+
+    @callback
+    def async_schedule(self, info: "_TrackTemplateResultInfo") -> None:
+        """Schedule rendering the dirty templates of a tracker."""
+        self._pending[info] = None
+        if self._scheduled:
+            return
+        self._scheduled = True
+        delay = self._last_flush + self.min_interval - time.monotonic()
+        if delay > 0:
+            self.hass.loop.call_later(delay, self._async_start_flush)
+        else:
+            self._async_start_flush()
+
+    @callback
+    def async_cancel(self, info: "_TrackTemplateResultInfo") -> None:
+        """Forget the dirty templates of a tracker."""
+        self._pending.pop(info, None)
+
+    @callback
+    def _async_start_flush(self) -> None:
+        """Render the dirty templates in the next loop iteration."""
+        # A task so async_block_till_done waits for the renders
+        self.hass.async_create_task(self._async_flush())
+
+    async def _async_flush(self) -> None:
+        """Render the dirty templates, cheapest first."""
+        self._scheduled = False
+        self._last_flush = start = time.monotonic()
+        self.flushes += 1
+
+        pending = sorted(self._pending, key=lambda info: info.render_cost)
+        self._pending = {}
+
+        for idx, info in enumerate(pending):
+            # Always make progress, even if a single render is over budget
+            if idx and time.monotonic() - start > TEMPLATE_RENDER_FLUSH_BUDGET:
+                for deferred in pending[idx:]:
+                    self.async_schedule(deferred)
+                return
+            self.renders += info.async_render_dirty()
+
+
+@callback
+@bind_hass
+def async_get_template_render_scheduler(
+    hass: HomeAssistant,
+) -> TemplateRenderScheduler:
+    """Return the scheduler that coalesces template re-renders."""
+    scheduler: Optional[TemplateRenderScheduler] = hass.data.get(
+        TRACK_TEMPLATE_RENDER_SCHEDULER
+    )
+    if scheduler is None:
+        scheduler = hass.data[
+            TRACK_TEMPLATE_RENDER_SCHEDULER
+        ] = TemplateRenderScheduler(hass)
+    return scheduler
+
+
 class _TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -754,6 +1100,14 @@ class _TrackTemplateResultInfo:
         self._track_state_changes: Optional[_TrackStateChangeFiltered] = None
         self._time_listeners: Dict[Template, Callable] = {}
 
+        self._scheduler = async_get_template_render_scheduler(hass)
+        # id of the TrackTemplate -> (TrackTemplate waiting to be rendered,
+        # if any of the events that triggered it is exempt from rate limits)
+        self._dirty: Dict[int, Tuple[TrackTemplate, bool]] = {}
+        self._dirty_event: Optional[Event] = None
+        # Seconds the last render of the dirty templates took
+        self.render_cost = 0.0
+
     def async_setup(self, raise_on_template_error: bool) -> None:
         """Activation of template tracking."""
         for track_template_ in self._track_templates:
@@ -825,6 +1179,8 @@ class _TrackTemplateResultInfo:
         assert self._track_state_changes
         self._track_state_changes.async_remove()
         self._rate_limit.async_remove()
+        self._scheduler.async_cancel(self)
+        self._dirty.clear()
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
 
@@ -838,9 +1194,13 @@ class _TrackTemplateResultInfo:
         track_template_: TrackTemplate,
         now: datetime,
         event: Optional[Event],
+        rate_limit_exempt: Optional[bool] = None,
     ) -> Union[bool, TrackTemplateResult]:
         """Re-render the template if conditions match.
 
+        rate_limit_exempt is set when coalesced events triggered the
+        re-render and tells if any of them is exempt from rate limits.
+
         Returns False if the template was not be re-rendered
 
         Returns True if the template re-rendered and did not
@@ -854,14 +1214,20 @@ class _TrackTemplateResultInfo:
         if event:
             info = self._info[template]
 
-            if not _event_triggers_rerender(event, info):
-                return False
+            if rate_limit_exempt is None:
+                if not _event_triggers_rerender(event, info):
+                    return False
+                rate_limit = _rate_limit_for_event(event, info, track_template_)
+            elif rate_limit_exempt:
+                rate_limit = None
+            else:
+                rate_limit = _rate_limit_for_event(event, info, track_template_)
 
             had_timer = self._rate_limit.async_has_timer(template)
 
             if self._rate_limit.async_schedule_action(
                 template,
-                _rate_limit_for_event(event, info, track_template_),
+                rate_limit,
                 now,
                 self._refresh,
                 event,
@@ -915,13 +1281,85 @@ class _TrackTemplateResultInfo:
 
         replayed is True if the event is being replayed because the
         rate limit was hit.
+
+        Refreshes caused by an event are coalesced by the scheduler,
+        the templates the event triggers are rendered once later.
+        """
+        if event is not None and not replayed:
+            self._async_mark_dirty(event, track_templates or self._track_templates)
+            return
+        self._async_render(event, track_templates or self._track_templates, replayed)
+
+    @callback
+    def _async_mark_dirty(
+        self, event: Event, track_templates: Iterable[TrackTemplate]
+    ) -> None:
+        """Mark the templates an event triggers as dirty."""
+        scheduler = self._scheduler
+        marked = False
+        for track_template_ in track_templates:
+            info = self._info[track_template_.template]
+            if not _event_triggers_rerender(event, info):
+                continue
+            marked = True
+            scheduler.marked += 1
+            exempt = _rate_limit_for_event(event, info, track_template_) is None
+            dirty = self._dirty.get(id(track_template_))
+            if dirty is not None:
+                scheduler.renders_avoided += 1
+                exempt = exempt or dirty[1]
+            self._dirty[id(track_template_)] = (track_template_, exempt)
+
+        if marked:
+            self._dirty_event = event
+            scheduler.async_schedule(self)
+
+    @callback
+    def async_render_dirty(self) -> int:
+        """Render the dirty templates and return how many there were."""
+        if not self._dirty:
+            return 0
+        dirty = self._dirty
+        event = self._dirty_event
+        self._dirty = {}
+        self._dirty_event = None
+
+        start = time.perf_counter()
+        self._async_render(
+            event,
+            [track_template_ for track_template_, _ in dirty.values()],
+            False,
+            {key: exempt for key, (_, exempt) in dirty.items()},
+        )
+        self.render_cost = time.perf_counter() - start
+        return len(dirty)
+
+    @callback
+    def _async_render(
+        self,
+        event: Optional[Event],
+        track_templates: Iterable[TrackTemplate],
+        replayed: Optional[bool],
+        rate_limit_exempt: Optional[Dict[int, bool]] = None,
+    ) -> None:
+        """Render the templates and pass changed results to the action.
+
+        rate_limit_exempt is passed for coalesced templates, keyed by the
+        id of the TrackTemplate.
         """
         updates = []
         info_changed = False
         now = event.time_fired if not replayed and event else dt_util.utcnow()
 
-        for track_template_ in track_templates or self._track_templates:
-            update = self._render_template_if_ready(track_template_, now, event)
+        for track_template_ in track_templates:
+            update = self._render_template_if_ready(
+                track_template_,
+                now,
+                event,
+                None
+                if rate_limit_exempt is None
+                else rate_limit_exempt[id(track_template_)],
+            )
             if not update:
                 continue
 
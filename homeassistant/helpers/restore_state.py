@@ -26,11 +26,18 @@ DATA_RESTORE_STATE_TASK = "restore_state_task"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
+STORAGE_KEY_JOURNAL = "core.restore_state.journal"
 STORAGE_VERSION = 1
 
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# Periodic dumps only journal the states that changed. All states are dumped
+# again when more than this part of them is in the journal, or when the last
+# full dump is older than the compaction interval.
+JOURNAL_COMPACTION_RATIO = 0.5
+JOURNAL_COMPACTION_INTERVAL = timedelta(days=1)
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -85,6 +92,7 @@ class RestoreStateData:
                     for item in stored_states
                     if valid_entity_id(item["state"]["entity_id"])
                 }
+                await data.async_load_journal()
                 _LOGGER.debug("Created cache with %s", list(data.last_states))
 
             if hass.state == CoreState.running:
@@ -104,8 +112,46 @@ class RestoreStateData:
         self.store: Store = Store(
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
+        self.journal: Store = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY_JOURNAL, encoder=JSONEncoder
+        )
         self.last_states: Dict[str, StoredState] = {}
         self.entity_ids: Set[str] = set()
+        # The states as they were last saved, to find the ones that changed
+        self._saved_states: Dict[str, State] = {}
+        # Changes since the last full dump by entity ID
+        self._journal_states: Dict[str, Dict[str, Any]] = {}
+        self._journal_removed: Dict[str, datetime] = {}
+        self._last_full_dump: Optional[datetime] = None
+
+    async def async_load_journal(self) -> None:
+        """Apply the changes journaled after the last full dump."""
+        try:
+            journal = await self.journal.async_load()
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error loading journaled states", exc_info=exc)
+            return
+
+        if journal is None:
+            return
+
+        # The journal of a previous run can be older than the full dump, if
+        # clearing it failed. Only changes newer than the dumped state apply.
+        for item in journal["states"]:
+            if not valid_entity_id(item["state"]["entity_id"]):
+                continue
+            stored_state = StoredState.from_dict(item)
+            entity_id = stored_state.state.entity_id
+            last_state = self.last_states.get(entity_id)
+            if last_state is None or last_state.last_seen <= stored_state.last_seen:
+                self.last_states[entity_id] = stored_state
+
+        for entity_id, removed in journal["removed"].items():
+            last_state = self.last_states.get(entity_id)
+            if last_state is not None and last_state.last_seen <= cast(
+                datetime, dt_util.parse_datetime(removed)
+            ):
+                del self.last_states[entity_id]
 
     @callback
     def async_get_stored_states(self) -> List[StoredState]:
@@ -152,33 +198,96 @@ class RestoreStateData:
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        stored_states = self.async_get_stored_states()
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                [stored_state.as_dict() for stored_state in stored_states]
             )
+            await self.journal.async_save({"states": [], "removed": {}})
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+
+        self._saved_states = {
+            stored_state.state.entity_id: stored_state.state
+            for stored_state in stored_states
+        }
+        self._journal_states = {}
+        self._journal_removed = {}
+        self._last_full_dump = dt_util.utcnow()
+
+    async def async_dump_changed_states(self) -> None:
+        """Save the states that changed since the last dump to storage.
+
+        The changes are saved to a journal, all states are dumped again once
+        the journal has grown large.
+        """
+        now = dt_util.utcnow()
+        if (
+            self._last_full_dump is None
+            or now - self._last_full_dump >= JOURNAL_COMPACTION_INTERVAL
+        ):
+            await self.async_dump_states()
+            return
+
+        stored_states = self.async_get_stored_states()
+        saved_states = self._saved_states
+        current_states: Dict[str, State] = {}
+
+        for stored_state in stored_states:
+            state = stored_state.state
+            current_states[state.entity_id] = state
+            # States are replaced when they change
+            if saved_states.get(state.entity_id) is not state:
+                self._journal_states[state.entity_id] = stored_state.as_dict()
+                self._journal_removed.pop(state.entity_id, None)
+
+        for entity_id in saved_states.keys() - current_states.keys():
+            self._journal_states.pop(entity_id, None)
+            self._journal_removed[entity_id] = now
+
+        if (
+            len(self._journal_states) + len(self._journal_removed)
+            > len(current_states) * JOURNAL_COMPACTION_RATIO
+        ):
+            await self.async_dump_states()
+            return
+
+        _LOGGER.debug("Dumping %s changed states", len(self._journal_states))
+        try:
+            await self.journal.async_save(
+                {
+                    "states": list(self._journal_states.values()),
+                    "removed": self._journal_removed,
+                }
+            )
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error saving changed states", exc_info=exc)
+            return
+
+        self._saved_states = current_states
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
         """Set up the restore state listeners."""
 
-        async def _async_dump_states(*_: Any) -> None:
-            await self.async_dump_states()
+        async def _async_dump_changed_states(*_: Any) -> None:
+            await self.async_dump_changed_states()
 
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Home Assistant
         # has started and the old states have been read.
-        self.hass.async_create_task(_async_dump_states())
+        self.hass.async_create_task(self.async_dump_states())
 
-        # Dump states periodically
-        async_track_time_interval(self.hass, _async_dump_states, STATE_DUMP_INTERVAL)
+        # Dump changed states periodically
+        async_track_time_interval(
+            self.hass, _async_dump_changed_states, STATE_DUMP_INTERVAL
+        )
 
-        # Dump states when stopping hass
-        self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_dump_states)
+        # Dump changed states when stopping hass
+        self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, _async_dump_changed_states
+        )
 
     @callback
     def async_restore_entity_added(self, entity_id: str) -> None:
@@ -333,24 +333,28 @@ async def async_extract_referenced_entity_ids(
         for area_id in area_lookup:
             if area_id not in area_reg.areas:
                 selected.missing_areas.add(area_id)
-                continue
 
-        # Find entities tied to an area
-        for entity_entry in ent_reg.entities.values():
-            if entity_entry.area_id in area_lookup:
+            # Find entities tied to an area
+            for entity_entry in entity_registry.async_entries_for_area(
+                ent_reg, area_id
+            ):
                 selected.indirectly_referenced.add(entity_entry.entity_id)
 
-        # Find devices for this area
-        for device_entry in dev_reg.devices.values():
-            if device_entry.area_id in area_lookup:
+            # Find devices for this area
+            for device_entry in device_registry.async_entries_for_area(
+                dev_reg, area_id
+            ):
                 picked_devices.add(device_entry.id)
 
     if not picked_devices:
         return selected
 
-    for entity_entry in ent_reg.entities.values():
-        if not entity_entry.area_id and entity_entry.device_id in picked_devices:
-            selected.indirectly_referenced.add(entity_entry.entity_id)
+    for device_id in picked_devices:
+        for entity_entry in entity_registry.async_entries_for_device(
+            ent_reg, device_id, include_disabled_entities=True
+        ):
+            if not entity_entry.area_id:
+                selected.indirectly_referenced.add(entity_entry.entity_id)
 
     return selected
 
@@ -695,10 +699,7 @@ def verify_domain_control(hass: HomeAssistantType, domain: str) -> Callable:
 
             authorized = False
 
-            for entity in reg.entities.values():
-                if entity.platform != domain:
-                    continue
-
+            for entity in reg.async_entries_for("platform", domain):
                 if user.permissions.check_entity(entity.entity_id, POLICY_CONTROL):
                     authorized = True
                     break
@@ -3,7 +3,8 @@ import asyncio
 from json import JSONEncoder
 import logging
 import os
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
@@ -15,6 +16,7 @@ from homeassistant.util import json as json_util
 # mypy: no-check-untyped-defs
 
 STORAGE_DIR = ".storage"
+DATA_STORAGE_WRITER = "storage_writer"
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -219,19 +221,17 @@ class Store:
             self._data = None
 
             try:
-                await self.hass.async_add_executor_job(
-                    self._write_data, self.path, data
-                )
+                await async_get_storage_writer(self.hass).async_write(self, data)
             except (json_util.SerializationError, json_util.WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
-    def _write_data(self, path: str, data: Dict) -> None:
-        """Write the data."""
+    def _write_data(self, path: str, data: Dict) -> Optional[int]:
+        """Write the data and return the number of bytes written."""
         if not os.path.isdir(os.path.dirname(path)):
-            os.makedirs(os.path.dirname(path))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
 
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_util.save_json(path, data, self._private, encoder=self._encoder)
+        return json_util.save_json(path, data, self._private, encoder=self._encoder)
 
     async def _async_migrate_func(self, old_version, old_data):
         """Migrate to the new version."""
@@ -246,3 +246,153 @@ class Store:
             await self.hass.async_add_executor_job(os.unlink, self.path)
         except FileNotFoundError:
             pass
+
+
+class StoreWriteStats:
+    """Statistics of the writes of a single store."""
+
+    __slots__ = ("key", "writes", "errors", "total_time", "max_time", "last_size")
+
+    def __init__(self, key: str) -> None:
+        """Initialize the statistics."""
+        self.key = key
+        self.writes = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.last_size: Optional[int] = None
+
+    @callback
+    def async_record(
+        self, duration: float, size: Optional[int], failed: bool = False
+    ) -> None:
+        """Record a write, the size is None if it is not known."""
+        self.writes += 1
+        self.total_time += duration
+        if duration > self.max_time:
+            self.max_time = duration
+        if failed:
+            self.errors += 1
+        elif size is not None:
+            self.last_size = size
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a dictionary version of the statistics."""
+        return {
+            "key": self.key,
+            "writes": self.writes,
+            "errors": self.errors,
+            "average_time": (
+                round(self.total_time / self.writes, 6) if self.writes else None
+            ),
+            "max_time": round(self.max_time, 6),
+            "size": self.last_size,
+        }
+
+
+_PendingWrite = Tuple[Store, str, Dict, asyncio.Future]
+
+
+class StorageWriter:
+    """Write the data of all stores from a single executor job.
+
+    Writes requested while a batch is written are collected and written
+    together in the next batch, so stores that save at the same time only
+    take up one executor thread.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the writer."""
+        self.hass = hass
+        self.stats: Dict[str, StoreWriteStats] = {}
+        self._pending: List[_PendingWrite] = []
+        self._write_task: Optional[asyncio.Task] = None
+
+    async def async_write(self, store: Store, data: Dict) -> None:
+        """Write the data of a store.
+
+        Raises the error of the write if it failed.
+        """
+        future = self.hass.loop.create_future()
+        self._pending.append((store, store.path, data, future))
+        if self._write_task is None:
+            self._write_task = self.hass.async_create_task(self._async_write_pending())
+        await future
+
+    async def _async_write_pending(self) -> None:
+        """Write batches until no writes are pending."""
+        try:
+            while self._pending:
+                batch, self._pending = self._pending, []
+                try:
+                    results = await self.hass.async_add_executor_job(
+                        _write_batch, batch
+                    )
+                except asyncio.CancelledError:
+                    for _, _, _, future in batch + self._pending:
+                        future.cancel()
+                    raise
+                except Exception as err:  # pylint: disable=broad-except
+                    results = [(0.0, None, err)] * len(batch)
+
+                for (store, _, _, future), (duration, size, error) in zip(
+                    batch, results
+                ):
+                    self._async_record(store.key, duration, size, error)
+                    if future.done():
+                        continue
+                    if error is None:
+                        future.set_result(None)
+                    else:
+                        future.set_exception(error)
+        finally:
+            self._write_task = None
+
+    @callback
+    def _async_record(
+        self,
+        key: str,
+        duration: float,
+        size: Optional[int],
+        error: Optional[Exception],
+    ) -> None:
+        """Record a write of a store."""
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = StoreWriteStats(key)
+        stats.async_record(duration, size, error is not None)
+
+    def as_list(self) -> List[Dict[str, Any]]:
+        """Return the write statistics of all stores, slowest first."""
+        return [
+            stats.as_dict()
+            for stats in sorted(
+                self.stats.values(), key=lambda stats: stats.total_time, reverse=True
+            )
+        ]
+
+
+def _write_batch(
+    batch: List[_PendingWrite],
+) -> List[Tuple[float, Optional[int], Optional[Exception]]]:
+    """Write a batch of store data and return the duration, size and error."""
+    results: List[Tuple[float, Optional[int], Optional[Exception]]] = []
+    for store, path, data, _ in batch:
+        start = perf_counter()
+        try:
+            # pylint: disable=protected-access
+            size = store._write_data(path, data)
+        except Exception as err:  # pylint: disable=broad-except
+            results.append((perf_counter() - start, None, err))
+        else:
+            results.append((perf_counter() - start, size, None))
+    return results
+
+
+@callback
+def async_get_storage_writer(hass: HomeAssistant) -> StorageWriter:
+    """Return the writer of the stores."""
+    writer: Optional[StorageWriter] = hass.data.get(DATA_STORAGE_WRITER)
+    if writer is None:
+        writer = hass.data[DATA_STORAGE_WRITER] = StorageWriter(hass)
+    return writer
@@ -2,21 +2,36 @@
 from ast import literal_eval
 import asyncio
 import base64
+from collections import OrderedDict
 import collections.abc
 from datetime import datetime, timedelta
-from functools import partial, wraps
+from functools import lru_cache, partial, wraps
 import json
 import logging
 import math
-from operator import attrgetter
 import random
 import re
-from typing import Any, Dict, Generator, Iterable, Optional, Type, Union, cast
+from threading import Lock
+from time import perf_counter
+from types import CodeType
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Generator,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 import jinja2
-from jinja2 import contextfilter, contextfunction
+from jinja2 import contextfilter, contextfunction, nodes
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace  # type: ignore
 import voluptuous as vol
@@ -46,6 +61,8 @@ DATE_STR_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 _RENDER_INFO = "template.render_info"
 _ENVIRONMENT = "template.environment"
+_RENDER_PROFILE = "template.render_profile"
+_TEMPLATE_STATES = "template.states"
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
@@ -69,6 +86,36 @@ _COLLECTABLE_STATE_ATTRIBUTES = {
 ALL_STATES_RATE_LIMIT = timedelta(minutes=1)
 DOMAIN_STATES_RATE_LIMIT = timedelta(seconds=1)
 
+# Number of compiled templates kept in memory for all environments
+COMPILED_TEMPLATE_CACHE_SIZE = 1024
+
+# What the output of a template can depend on besides its source
+TEMPLATE_DEPENDS_STATES = "states"
+TEMPLATE_DEPENDS_TIME = "time"
+TEMPLATE_DEPENDS_VARIABLES = "variables"
+TEMPLATE_DEPENDS_RANDOM = "random"
+
+_STATE_NAMES = {
+    "states",
+    "is_state",
+    "is_state_attr",
+    "state_attr",
+    "expand",
+    "closest",
+    "distance",
+}
+_TIME_NAMES = {"now", "utcnow", "relative_time"}
+_RANDOM_NAMES = {"lipsum"}
+_STATE_FILTERS = {"expand", "closest"}
+_RANDOM_FILTERS = {"random"}
+# Names Jinja defines inside loops, macros and call blocks
+_DECLARED_NAMES = {"loop", "caller", "varargs", "kwargs", "self"}
+
+# Renders that can never be parsed by literal_eval
+_LITERAL_NAMES = {"True", "False", "None"}
+# Parsed results that are safe to return more than once
+_IMMUTABLE_RESULT_TYPES = {int, float, bool, str, type(None)}
+
 
 @bind_hass
 def attach(hass: HomeAssistantType, obj: Any) -> None:
@@ -269,6 +316,118 @@ class RenderInfo:
             self.filter = _false
 
 
+class TemplateRenderStats:
+    """Render statistics of a single template."""
+
+    __slots__ = (
+        "owner",
+        "template",
+        "renders",
+        "errors",
+        "total_time",
+        "max_time",
+        "total_size",
+        "max_size",
+    )
+
+    def __init__(self, owner: Optional[str], template: str) -> None:
+        """Initialize the statistics."""
+        self.owner = owner
+        self.template = template
+        self.renders = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.total_size = 0
+        self.max_size = 0
+
+    @callback
+    def async_record(self, duration: float, size: Optional[int]) -> None:
+        """Record a render, the size is None if rendering failed."""
+        self.renders += 1
+        self.total_time += duration
+        if duration > self.max_time:
+            self.max_time = duration
+        if size is None:
+            self.errors += 1
+            return
+        self.total_size += size
+        if size > self.max_size:
+            self.max_size = size
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a dictionary version of the statistics."""
+        return {
+            "owner": self.owner,
+            "template": self.template,
+            "renders": self.renders,
+            "errors": self.errors,
+            "total_time": round(self.total_time, 6),
+            "average_time": round(self.total_time / self.renders, 6),
+            "max_time": round(self.max_time, 6),
+            "average_size": self.total_size // (self.renders - self.errors or 1),
+            "max_size": self.max_size,
+        }
+
+
+class TemplateRenderProfile:
+    """Render statistics of all templates, keyed by owner and template."""
+
+    def __init__(self) -> None:
+        """Initialize the profile."""
+        self.templates: Dict[Tuple[Optional[str], str], TemplateRenderStats] = {}
+
+    @callback
+    def async_record(
+        self, template: "Template", duration: float, size: Optional[int]
+    ) -> None:
+        """Record a render of a template."""
+        key = (template.owner, template.template)
+        stats = self.templates.get(key)
+        if stats is None:
+            stats = self.templates[key] = TemplateRenderStats(*key)
+        stats.async_record(duration, size)
+
+    def as_list(self) -> List[Dict[str, Any]]:
+        """Return the statistics of all templates, most expensive first."""
+        return [
+            stats.as_dict()
+            for stats in sorted(
+                self.templates.values(),
+                key=lambda stats: stats.total_time,
+                reverse=True,
+            )
+        ]
+
+
+@callback
+@bind_hass
+def async_enable_render_profiling(hass: HomeAssistantType) -> TemplateRenderProfile:
+    """Start collecting template render statistics."""
+    profile: Optional[TemplateRenderProfile] = hass.data.get(_RENDER_PROFILE)
+    if profile is None:
+        profile = hass.data[_RENDER_PROFILE] = TemplateRenderProfile()
+    return profile
+
+
+@callback
+@bind_hass
+def async_disable_render_profiling(
+    hass: HomeAssistantType,
+) -> Optional[TemplateRenderProfile]:
+    """Stop collecting template render statistics and return them."""
+    return cast(Optional[TemplateRenderProfile], hass.data.pop(_RENDER_PROFILE, None))
+
+
+@callback
+@bind_hass
+def async_get_render_profile(
+    hass: HomeAssistantType,
+) -> Optional[TemplateRenderProfile]:
+    """Return the template render statistics if they are collected."""
+    return cast(Optional[TemplateRenderProfile], hass.data.get(_RENDER_PROFILE))
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -277,8 +436,12 @@ class Template:
         "template",
         "hass",
         "is_static",
+        "owner",
         "_compiled_code",
         "_compiled",
+        "_dependencies",
+        "_constant_result",
+        "_parse_cache",
     )
 
     def __init__(self, template, hass=None):
@@ -289,8 +452,13 @@ class Template:
         self.template: str = template.strip()
         self._compiled_code = None
         self._compiled: Optional[Template] = None
+        self._dependencies: Optional[FrozenSet[str]] = None
+        self._constant_result: Optional[str] = None
+        self._parse_cache: Optional[Tuple[str, Any]] = None
         self.hass = hass
         self.is_static = not is_template_string(template)
+        # Entity or automation the template belongs to, used for profiling
+        self.owner: Optional[str] = None
 
     @property
     def _env(self) -> "TemplateEnvironment":
@@ -311,6 +479,23 @@ class Template:
         except jinja2.TemplateError as err:
             raise TemplateError(err) from err
 
+        try:
+            self._dependencies = template_dependencies(self.template)
+        except jinja2.TemplateError as err:
+            raise TemplateError(err) from err
+
+    @property
+    def dependencies(self) -> FrozenSet[str]:
+        """Return what the output of the template depends on.
+
+        A template without dependencies always renders the same output.
+        """
+        if self.is_static:
+            return frozenset()
+        if self._dependencies is None:
+            self.ensure_valid()
+        return cast(FrozenSet[str], self._dependencies)
+
     def render(
         self,
         variables: TemplateVarsType = None,
@@ -346,23 +531,56 @@ class Template:
 
         compiled = self._compiled or self._ensure_compiled()
 
-        if variables is not None:
-            kwargs.update(variables)
+        if self._constant_result is not None:
+            render_result = self._constant_result
+        else:
+            if variables is not None:
+                kwargs.update(variables)
 
-        try:
-            render_result = compiled.render(kwargs)
-        except Exception as err:  # pylint: disable=broad-except
-            raise TemplateError(err) from err
+            profile: Optional[TemplateRenderProfile] = self.hass.data.get(
+                _RENDER_PROFILE
+            )
+            start = perf_counter()
 
-        render_result = render_result.strip()
+            try:
+                render_result = compiled.render(kwargs)
+            except Exception as err:  # pylint: disable=broad-except
+                if profile is not None:
+                    profile.async_record(self, perf_counter() - start, None)
+                raise TemplateError(err) from err
+
+            render_result = render_result.strip()
+
+            if profile is not None:
+                profile.async_record(self, perf_counter() - start, len(render_result))
+
+            if not self._dependencies:
+                # The output can't change, skip rendering from now on
+                self._constant_result = render_result
 
         if self.hass.config.legacy_templates or not parse_result:
             return render_result
 
         return self._parse_result(render_result)
 
-    def _parse_result(self, render_result: str) -> Any:  # pylint: disable=no-self-use
+    def _parse_result(self, render_result: str) -> Any:
         """Parse the result."""
+        # Words like states can't be literals, skip literal_eval
+        if render_result.isidentifier() and render_result not in _LITERAL_NAMES:
+            return render_result
+
+        parse_cache = self._parse_cache
+        if parse_cache is not None and parse_cache[0] == render_result:
+            return parse_cache[1]
+
+        result = self._literal_eval_result(render_result)
+        if type(result) in _IMMUTABLE_RESULT_TYPES:
+            self._parse_cache = (render_result, result)
+        return result
+
+    @staticmethod
+    def _literal_eval_result(render_result: str) -> Any:
+        """Parse the result with literal_eval."""
         try:
             result = literal_eval(render_result)
 
@@ -507,9 +725,14 @@ class Template:
         except (ValueError, TypeError):
             pass
 
+        profile: Optional[TemplateRenderProfile] = self.hass.data.get(_RENDER_PROFILE)
+        start = perf_counter()
+
         try:
-            return self._compiled.render(variables).strip()
+            render_result = self._compiled.render(variables).strip()
         except jinja2.TemplateError as ex:
+            if profile is not None:
+                profile.async_record(self, perf_counter() - start, None)
             if error_value is _SENTINEL:
                 _LOGGER.error(
                     "Error parsing value: %s (value: %s, template: %s)",
@@ -519,6 +742,10 @@ class Template:
                 )
             return value if error_value is _SENTINEL else error_value
 
+        if profile is not None:
+            profile.async_record(self, perf_counter() - start, len(render_result))
+        return render_result
+
     def _ensure_compiled(self) -> "Template":
         """Bind a template to a specific hass instance."""
         self.ensure_valid()
@@ -759,10 +986,49 @@ def _collect_state(hass: HomeAssistantType, entity_id: str) -> None:
         entity_collect.entities.add(entity_id)
 
 
+def _template_states(
+    hass: HomeAssistantType, collect: bool
+) -> Dict[str, TemplateState]:
+    """Return the cached template wrappers of states."""
+    caches: Optional[Tuple[Dict[str, TemplateState], ...]] = hass.data.get(
+        _TEMPLATE_STATES
+    )
+    if caches is None:
+        caches = hass.data[_TEMPLATE_STATES] = ({}, {})
+    return caches[collect]
+
+
+def _template_state(
+    hass: HomeAssistantType,
+    cache: Dict[str, TemplateState],
+    state: State,
+    collect: bool,
+) -> TemplateState:
+    """Return the template wrapper of a state.
+
+    Wrappers are reused until the state object is replaced.
+    """
+    template_state = cache.get(state.entity_id)
+    # pylint: disable=protected-access
+    if template_state is not None and template_state._state is state:
+        return template_state
+
+    if len(cache) > 2 * hass.states.async_entity_ids_count():
+        # Drop the wrappers of removed entities
+        for entity_id in [
+            entity_id for entity_id in cache if hass.states.get(entity_id) is None
+        ]:
+            del cache[entity_id]
+
+    template_state = cache[state.entity_id] = TemplateState(hass, state, collect)
+    return template_state
+
+
 def _state_generator(hass: HomeAssistantType, domain: Optional[str]) -> Generator:
     """State generator for a domain or all states."""
-    for state in sorted(hass.states.async_all(domain), key=attrgetter("entity_id")):
-        yield TemplateState(hass, state, collect=False)
+    cache = _template_states(hass, False)
+    for state in hass.states.async_all_sorted(domain):
+        yield _template_state(hass, cache, state, False)
 
 
 def _get_state_if_valid(
@@ -786,7 +1052,7 @@ def _get_template_state_from_state(
         # access to the state properties in the state wrapper.
         _collect_state(hass, entity_id)
         return None
-    return TemplateState(hass, state)
+    return _template_state(hass, _template_states(hass, True), state, True)
 
 
 def _resolve_state(
@@ -1299,7 +1565,6 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__()
         self.hass = hass
-        self.template_cache = weakref.WeakValueDictionary()
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -1406,12 +1671,117 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             # any instance of this.
             return super().compile(source, name, filename, raw, defer_init)
 
-        cached = self.template_cache.get(source)
+        # The code does not depend on the hass instance, only on
+        # whether the hass functions are available.
+        key = (self.hass is not None, source)
+        cached = _COMPILED_TEMPLATE_CACHE.get(key)
 
         if cached is None:
-            cached = self.template_cache[source] = super().compile(source)
+            cached = super().compile(source)
+            _COMPILED_TEMPLATE_CACHE.set(key, cached)
 
         return cached
 
 
+class CompiledTemplateCache:
+    """Least recently used cache of compiled template code.
+
+    Templates with the same source, like the templates of entities
+    created from the same blueprint or reloaded from config, share the
+    compiled code instead of compiling it again.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the cache."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[Hashable, CodeType]" = OrderedDict()
+        # Templates can be compiled in the executor
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[CodeType]:
+        """Return the compiled code for a key."""
+        with self._lock:
+            code = self._cache.get(key)
+            if code is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return code
+
+    def set(self, key: Hashable, code: CodeType) -> None:
+        """Store the compiled code for a key."""
+        with self._lock:
+            self._cache[key] = code
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all compiled code and reset the counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """Return the statistics of the cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._cache),
+            "maxsize": self.maxsize,
+        }
+
+
+@lru_cache(maxsize=COMPILED_TEMPLATE_CACHE_SIZE)
+def template_dependencies(source: str) -> FrozenSet[str]:
+    """Return what the output of a template source depends on.
+
+    The syntax tree is walked without generating code, so filters that
+    only exist in environments with hass are accepted. The names it loads
+    are classified as state, time, random or variable lookups. Names that
+    are assigned in the template or are globals of the environment do not
+    count.
+    """
+    ast = _NO_HASS_ENV.parse(source)
+    dependencies = set()
+
+    declared = set(_DECLARED_NAMES)
+    loaded = set()
+    for node in ast.find_all((nodes.Name, nodes.Macro)):
+        if isinstance(node, nodes.Macro):
+            declared.add(node.name)
+        elif node.ctx == "load":
+            loaded.add(node.name)
+        else:
+            declared.add(node.name)
+
+    for name in loaded - declared:
+        if name in _STATE_NAMES:
+            dependencies.add(TEMPLATE_DEPENDS_STATES)
+        elif name in _TIME_NAMES:
+            dependencies.add(TEMPLATE_DEPENDS_TIME)
+        elif name in _RANDOM_NAMES:
+            dependencies.add(TEMPLATE_DEPENDS_RANDOM)
+        elif name not in _NO_HASS_ENV.globals:
+            dependencies.add(TEMPLATE_DEPENDS_VARIABLES)
+
+    for node in ast.find_all(nodes.Filter):
+        if node.name in _STATE_FILTERS:
+            dependencies.add(TEMPLATE_DEPENDS_STATES)
+        elif node.name in _RANDOM_FILTERS:
+            dependencies.add(TEMPLATE_DEPENDS_RANDOM)
+
+    return frozenset(dependencies)
+
+
+def compiled_template_cache_info() -> Dict[str, int]:
+    """Return the statistics of the compiled template cache."""
+    return _COMPILED_TEMPLATE_CACHE.info()
+
+
+_COMPILED_TEMPLATE_CACHE = CompiledTemplateCache(COMPILED_TEMPLATE_CACHE_SIZE)
 _NO_HASS_ENV = TemplateEnvironment(None)  # type: ignore[no-untyped-call]
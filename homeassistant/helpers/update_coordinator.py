@@ -3,8 +3,9 @@ import asyncio
 from datetime import datetime, timedelta
 import logging
 from time import monotonic
-from typing import Awaitable, Callable, Generic, List, Optional, TypeVar
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, TypeVar
 import urllib.error
+from weakref import WeakSet
 
 import aiohttp
 import requests
@@ -18,6 +19,11 @@ from .debounce import Debouncer
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
 
+DATA_UPDATE_COORDINATORS = "update_coordinators"
+
+# Number of coordinators of a group that may fetch data at the same time
+DEFAULT_GROUP_PARALLEL_UPDATES = 1
+
 T = TypeVar("T")
 
 
@@ -25,8 +31,111 @@ class UpdateFailed(Exception):
     """Raised when an update has failed."""
 
 
+class CoordinatorStats:
+    """Statistics of the refreshes of a single coordinator."""
+
+    __slots__ = (
+        "name",
+        "group",
+        "interval",
+        "refreshes",
+        "failures",
+        "unchanged",
+        "total_time",
+        "max_time",
+    )
+
+    def __init__(self, name: str, group: Optional[str]) -> None:
+        """Initialize the statistics."""
+        self.name = name
+        self.group = group
+        # The interval the next refresh is scheduled with, including backoff
+        self.interval: Optional[timedelta] = None
+        self.refreshes = 0
+        self.failures = 0
+        self.unchanged = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    @callback
+    def async_record(
+        self, duration: float, failed: bool = False, unchanged: bool = False
+    ) -> None:
+        """Record a refresh."""
+        self.refreshes += 1
+        self.total_time += duration
+        if duration > self.max_time:
+            self.max_time = duration
+        if failed:
+            self.failures += 1
+        elif unchanged:
+            self.unchanged += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a dictionary version of the statistics."""
+        return {
+            "name": self.name,
+            "group": self.group,
+            "interval": self.interval.total_seconds() if self.interval else None,
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "unchanged": self.unchanged,
+            "average_time": (
+                round(self.total_time / self.refreshes, 6) if self.refreshes else None
+            ),
+            "max_time": round(self.max_time, 6),
+        }
+
+
+class UpdateCoordinators:
+    """Track the coordinators and the groups limiting their parallel updates."""
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self.coordinators: "WeakSet[DataUpdateCoordinator]" = WeakSet()
+        self.groups: Dict[str, asyncio.Semaphore] = {}
+
+    @callback
+    def async_get_group(self, group: str, parallel_updates: int) -> asyncio.Semaphore:
+        """Return the semaphore of a group.
+
+        The limit of a group is set by the first coordinator joining it.
+        """
+        semaphore = self.groups.get(group)
+        if semaphore is None:
+            semaphore = self.groups[group] = asyncio.Semaphore(parallel_updates)
+        return semaphore
+
+    def as_list(self) -> List[Dict[str, Any]]:
+        """Return the statistics of all coordinators, busiest first."""
+        return [
+            stats.as_dict()
+            for stats in sorted(
+                (coordinator.stats for coordinator in list(self.coordinators)),
+                key=lambda stats: stats.total_time,
+                reverse=True,
+            )
+        ]
+
+
+@callback
+def async_get_update_coordinators(hass: HomeAssistant) -> UpdateCoordinators:
+    """Return the tracker of the update coordinators."""
+    coordinators: Optional[UpdateCoordinators] = hass.data.get(DATA_UPDATE_COORDINATORS)
+    if coordinators is None:
+        coordinators = hass.data[DATA_UPDATE_COORDINATORS] = UpdateCoordinators()
+    return coordinators
+
+
 class DataUpdateCoordinator(Generic[T]):
-    """Class to manage fetching data from single endpoint."""
+    """Class to manage fetching data from single endpoint.
+
+    Coordinators talking to the same host can share a group, which limits
+    how many of them fetch data at the same time. When a maximum update
+    interval is set, the interval is doubled after every refresh that
+    failed or returned unchanged data, up to that maximum, and reset once
+    the data changes.
+    """
 
     def __init__(
         self,
@@ -37,16 +146,35 @@ class DataUpdateCoordinator(Generic[T]):
         update_interval: Optional[timedelta] = None,
         update_method: Optional[Callable[[], Awaitable[T]]] = None,
         request_refresh_debouncer: Optional[Debouncer] = None,
+        group: Optional[str] = None,
+        group_parallel_updates: int = DEFAULT_GROUP_PARALLEL_UPDATES,
+        max_update_interval: Optional[timedelta] = None,
+        always_update: bool = True,
     ):
-        """Initialize global data updater."""
+        """Initialize global data updater.
+
+        If always_update is False, listeners are not called after a refresh
+        that returned data equal to the previous data.
+        """
         self.hass = hass
         self.logger = logger
         self.name = name
         self.update_method = update_method
         self.update_interval = update_interval
+        self.max_update_interval = max_update_interval
+        self.always_update = always_update
 
         self.data: Optional[T] = None
 
+        coordinators = async_get_update_coordinators(hass)
+        coordinators.coordinators.add(self)
+        self._group: Optional[asyncio.Semaphore] = None
+        if group is not None:
+            self._group = coordinators.async_get_group(group, group_parallel_updates)
+        self.stats = CoordinatorStats(name, group)
+        # Number of times the update interval has been doubled
+        self._backoff = 0
+
         self._listeners: List[CALLBACK_TYPE] = []
         self._job = HassJob(self._handle_refresh_interval)
         self._unsub_refresh: Optional[CALLBACK_TYPE] = None
@@ -93,10 +221,19 @@ class DataUpdateCoordinator(Generic[T]):
             self._unsub_refresh()
             self._unsub_refresh = None
 
+    @property
+    def current_update_interval(self) -> Optional[timedelta]:
+        """Return the update interval including any backoff."""
+        if self.update_interval is None or not self._backoff:
+            return self.update_interval
+        assert self.max_update_interval is not None
+        return min(self.update_interval * 2 ** self._backoff, self.max_update_interval)
+
     @callback
     def _schedule_refresh(self) -> None:
         """Schedule a refresh."""
-        if self.update_interval is None:
+        interval = self.stats.interval = self.current_update_interval
+        if interval is None:
             return
 
         if self._unsub_refresh:
@@ -110,7 +247,7 @@ class DataUpdateCoordinator(Generic[T]):
         self._unsub_refresh = event.async_track_point_in_utc_time(
             self.hass,
             self._job,
-            utcnow().replace(microsecond=0) + self.update_interval,
+            utcnow().replace(microsecond=0) + interval,
         )
 
     async def _handle_refresh_interval(self, _now: datetime) -> None:
@@ -131,6 +268,25 @@ class DataUpdateCoordinator(Generic[T]):
             raise NotImplementedError("Update method not implemented")
         return await self.update_method()
 
+    async def _async_fetch_data(self) -> Optional[T]:
+        """Fetch the latest data, waiting for a free slot in the group."""
+        if self._group is None:
+            return await self._async_update_data()
+        async with self._group:
+            return await self._async_update_data()
+
+    @callback
+    def _async_backoff(self, changed: bool) -> None:
+        """Adjust the backoff of the update interval after a refresh."""
+        if changed:
+            self._backoff = 0
+        elif (
+            self.max_update_interval is not None
+            and self.update_interval is not None
+            and self.update_interval * 2 ** self._backoff < self.max_update_interval
+        ):
+            self._backoff += 1
+
     async def async_refresh(self) -> None:
         """Refresh data."""
         if self._unsub_refresh:
@@ -138,10 +294,13 @@ class DataUpdateCoordinator(Generic[T]):
             self._unsub_refresh = None
 
         self._debounced_refresh.async_cancel()
+        previous_success = self.last_update_success
+        previous_data = self.data
+        unchanged = False
         start = monotonic()
 
         try:
-            self.data = await self._async_update_data()
+            data = await self._async_fetch_data()
 
         except (asyncio.TimeoutError, requests.exceptions.Timeout):
             if self.last_update_success:
@@ -176,19 +335,29 @@ class DataUpdateCoordinator(Generic[T]):
             )
 
         else:
+            # Comparing the data is only worth it when something acts on it
+            if previous_success and (
+                not self.always_update or self.max_update_interval is not None
+            ):
+                unchanged = data == previous_data
+            self.data = data
             if not self.last_update_success:
                 self.last_update_success = True
                 self.logger.info("Fetching %s data recovered", self.name)
 
         finally:
+            duration = monotonic() - start
             self.logger.debug(
-                "Finished fetching %s data in %.3f seconds",
-                self.name,
-                monotonic() - start,
+                "Finished fetching %s data in %.3f seconds", self.name, duration
             )
+            self.stats.async_record(duration, not self.last_update_success, unchanged)
+            self._async_backoff(self.last_update_success and not unchanged)
             if self._listeners:
                 self._schedule_refresh()
 
+        if unchanged and not self.always_update:
+            return
+
         for update_callback in self._listeners:
             update_callback()
 
@@ -203,6 +372,7 @@ class DataUpdateCoordinator(Generic[T]):
 
         self.data = data
         self.last_update_success = True
+        self._backoff = 0
         self.logger.debug(
             "Manually updated %s data",
             self.name,
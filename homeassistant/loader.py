@@ -11,20 +11,24 @@ import json
 import logging
 import pathlib
 import sys
+from time import perf_counter
 from types import ModuleType
 from typing import (
     TYPE_CHECKING,
     Any,
+    Awaitable,
     Callable,
     Dict,
     List,
     Optional,
     Set,
+    Tuple,
     TypeVar,
     Union,
     cast,
 )
 
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
 from homeassistant.generated.dhcp import DHCP
 from homeassistant.generated.mqtt import MQTT
 from homeassistant.generated.ssdp import SSDP
@@ -41,6 +45,8 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_INDEX = "manifest_index"
+DATA_RESOLVE_TIMES = "integration_resolve_times"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -53,6 +59,15 @@ _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular depe
 
 MAX_LOAD_CONCURRENTLY = 4
 
+# Manifests of the built-in integrations, generated by hassfest
+MANIFEST_INDEX_PATH = pathlib.Path(__file__).parent / "generated" / "manifests.json"
+MANIFEST_INDEX_VERSION = 1
+
+# Manifests of the custom integrations, keyed by the manifest file
+STORAGE_KEY_MANIFEST_CACHE = "core.custom_manifests"
+STORAGE_VERSION_MANIFEST_CACHE = 1
+MANIFEST_CACHE_SAVE_DELAY = 10
+
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Dict:
     """Generate a manifest from a legacy module."""
@@ -66,6 +81,94 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Dict:
     }
 
 
+def _read_manifest(manifest_path: pathlib.Path) -> Optional[Dict[str, Any]]:
+    """Read a manifest file, return None if it is not valid JSON."""
+    try:
+        return cast(Dict[str, Any], json.loads(manifest_path.read_text()))
+    except ValueError as err:
+        _LOGGER.error("Error parsing manifest.json file at %s: %s", manifest_path, err)
+        return None
+
+
+def _load_manifest_index() -> Dict[str, Dict[str, Any]]:
+    """Load the index of the built-in manifests.
+
+    Returns an empty index if it is missing or of another version, the
+    manifests are then read from disk.
+    """
+    try:
+        index = json.loads(MANIFEST_INDEX_PATH.read_text())
+    except (OSError, ValueError) as err:
+        _LOGGER.debug("Not using the manifest index: %s", err)
+        return {}
+
+    if index.get("version") != MANIFEST_INDEX_VERSION:
+        _LOGGER.debug("Not using manifest index version %s", index.get("version"))
+        return {}
+
+    return cast(Dict[str, Dict[str, Any]], index["manifests"])
+
+
+async def _async_get_manifest_index(
+    hass: "HomeAssistant",
+) -> Dict[str, Dict[str, Any]]:
+    """Return the index of the built-in manifests."""
+    index: Optional[Awaitable[Dict[str, Dict[str, Any]]]] = hass.data.get(
+        DATA_MANIFEST_INDEX
+    )
+    if index is None:
+        index = hass.data[DATA_MANIFEST_INDEX] = hass.async_add_executor_job(
+            _load_manifest_index
+        )
+    return await index
+
+
+def _resolve_custom_components(
+    hass: "HomeAssistant", root_module: ModuleType, cache: Dict[str, Dict[str, Any]]
+) -> Tuple[Dict[str, "Integration"], Dict[str, Dict[str, Any]]]:
+    """Resolve the custom integrations.
+
+    A cached manifest is used as long as the modification time and size of
+    its file are unchanged. Returns the integrations and the updated cache.
+    """
+    integrations: Dict[str, Integration] = {}
+    new_cache: Dict[str, Dict[str, Any]] = {}
+
+    for path in root_module.__path__:  # type: ignore
+        for entry in pathlib.Path(path).iterdir():
+            manifest_path = entry / "manifest.json"
+            try:
+                stat = manifest_path.stat()
+            except OSError:
+                continue
+
+            key = str(manifest_path)
+            cached = cache.get(key)
+            if (
+                cached is not None
+                and cached["mtime"] == stat.st_mtime_ns
+                and cached["size"] == stat.st_size
+            ):
+                manifest = cached["manifest"]
+            else:
+                manifest = _read_manifest(manifest_path)
+                if manifest is None:
+                    continue
+
+            new_cache[key] = {
+                "mtime": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "manifest": manifest,
+            }
+            integration = Integration(
+                hass, f"{root_module.__name__}.{entry.name}", entry, dict(manifest)
+            )
+            # The first path containing a domain wins, as with imports
+            integrations.setdefault(integration.domain, integration)
+
+    return integrations, new_cache
+
+
 async def _async_get_custom_components(
     hass: "HomeAssistant",
 ) -> Dict[str, "Integration"]:
@@ -78,33 +181,33 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: List[str]) -> List[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
-        return [
-            entry
-            for path in paths
-            for entry in pathlib.Path(path).iterdir()
-            if entry.is_dir()
-        ]
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.core import callback
+    from homeassistant.helpers.storage import Store
 
-    dirs = await hass.async_add_executor_job(
-        get_sub_directories, custom_components.__path__
-    )
+    store = Store(hass, STORAGE_VERSION_MANIFEST_CACHE, STORAGE_KEY_MANIFEST_CACHE)
+    cache = cast(Optional[Dict[str, Dict[str, Any]]], await store.async_load()) or {}
 
-    integrations = await asyncio.gather(
-        *(
-            hass.async_add_executor_job(
-                Integration.resolve_from_root, hass, custom_components, comp.name
-            )
-            for comp in dirs
-        )
+    integrations, new_cache = await hass.async_add_executor_job(
+        _resolve_custom_components, hass, custom_components, cache
     )
 
-    return {
-        integration.domain: integration
-        for integration in integrations
-        if integration is not None
-    }
+    if new_cache == cache:
+        return integrations
+
+    @callback
+    def save_cache(*_: Any) -> None:
+        """Save the manifests of the custom integrations."""
+        store.async_delay_save(lambda: new_cache, MANIFEST_CACHE_SAVE_DELAY)
+
+    # Saving waits for startup to finish, so it doesn't compete with it
+    # for disk access and checking the configuration doesn't write it.
+    if hass.is_running:
+        save_cache()
+    else:
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, save_cache)
+
+    return integrations
 
 
 async def async_get_custom_components(
@@ -249,12 +352,8 @@ class Integration:
             if not manifest_path.is_file():
                 continue
 
-            try:
-                manifest = json.loads(manifest_path.read_text())
-            except ValueError as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
+            manifest = _read_manifest(manifest_path)
+            if manifest is None:
                 continue
 
             return cls(
@@ -478,39 +577,58 @@ async def async_get_integration(hass: "HomeAssistant", domain: str) -> Integrati
 
     event = cache[domain] = asyncio.Event()
 
+    start = perf_counter()
+    integration = await _async_resolve_integration(hass, domain)
+    hass.data.setdefault(DATA_RESOLVE_TIMES, {})[domain] = perf_counter() - start
+
+    if integration is not None:
+        cache[domain] = integration
+    else:
+        # Remove event from cache.
+        cache.pop(domain)
+
+    event.set()
+
+    if not integration:
+        raise IntegrationNotFound(domain)
+
+    return integration
+
+
+async def _async_resolve_integration(
+    hass: "HomeAssistant", domain: str
+) -> Optional[Integration]:
+    """Find an integration, return None if it does not exist."""
     # Instead of using resolve_from_root we use the cache of custom
     # components to find the integration.
     integration = (await async_get_custom_components(hass)).get(domain)
     if integration is not None:
         _LOGGER.warning(CUSTOM_WARNING, domain)
-        cache[domain] = integration
-        event.set()
         return integration
 
     from homeassistant import components  # pylint: disable=import-outside-toplevel
 
+    manifest = (await _async_get_manifest_index(hass)).get(domain)
+    if manifest is not None:
+        return Integration(
+            hass,
+            f"{components.__name__}.{domain}",
+            pathlib.Path(components.__path__[0]) / domain,  # type: ignore
+            dict(manifest),
+        )
+
     integration = await hass.async_add_executor_job(
         Integration.resolve_from_root, hass, components, domain
     )
-
     if integration is not None:
-        cache[domain] = integration
-        event.set()
         return integration
 
-    integration = Integration.resolve_legacy(hass, domain)
-    if integration is not None:
-        cache[domain] = integration
-    else:
-        # Remove event from cache.
-        cache.pop(domain)
-
-    event.set()
+    return Integration.resolve_legacy(hass, domain)
 
-    if not integration:
-        raise IntegrationNotFound(domain)
 
-    return integration
+def async_get_resolve_times(hass: "HomeAssistant") -> Dict[str, float]:
+    """Return how long resolving each integration took, in seconds."""
+    return cast(Dict[str, float], hass.data.get(DATA_RESOLVE_TIMES, {}))
 
 
 class LoaderError(Exception):
@@ -3,17 +3,21 @@ import argparse
 import asyncio
 import collections
 from contextlib import suppress
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
 import logging
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 from typing import Callable, Dict, TypeVar
 
 from homeassistant import core
 from homeassistant.components.websocket_api.const import JSON_DUMP
 from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_bytes
+from homeassistant.helpers.template import Template
 from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
@@ -323,6 +327,234 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def json_serialize_history(hass):
+    """Serialize a history payload of 1000 entities with 100 states each."""
+    now = dt_util.utcnow()
+    history = [
+        [
+            core.State(
+                f"sensor.power_{entity}",
+                str(idx),
+                {"unit_of_measurement": "W", "friendly_name": f"Power {entity}"},
+                now + timedelta(minutes=idx),
+            )
+            for idx in range(100)
+        ]
+        for entity in range(1000)
+    ]
+
+    start = timer()
+    json_bytes(history)
+    return timer() - start
+
+
+@benchmark
+async def static_assets(hass):
+    """Serve 10,000 frontend assets with pre-compressed siblings."""
+    # pylint: disable=import-outside-toplevel
+    from aiohttp import web
+    from aiohttp.test_utils import TestClient, TestServer
+
+    from homeassistant.components.http.static import CachingStaticResource
+
+    with TemporaryDirectory() as tmpdir:
+        for idx in range(100):
+            Path(tmpdir, f"chunk.{idx}.js").write_text("x" * 10000)
+            Path(tmpdir, f"chunk.{idx}.js.gz").write_bytes(b"x" * 100)
+
+        app = web.Application()
+        app.router.register_resource(CachingStaticResource("/static", tmpdir))
+        client = TestClient(TestServer(app), auto_decompress=False)
+        await client.start_server()
+
+        start = timer()
+        for idx in range(10 ** 4):
+            resp = await client.get(
+                f"/static/chunk.{idx % 100}.js", headers={"Accept-Encoding": "gzip"}
+            )
+            await resp.read()
+        runtime = timer() - start
+
+        await client.close()
+
+    return runtime
+
+
+@benchmark
+async def template_iterate_states(hass):
+    """Render a template iterating 500 sensors a thousand times."""
+    for idx in range(500):
+        hass.states.async_set(f"sensor.power_{idx}", idx, {"unit_of_measurement": "W"})
+
+    tpl = Template("{{ states.sensor | list | count }}", hass)
+
+    start = timer()
+    for idx in range(1000):
+        # Change one state between renders like a state changed event would
+        hass.states.async_set(f"sensor.power_{idx % 500}", idx)
+        tpl.async_render()
+    return timer() - start
+
+
+class _PowerSensor(Entity):
+    """A sensor like most integrations implement them."""
+
+    entity_id = "sensor.power"
+
+    def __init__(self, hass, cache_static_attributes):
+        """Initialize the sensor."""
+        self.hass = hass
+        self.cache_static_attributes = cache_static_attributes
+        self.device = {"name": "Kitchen plug", "model": "Plug", "voltage": 230}
+        self.value = 0
+
+    @property
+    def should_poll(self):
+        """Return if the sensor is polled."""
+        return False
+
+    @property
+    def name(self):
+        """Return the name."""
+        return f"{self.device['name']} Power"
+
+    @property
+    def unit_of_measurement(self):
+        """Return the unit of measurement."""
+        return "W"
+
+    @property
+    def device_class(self):
+        """Return the device class."""
+        return "power"
+
+    @property
+    def icon(self):
+        """Return the icon."""
+        return "mdi:flash"
+
+    @property
+    def state(self):
+        """Return the state."""
+        return self.value
+
+    @property
+    def device_state_attributes(self):
+        """Return the device state attributes."""
+        return {"voltage": self.device["voltage"]}
+
+
+async def _entity_write_state(hass, cache_static_attributes):
+    """Write the state of a sensor a hundred thousand times."""
+    sensor = _PowerSensor(hass, cache_static_attributes)
+
+    start = timer()
+    for idx in range(10 ** 5):
+        sensor.value = idx
+        sensor.async_write_ha_state()
+    runtime = timer() - start
+    print(f"{10 ** 5 / runtime:.0f} writes per second")
+    return runtime
+
+
+@benchmark
+async def entity_write_state(hass):
+    """Write the state of a sensor a hundred thousand times."""
+    return await _entity_write_state(hass, False)
+
+
+@benchmark
+async def entity_write_state_cached(hass):
+    """Write the state of a sensor with cached static attributes."""
+    return await _entity_write_state(hass, True)
+
+
+class _DevicePowerSensor(_PowerSensor):
+    """A power sensor of a device with several sensors."""
+
+    entity_id = None
+
+    def __init__(self, hass, idx):
+        """Initialize the sensor."""
+        super().__init__(hass, False)
+        self.idx = idx
+        self.device = {"name": f"Plug {idx // 4}", "model": "Plug", "voltage": 230}
+
+    @property
+    def unique_id(self):
+        """Return the unique ID."""
+        return f"power-{self.idx}"
+
+    @property
+    def name(self):
+        """Return the name."""
+        return f"{self.device['name']} Power {self.idx % 4}"
+
+    @property
+    def device_info(self):
+        """Return the device info."""
+        return {
+            "identifiers": {("benchmark", self.device["name"])},
+            "name": self.device["name"],
+            "model": self.device["model"],
+        }
+
+
+async def _entity_platform_add_entities(hass, registered):
+    """Add 5000 sensors of 1250 devices to a config entry platform."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.config_entries import CONN_CLASS_LOCAL_PUSH, ConfigEntry
+    from homeassistant.helpers.entity_platform import EntityPlatform
+
+    with TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+        config_entry = ConfigEntry(
+            1, "benchmark", "Benchmark", {}, "user", CONN_CLASS_LOCAL_PUSH, {}
+        )
+        platform = EntityPlatform(
+            hass=hass,
+            logger=logging.getLogger(__name__),
+            domain="sensor",
+            platform_name="benchmark",
+            platform=None,
+            scan_interval=timedelta(seconds=30),
+            entity_namespace=None,
+        )
+        platform.config_entry = config_entry
+        await hass.helpers.device_registry.async_get_registry()
+        await hass.helpers.entity_registry.async_get_registry()
+
+        if registered:
+            # Like a restart, the entities and devices are known already
+            await platform.async_add_entities(
+                [_DevicePowerSensor(hass, idx) for idx in range(5000)]
+            )
+            await platform.async_reset()
+
+        entities = [_DevicePowerSensor(hass, idx) for idx in range(5000)]
+        start = timer()
+        await platform.async_add_entities(entities)
+        runtime = timer() - start
+        await platform.async_reset()
+        # Nothing to write to the temporary directory on stop
+        hass.state = core.CoreState.not_running
+
+    return runtime
+
+
+@benchmark
+async def entity_platform_add_entities(hass):
+    """Add 5000 new sensors of 1250 devices to a platform."""
+    return await _entity_platform_add_entities(hass, False)
+
+
+@benchmark
+async def entity_platform_add_entities_registered(hass):
+    """Add 5000 registered sensors of 1250 devices to a platform."""
+    return await _entity_platform_add_entities(hass, True)
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
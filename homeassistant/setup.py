@@ -3,7 +3,7 @@ import asyncio
 import logging.handlers
 from timeit import default_timer as timer
 from types import ModuleType
-from typing import Awaitable, Callable, Optional, Set
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
 
 from homeassistant import config as conf_util, core, loader, requirements
 from homeassistant.config import async_notify_setup_error
@@ -20,10 +20,181 @@ DATA_SETUP_DONE = "setup_done"
 DATA_SETUP_STARTED = "setup_started"
 DATA_SETUP = "setup_tasks"
 DATA_DEPS_REQS = "deps_reqs_processed"
+DATA_SETUP_TRACE = "setup_trace"
 
 SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 300
 
+STORAGE_KEY_SETUP_REPORT = "core.setup_report"
+STORAGE_VERSION_SETUP_REPORT = 1
+SETUP_REPORT_SAVE_DELAY = 10
+
+
+class IntegrationSetupTrace:
+    """Timings of setting up a single integration, in seconds."""
+
+    __slots__ = (
+        "domain",
+        "dependencies",
+        "started",
+        "finished",
+        "success",
+        "dependency_wait",
+        "requirements_time",
+        "import_time",
+        "config_time",
+        "setup_time",
+        "entries_time",
+    )
+
+    def __init__(self, domain: str) -> None:
+        """Initialize the trace."""
+        self.domain = domain
+        # Dependencies and after dependencies that were waited for
+        self.dependencies: List[str] = []
+        # Relative to the start of the setup trace
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.success: Optional[bool] = None
+        self.dependency_wait = 0.0
+        self.requirements_time = 0.0
+        self.import_time = 0.0
+        self.config_time = 0.0
+        self.setup_time = 0.0
+        self.entries_time = 0.0
+
+    @property
+    def own_time(self) -> float:
+        """Return the time spent on the integration itself."""
+        return (
+            self.requirements_time
+            + self.import_time
+            + self.config_time
+            + self.setup_time
+            + self.entries_time
+        )
+
+    def as_dict(self, resolve_time: Optional[float]) -> Dict[str, Any]:
+        """Return a dictionary version of the trace."""
+        return {
+            "domain": self.domain,
+            "success": self.success,
+            "started": _round(self.started),
+            "finished": _round(self.finished),
+            "dependencies": self.dependencies,
+            "resolve_time": _round(resolve_time),
+            "dependency_wait": _round(self.dependency_wait),
+            "requirements_time": _round(self.requirements_time),
+            "import_time": _round(self.import_time),
+            "config_time": _round(self.config_time),
+            "setup_time": _round(self.setup_time),
+            "entries_time": _round(self.entries_time),
+            "own_time": _round(self.own_time),
+        }
+
+
+class SetupTrace:
+    """Trace of setting up the integrations."""
+
+    def __init__(self) -> None:
+        """Initialize the trace."""
+        self.start = timer()
+        self.integrations: Dict[str, IntegrationSetupTrace] = {}
+        # Duration of the bootstrap stages
+        self.stages: Dict[str, float] = {}
+
+    @core.callback
+    def async_get(self, domain: str) -> IntegrationSetupTrace:
+        """Return the trace of an integration."""
+        trace = self.integrations.get(domain)
+        if trace is None:
+            trace = self.integrations[domain] = IntegrationSetupTrace(domain)
+        return trace
+
+    def elapsed(self) -> float:
+        """Return the time since the trace started."""
+        return timer() - self.start
+
+    def critical_path(self) -> List[str]:
+        """Return the chain of dependencies that finished last.
+
+        Starting from the integration that finished last, the dependency
+        that finished last is followed until one without dependencies.
+        Speeding up any integration not on this path does not speed up
+        the setup of all integrations.
+        """
+        finished = {
+            domain: trace.finished
+            for domain, trace in self.integrations.items()
+            if trace.finished is not None
+        }
+        path: List[str] = []
+        domain = max(finished, key=finished.__getitem__, default=None)
+
+        while domain is not None and domain not in path:
+            path.append(domain)
+            domain = max(
+                (
+                    dep
+                    for dep in self.integrations[domain].dependencies
+                    if dep in finished
+                ),
+                key=finished.__getitem__,
+                default=None,
+            )
+
+        path.reverse()
+        return path
+
+    def as_dict(self, resolve_times: Dict[str, float]) -> Dict[str, Any]:
+        """Return a dictionary version of the trace, slowest first."""
+        return {
+            "stages": {
+                stage: _round(duration) for stage, duration in self.stages.items()
+            },
+            "critical_path": self.critical_path(),
+            "integrations": [
+                trace.as_dict(resolve_times.get(trace.domain))
+                for trace in sorted(
+                    self.integrations.values(),
+                    key=lambda trace: trace.own_time,
+                    reverse=True,
+                )
+            ],
+        }
+
+
+def _round(duration: Optional[float]) -> Optional[float]:
+    """Round a duration for the report."""
+    return None if duration is None else round(duration, 6)
+
+
+@core.callback
+def async_get_setup_trace(hass: core.HomeAssistant) -> SetupTrace:
+    """Return the trace of setting up the integrations."""
+    trace: Optional[SetupTrace] = hass.data.get(DATA_SETUP_TRACE)
+    if trace is None:
+        trace = hass.data[DATA_SETUP_TRACE] = SetupTrace()
+    return trace
+
+
+@core.callback
+def async_get_setup_report(hass: core.HomeAssistant) -> Dict[str, Any]:
+    """Return the report of setting up the integrations."""
+    return async_get_setup_trace(hass).as_dict(loader.async_get_resolve_times(hass))
+
+
+@core.callback
+def async_save_setup_report(hass: core.HomeAssistant) -> None:
+    """Save the report of setting up the integrations."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.storage import Store
+
+    store = Store(hass, STORAGE_VERSION_SETUP_REPORT, STORAGE_KEY_SETUP_REPORT)
+    store.async_delay_save(
+        lambda: async_get_setup_report(hass), SETUP_REPORT_SAVE_DELAY
+    )
+
 
 @core.callback
 def async_set_domains_to_be_loaded(hass: core.HomeAssistant, domains: Set[str]) -> None:
@@ -56,6 +227,9 @@ async def async_setup_component(
     if domain in setup_tasks:
         return await setup_tasks[domain]  # type: ignore
 
+    setup_trace = async_get_setup_trace(hass)
+    trace = setup_trace.async_get(domain)
+    trace.started = setup_trace.elapsed()
     task = setup_tasks[domain] = hass.async_create_task(
         _async_setup_component(hass, domain, config)
     )
@@ -63,6 +237,8 @@ async def async_setup_component(
     try:
         return await task  # type: ignore
     finally:
+        trace.finished = setup_trace.elapsed()
+        trace.success = domain in hass.config.components
         if domain in hass.data.get(DATA_SETUP_DONE, {}):
             hass.data[DATA_SETUP_DONE].pop(domain).set()
 
@@ -105,10 +281,14 @@ async def _async_process_dependencies(
             list(after_dependencies_tasks),
         )
 
+    trace = async_get_setup_trace(hass).async_get(integration.domain)
+    trace.dependencies = [*dependencies_tasks, *after_dependencies_tasks]
+    start = timer()
     async with hass.timeout.async_freeze(integration.domain):
         results = await asyncio.gather(
             *dependencies_tasks.values(), *after_dependencies_tasks.values()
         )
+    trace.dependency_wait += timer() - start
 
     failed = [
         domain for idx, domain in enumerate(dependencies_tasks) if not results[idx]
@@ -160,8 +340,11 @@ async def _async_setup_component(
         log_error(str(err), integration.documentation)
         return False
 
+    trace = async_get_setup_trace(hass).async_get(domain)
+
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
+    start = timer()
     try:
         component = integration.get_component()
     except ImportError as err:
@@ -170,10 +353,14 @@ async def _async_setup_component(
     except Exception:  # pylint: disable=broad-except
         _LOGGER.exception("Setup failed for %s: unknown error", domain)
         return False
+    finally:
+        trace.import_time = timer() - start
 
+    start = timer()
     processed_config = await conf_util.async_process_component_config(
         hass, config, integration
     )
+    trace.config_time = timer() - start
 
     if processed_config is None:
         log_error("Invalid config.", integration.documentation)
@@ -227,6 +414,7 @@ async def _async_setup_component(
         return False
     finally:
         end = timer()
+        trace.setup_time = end - start
         if warn_task:
             warn_task.cancel()
     _LOGGER.info("Setup of domain %s took %.1f seconds", domain, end - start)
@@ -247,12 +435,14 @@ async def _async_setup_component(
     await asyncio.sleep(0)
     await hass.config_entries.flow.async_wait_init_flow_finish(domain)
 
+    start = timer()
     await asyncio.gather(
         *[
             entry.async_setup(hass, integration=integration)
             for entry in hass.config_entries.async_entries(domain)
         ]
     )
+    trace.entries_time = timer() - start
 
     hass.config.components.add(domain)
     hass.data[DATA_SETUP_STARTED].pop(domain)
@@ -339,10 +529,13 @@ async def async_process_deps_reqs(
         raise HomeAssistantError("Could not set up all dependencies.")
 
     if not hass.config.skip_pip and integration.requirements:
+        trace = async_get_setup_trace(hass).async_get(integration.domain)
+        start = timer()
         async with hass.timeout.async_freeze(integration.domain):
             await requirements.async_get_integration_with_requirements(
                 hass, integration.domain
             )
+        trace.requirements_time = timer() - start
 
     processed.add(integration.domain)
 
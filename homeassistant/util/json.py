@@ -48,14 +48,16 @@ def save_json(
     private: bool = False,
     *,
     encoder: Optional[Type[json.JSONEncoder]] = None,
-) -> None:
+) -> int:
     """Save JSON data to a file.
 
-    Returns True on success.
+    Files are indented with four spaces, which only the standard library
+    encoder supports. The file is flushed to disk before it replaces the old
+    one. Returns the number of bytes written.
     """
     try:
-        json_data = json.dumps(data, indent=4, cls=encoder)
-    except TypeError as error:
+        json_data = json.dumps(data, indent=4, cls=encoder).encode("utf-8")
+    except (TypeError, ValueError) as error:
         msg = f"Failed to serialize to JSON: {filename}. Bad data at {format_unserializable_data(find_paths_unserializable_data(data))}"
         _LOGGER.error(msg)
         raise SerializationError(msg) from error
@@ -65,10 +67,12 @@ def save_json(
     try:
         # Modern versions of Python tempfile create this file with mode 0o600
         with tempfile.NamedTemporaryFile(
-            mode="w", encoding="utf-8", dir=tmp_path, delete=False
+            mode="wb", dir=tmp_path, delete=False
         ) as fdesc:
             fdesc.write(json_data)
             tmp_filename = fdesc.name
+            fdesc.flush()
+            os.fsync(fdesc.fileno())
         if not private:
             os.chmod(tmp_filename, 0o644)
         os.replace(tmp_filename, filename)
@@ -84,6 +88,8 @@ def save_json(
                 # we should suppress likely follow-on errors in the cleanup
                 _LOGGER.error("JSON replacement cleanup failed: %s", err)
 
+    return len(json_data)
+
 
 def format_unserializable_data(data: Dict[str, Any]) -> str:
     """Format output of find_paths in a friendly way.
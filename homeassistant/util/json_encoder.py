@@ -0,0 +1,112 @@
+"""Fast JSON serialization of Home Assistant objects.
+
+orjson is used to serialize, the standard library encoder is a fallback
+for platforms without orjson wheels. Both produce the same compact output.
+"""
+from datetime import datetime
+import json
+import math
+from typing import Any, Callable, Optional, Set
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+# Message of the ValueError the standard library raises for NaN and infinity
+_NON_FINITE_FLOAT_ERROR = "Out of range float values"
+
+_JSON_SCALAR_TYPES = (str, int, bool, type(None))
+
+
+def json_encoder_default(obj: Any) -> Any:
+    """Convert Home Assistant objects.
+
+    Raises TypeError for objects that can't be converted.
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, (set, tuple)):
+        return list(obj)
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_encode_bytes(
+    data: Any, *, default: Optional[Callable[[Any], Any]] = None
+) -> bytes:
+    """Serialize data to compact UTF-8 encoded JSON.
+
+    Non finite floats are serialized as null by both encoders.
+    """
+    if orjson is not None:
+        return orjson.dumps(  # type: ignore
+            data, option=orjson.OPT_NON_STR_KEYS, default=default
+        )
+
+    try:
+        return _stdlib_encode_bytes(data, default)
+    except ValueError as err:
+        if _NON_FINITE_FLOAT_ERROR not in str(err):
+            raise
+    return _stdlib_encode_bytes(_replace_non_finite_floats(data, default), default)
+
+
+def _stdlib_encode_bytes(data: Any, default: Optional[Callable[[Any], Any]]) -> bytes:
+    """Serialize data to compact JSON with the standard library encoder."""
+    return json.dumps(
+        data,
+        default=default,
+        allow_nan=False,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _replace_non_finite_floats(
+    obj: Any,
+    default: Optional[Callable[[Any], Any]],
+    markers: Optional[Set[int]] = None,
+) -> Any:
+    """Return a copy of the data with non finite floats replaced by None.
+
+    Only used when the data contains non finite floats, objects handled
+    by the default hook are converted so floats inside them are found.
+    """
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, _JSON_SCALAR_TYPES):
+        return obj
+    if not isinstance(obj, (dict, list)):
+        if default is None:
+            # Let the encoder raise for the unsupported type
+            return obj
+        return _replace_non_finite_floats(default(obj), default, markers)
+
+    if markers is None:
+        markers = set()
+    if id(obj) in markers:
+        raise ValueError("Circular reference detected")
+    markers.add(id(obj))
+    if isinstance(obj, dict):
+        result: Any = {
+            key: _replace_non_finite_floats(value, default, markers)
+            for key, value in obj.items()
+        }
+    else:
+        result = [_replace_non_finite_floats(value, default, markers) for value in obj]
+    markers.remove(id(obj))
+    return result
+
+
+def json_bytes(data: Any) -> bytes:
+    """Serialize data that may contain Home Assistant objects to JSON bytes."""
+    return json_encode_bytes(data, default=json_encoder_default)
+
+
+def json_dumps(data: Any) -> str:
+    """Serialize data that may contain Home Assistant objects to a JSON string."""
+    return json_bytes(data).decode("utf-8")
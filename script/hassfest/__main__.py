@@ -12,6 +12,7 @@ from . import (
     dhcp,
     json,
     manifest,
+    manifest_index,
     mqtt,
     requirements,
     services,
@@ -27,6 +28,7 @@ INTEGRATION_PLUGINS = [
     config_flow,
     dependencies,
     manifest,
+    manifest_index,
     mqtt,
     services,
     ssdp,
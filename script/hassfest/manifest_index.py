@@ -0,0 +1,42 @@
+"""Generate the index of the built-in manifests."""
+import json
+from typing import Dict
+
+from homeassistant.loader import MANIFEST_INDEX_VERSION
+
+from .model import Config, Integration
+
+
+def generate_and_validate(integrations: Dict[str, Integration]):
+    """Validate and generate the manifest index."""
+    manifests = {
+        domain: integrations[domain].manifest
+        for domain in sorted(integrations)
+        if integrations[domain].manifest
+    }
+
+    return json.dumps(
+        {"version": MANIFEST_INDEX_VERSION, "manifests": manifests}, indent=2
+    )
+
+
+def validate(integrations: Dict[str, Integration], config: Config):
+    """Validate the manifest index."""
+    index_path = config.root / "homeassistant/generated/manifests.json"
+    config.cache["manifest_index"] = content = generate_and_validate(integrations)
+
+    if config.specific_integrations:
+        return
+
+    if not index_path.is_file() or index_path.read_text().strip() != content:
+        config.add_error(
+            "manifest_index",
+            "File manifests.json is not up to date. Run python3 -m script.hassfest",
+            fixable=True,
+        )
+
+
+def generate(integrations: Dict[str, Integration], config: Config):
+    """Generate the manifest index."""
+    index_path = config.root / "homeassistant/generated/manifests.json"
+    index_path.write_text(f"{config.cache['manifest_index']}\n")
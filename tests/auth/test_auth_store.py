@@ -241,3 +241,50 @@ async def test_loading_race_condition(hass):
         mock_dev_registry.assert_called_once_with(hass)
         mock_load.assert_called_once_with()
         assert results[0] == results[1]
+
+
+async def test_get_refresh_token_by_id(hass, hass_storage):
+    """Test refresh tokens are found by id after loading and changes."""
+    hass_storage[auth_store.STORAGE_KEY] = {
+        "version": 1,
+        "data": {
+            "credentials": [],
+            "users": [
+                {
+                    "id": "user-id",
+                    "is_active": True,
+                    "is_owner": True,
+                    "name": "Paulus",
+                    "system_generated": False,
+                },
+            ],
+            "refresh_tokens": [
+                {
+                    "access_token_expiration": 1800.0,
+                    "client_id": "http://localhost:8123/",
+                    "created_at": "2018-10-03T13:43:19.774637+00:00",
+                    "id": "user-token-id",
+                    "jwt_key": "some-key",
+                    "last_used_at": "2018-10-03T13:43:19.774712+00:00",
+                    "token": "some-token",
+                    "user_id": "user-id",
+                },
+            ],
+        },
+    }
+
+    store = auth_store.AuthStore(hass)
+    loaded = await store.async_get_refresh_token("user-token-id")
+    assert loaded is not None
+    assert loaded.user.id == "user-id"
+    assert await store.async_get_refresh_token("unknown-id") is None
+
+    created = await store.async_create_refresh_token(loaded.user, "client")
+    assert await store.async_get_refresh_token(created.id) is created
+
+    await store.async_remove_refresh_token(loaded)
+    assert await store.async_get_refresh_token("user-token-id") is None
+    assert "user-token-id" not in loaded.user.refresh_tokens
+
+    await store.async_remove_user(loaded.user)
+    assert await store.async_get_refresh_token(created.id) is None
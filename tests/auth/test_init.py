@@ -474,6 +474,73 @@ async def test_remove_refresh_token(mock_hass):
     assert await manager.async_validate_access_token(access_token) is None
 
 
+async def test_validated_access_token_cached(mock_hass):
+    """Test a validated access token is not decoded again."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    with patch("homeassistant.auth.jwt.decode") as mock_decode:
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    assert not mock_decode.called
+
+    user.is_active = False
+    assert await manager.async_validate_access_token(access_token) is None
+
+    # Expired tokens are validated again
+    user.is_active = True
+    with patch(
+        "homeassistant.util.dt.utcnow",
+        return_value=dt_util.utcnow() + auth_const.ACCESS_TOKEN_EXPIRATION,
+    ), patch("homeassistant.auth.jwt.decode", side_effect=jwt.InvalidTokenError):
+        assert await manager.async_validate_access_token(access_token) is None
+
+
+async def test_validated_access_token_invalidated(mock_hass):
+    """Test removing a refresh token or user invalidates cached access tokens."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    other_token = await manager.async_create_refresh_token(user, "other-client")
+    access_token = manager.async_create_access_token(refresh_token)
+    other_access_token = manager.async_create_access_token(other_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+    assert await manager.async_validate_access_token(other_access_token) is other_token
+
+    await manager.async_remove_refresh_token(refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is None
+    assert await manager.async_validate_access_token(other_access_token) is other_token
+
+    await manager.async_remove_user(user)
+
+    assert await manager.async_get_refresh_token(other_token.id) is None
+    assert await manager.async_validate_access_token(other_access_token) is None
+
+
+async def test_validated_access_token_cache_size(mock_hass):
+    """Test the number of cached access tokens is bounded."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+
+    with patch("homeassistant.auth.ACCESS_TOKEN_CACHE_SIZE", 2):
+        for idx in range(3):
+            refresh_token = await manager.async_create_refresh_token(
+                user, f"client-{idx}"
+            )
+            access_token = manager.async_create_access_token(refresh_token)
+            assert (
+                await manager.async_validate_access_token(access_token) is refresh_token
+            )
+
+    assert len(manager._access_token_cache) == 2
+
+
 async def test_create_access_token(mock_hass):
     """Test normal refresh_token's jwt_key keep same after used."""
     manager = await auth.auth_manager_from_config(mock_hass, [], [])
@@ -10,6 +10,7 @@ import voluptuous as vol
 from homeassistant import const
 from homeassistant.bootstrap import DATA_LOGGING
 import homeassistant.core as ha
+from homeassistant.helpers.json import json_bytes
 from homeassistant.setup import async_setup_component
 
 from tests.common import async_mock_service
@@ -33,6 +34,28 @@ async def test_api_list_state_entities(hass, mock_api_client):
     assert remote_data == hass.states.async_all()
 
 
+async def test_api_states_etag(hass, mock_api_client):
+    """Test the states are only sent again when a state changed."""
+    hass.states.async_set("test.entity", "hello")
+    resp = await mock_api_client.get(const.URL_API_STATES)
+    assert resp.status == 200
+    etag = resp.headers["ETag"]
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == 304
+    assert resp.headers["ETag"] == etag
+
+    hass.states.async_set("test.entity", "world")
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == 200
+    assert resp.headers["ETag"] != etag
+    assert (await resp.json())[0]["state"] == "world"
+
+
 async def test_api_get_state(hass, mock_api_client):
     """Test if the debug interface allows us to get a state."""
     hass.states.async_set("hello.world", "nice", {"attr": 1})
@@ -339,7 +362,8 @@ async def test_stream_with_restricted(hass, mock_api_client):
         f"{const.URL_API_STREAM}?restrict=test_event1,test_event3"
     )
     assert resp.status == 200
-    assert listen_count + 1 == _listen_count(hass)
+    # One listener per event type and one for stop
+    assert listen_count + 3 == _listen_count(hass)
 
     hass.bus.async_fire("test_event1")
     data = await _stream_next_event(resp.content)
@@ -351,6 +375,48 @@ async def test_stream_with_restricted(hass, mock_api_client):
     assert data["event_type"] == "test_event3"
 
 
+async def test_stream_with_entity_filter(hass, mock_api_client):
+    """Test the stream with entity and domain filters."""
+    resp = await mock_api_client.get(
+        f"{const.URL_API_STREAM}?restrict=state_changed"
+        "&entity_id=light.kitchen&domain=switch"
+    )
+    assert resp.status == 200
+
+    hass.states.async_set("light.living_room", "on")
+    hass.states.async_set("light.kitchen", "on")
+    data = await _stream_next_event(resp.content)
+    assert data["data"]["entity_id"] == "light.kitchen"
+
+    hass.states.async_set("sensor.temperature", "10")
+    hass.states.async_set("switch.fan", "on")
+    data = await _stream_next_event(resp.content)
+    assert data["data"]["entity_id"] == "switch.fan"
+
+
+async def test_stream_shares_serialized_events(hass, hass_client):
+    """Test events are serialized once for all streams and written in batches."""
+    assert await async_setup_component(hass, "api", {})
+    clients = [await hass_client(), await hass_client()]
+    responses = [
+        await client.get(f"{const.URL_API_STREAM}?restrict=test_event")
+        for client in clients
+    ]
+
+    with patch(
+        "homeassistant.components.api.json_bytes", wraps=json_bytes
+    ) as mock_json_bytes:
+        hass.bus.async_fire("test_event", {"count": 1})
+        hass.bus.async_fire("test_event", {"count": 2})
+        for resp in responses:
+            data = await _stream_next_event(resp.content)
+            assert data["data"] == {"count": 1}
+            data = await _stream_next_event(resp.content)
+            assert data["data"] == {"count": 2}
+
+    assert mock_json_bytes.call_count == 2
+
+
 async def _stream_next_event(stream):
     """Read the stream for next event while ignoring ping."""
     while True:
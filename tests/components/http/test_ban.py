@@ -15,7 +15,10 @@ from homeassistant.components.http.ban import (
     IP_BANS_FILE,
     KEY_BANNED_IPS,
     KEY_FAILED_LOGIN_ATTEMPTS,
+    FailedLoginAttempts,
     IpBan,
+    IpBans,
+    async_load_ip_bans_config,
     setup_bans,
 )
 from homeassistant.components.http.view import request_handler_factory
@@ -70,6 +73,133 @@ async def test_access_from_banned_ip(hass, aiohttp_client):
         assert resp.status == HTTP_FORBIDDEN
 
 
+async def test_access_from_banned_network(hass, aiohttp_client):
+    """Test accessing to server from a banned network."""
+    app = web.Application()
+    app["hass"] = hass
+
+    async def handler(request):
+        """Return a mock web response."""
+        return web.Response(text="ok")
+
+    app.router.add_get("/", handler)
+    setup_bans(hass, app, 5)
+    set_real_ip = mock_real_ip(app)
+
+    with patch(
+        "homeassistant.components.http.ban.async_load_ip_bans_config",
+        return_value=[IpBan("10.0.0.0/8"), IpBan("2001:db8::/32")],
+    ):
+        client = await aiohttp_client(app)
+
+    for remote_addr, status in (
+        ("10.1.2.3", HTTP_FORBIDDEN),
+        ("11.0.0.1", 200),
+        ("2001:db8::1", HTTP_FORBIDDEN),
+        ("2001:db9::1", 200),
+    ):
+        set_real_ip(remote_addr)
+        resp = await client.get("/")
+        assert resp.status == status
+
+
+def test_ip_bans_lookup(hass):
+    """Test looking up banned addresses and networks."""
+    bans = IpBans(
+        hass,
+        "ip_bans.yaml",
+        [
+            IpBan("200.201.202.203"),
+            IpBan("100.64.0.0/10"),
+            IpBan("192.168.1.7/24"),
+            IpBan("fe80::/10"),
+        ],
+    )
+
+    assert len(bans) == 4
+    assert [str(ip_ban) for ip_ban in bans] == [
+        "200.201.202.203",
+        "100.64.0.0/10",
+        "192.168.1.0/24",
+        "fe80::/10",
+    ]
+    assert "200.201.202.203" in bans
+    assert ip_address("200.201.202.203") in bans
+    assert "100.127.255.255" in bans
+    assert ip_address("100.64.0.1") in bans
+    assert "100.128.0.0" not in bans
+    assert "192.168.1.255" in bans
+    assert "192.168.2.1" not in bans
+    assert "fe80::1" in bans
+    assert "fec0::1" not in bans
+    assert "not-an-ip" not in bans
+    assert None not in bans
+
+
+async def test_ip_bans_batched_write(hass):
+    """Test new bans are written to the file in batches."""
+    bans = IpBans(hass, hass.config.path(IP_BANS_FILE), [])
+    m_open = mock_open()
+
+    with patch("homeassistant.components.http.ban.open", m_open, create=True):
+        for remote_addr in BANNED_IPS:
+            bans.async_add(IpBan(remote_addr))
+        assert all(remote_addr in bans for remote_addr in BANNED_IPS)
+        await hass.async_block_till_done()
+
+    m_open.assert_called_once_with(hass.config.path(IP_BANS_FILE), "a")
+    written = "".join(call[1][0] for call in m_open().write.mock_calls)
+    for remote_addr in BANNED_IPS:
+        assert remote_addr in written
+
+
+async def test_load_ip_bans_config(hass):
+    """Test loading bans with networks and invalid entries."""
+    with patch(
+        "homeassistant.components.http.ban.load_yaml_config_file",
+        return_value={
+            "200.201.202.203": {"banned_at": "2020-01-01T00:00:00+00:00"},
+            "10.0.0.0/8": {},
+            "not-an-ip": {},
+        },
+    ):
+        ip_bans = await async_load_ip_bans_config(hass, "ip_bans.yaml")
+
+    assert [str(ip_ban) for ip_ban in ip_bans] == ["200.201.202.203", "10.0.0.0/8"]
+
+
+def test_failed_login_attempts_decay():
+    """Test failed login attempts are forgotten over time."""
+    attempts = FailedLoginAttempts(max_size=2, decay=10)
+    first = ip_address("200.201.202.203")
+    second = ip_address("200.201.202.204")
+    third = ip_address("200.201.202.205")
+
+    with patch("homeassistant.components.http.ban.monotonic", return_value=100):
+        assert attempts.increment(first) == 1
+        assert attempts.increment(first) == 2
+        assert attempts.increment(first) == 3
+
+    with patch("homeassistant.components.http.ban.monotonic", return_value=115):
+        assert attempts[first] == 2
+        assert attempts.increment(first) == 3
+
+    with patch("homeassistant.components.http.ban.monotonic", return_value=150):
+        assert attempts[first] == 0
+        assert first not in attempts
+
+        attempts.increment(second)
+        attempts.increment(third)
+
+        # The least recent address is dropped
+        assert len(attempts) == 2
+        assert second in attempts
+        assert third in attempts
+
+        attempts.pop(second)
+        assert second not in attempts
+
+
 @pytest.mark.parametrize(
     "remote_addr, bans, status",
     list(
@@ -108,6 +238,7 @@ async def test_access_from_supervisor_ip(
         resp = await client.get("/")
         assert resp.status == 401
         assert len(app[KEY_BANNED_IPS]) == bans
+        await hass.async_block_till_done()
         assert m_open.call_count == bans
 
         # second request should be forbidden if banned
@@ -166,6 +297,7 @@ async def test_ip_bans_file_creation(hass, aiohttp_client):
         resp = await client.get("/")
         assert resp.status == 401
         assert len(app[KEY_BANNED_IPS]) == len(BANNED_IPS) + 1
+        await hass.async_block_till_done()
         m_open.assert_called_once_with(hass.config.path(IP_BANS_FILE), "a")
 
         resp = await client.get("/")
@@ -0,0 +1,140 @@
+"""Test the request instrumentation middleware."""
+from aiohttp import web
+import pytest
+
+from homeassistant.components.http.instrumentation import (
+    LATENCY_BUCKETS,
+    ROUTE_UNMATCHED,
+    SERVER_TIMING,
+    RouteStats,
+    async_get_request_stats,
+    setup_instrumentation,
+)
+from homeassistant.setup import async_setup_component
+
+
+@pytest.fixture
+async def mock_client(hass, aiohttp_client):
+    """Return a client for an app with the instrumentation middleware."""
+
+    async def ok_handler(request):
+        """Return a response."""
+        return web.Response(text="hello")
+
+    async def forbidden_handler(request):
+        """Raise forbidden."""
+        raise web.HTTPForbidden
+
+    async def error_handler(request):
+        """Raise an unexpected error."""
+        raise ValueError("boom")
+
+    async def stream_handler(request):
+        """Send a streamed response."""
+        response = web.StreamResponse()
+        await response.prepare(request)
+        await response.write(b"streamed")
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_get("/ok", ok_handler)
+    app.router.add_get("/forbidden", forbidden_handler)
+    app.router.add_get("/error", error_handler)
+    app.router.add_get("/stream", stream_handler)
+    app.router.add_get("/item/{item_id}", ok_handler)
+    setup_instrumentation(hass, app)
+    return await aiohttp_client(app)
+
+
+async def test_records_requests(hass, mock_client):
+    """Test requests are recorded per route."""
+    for _ in range(3):
+        resp = await mock_client.get("/ok")
+        assert resp.status == 200
+        assert resp.headers[SERVER_TIMING].startswith("handler;dur=")
+
+    resp = await mock_client.get("/item/1")
+    assert resp.status == 200
+    resp = await mock_client.get("/item/2")
+    assert resp.status == 200
+
+    stats = async_get_request_stats(hass)
+    route_stats = stats.routes["/ok"]
+    assert route_stats.requests == 3
+    assert route_stats.statuses == {200: 3}
+    assert route_stats.bytes_sent == 15
+    assert route_stats.timed_requests == 3
+
+    # Dynamic routes are recorded under their pattern
+    assert stats.routes["/item/{item_id}"].requests == 2
+
+
+async def test_records_errors(hass, mock_client):
+    """Test raised HTTP errors and unmatched requests are recorded."""
+    resp = await mock_client.get("/forbidden")
+    assert resp.status == 403
+    resp = await mock_client.get("/does_not_exist")
+    assert resp.status == 404
+
+    stats = async_get_request_stats(hass)
+    assert stats.routes["/forbidden"].statuses == {403: 1}
+    assert stats.routes[ROUTE_UNMATCHED].statuses == {404: 1}
+
+
+async def test_records_unhandled_exception(hass, mock_client):
+    """Test unhandled exceptions are recorded as internal server errors."""
+    resp = await mock_client.get("/error")
+    assert resp.status == 500
+
+    route_stats = async_get_request_stats(hass).routes["/error"]
+    assert route_stats.statuses == {500: 1}
+    assert route_stats.timed_requests == 1
+
+
+async def test_streamed_response(hass, mock_client):
+    """Test a response that was sent by the handler is not timed."""
+    resp = await mock_client.get("/stream")
+    assert resp.status == 200
+    assert await resp.read() == b"streamed"
+    assert SERVER_TIMING not in resp.headers
+
+    route_stats = async_get_request_stats(hass).routes["/stream"]
+    assert route_stats.requests == 1
+    assert route_stats.timed_requests == 0
+    assert route_stats.bytes_sent > 0
+
+
+def test_route_stats_percentiles():
+    """Test percentiles are estimated from the histogram."""
+    route_stats = RouteStats("/api/states")
+    assert route_stats.percentile(50) is None
+
+    for _ in range(90):
+        route_stats.async_record(200, 10, 0.001)
+    for _ in range(9):
+        route_stats.async_record(200, 10, 0.2)
+    route_stats.async_record(500, 0, 60)
+
+    assert route_stats.percentile(50) == LATENCY_BUCKETS[0]
+    assert route_stats.percentile(90) == LATENCY_BUCKETS[0]
+    assert route_stats.percentile(99) == 0.25
+    assert route_stats.percentile(100) is None
+
+    data = route_stats.as_dict()
+    assert data["requests"] == 100
+    assert data["statuses"] == {"200": 99, "500": 1}
+    assert data["bytes_sent"] == 990
+    assert data["percentiles"] == {"p50": 0.005, "p90": 0.005, "p99": 0.25}
+
+
+async def test_disabled_by_default(hass):
+    """Test request statistics are only collected when enabled."""
+    assert await async_setup_component(hass, "http", {"http": {}})
+    assert async_get_request_stats(hass) is None
+
+
+async def test_enabled_in_config(hass):
+    """Test request statistics are collected when enabled."""
+    assert await async_setup_component(hass, "http", {"http": {"request_stats": True}})
+    assert async_get_request_stats(hass) is not None
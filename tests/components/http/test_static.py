@@ -0,0 +1,176 @@
+"""The tests for http static files."""
+import inspect
+import mimetypes
+
+from aiohttp import web
+import pytest
+
+from homeassistant.components.http.static import CachingStaticResource
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    """Create a static directory with a compressed sibling."""
+    (tmp_path / "app.js").write_text("console.log('plain');")
+    (tmp_path / "app.js.gz").write_bytes(b"gzip")
+    (tmp_path / "app.js.br").write_bytes(b"brotli")
+    (tmp_path / "other.txt").write_text("other")
+    return tmp_path
+
+
+@pytest.fixture
+async def static_client(aiohttp_client, static_dir):
+    """Create a client for an app serving the static directory."""
+    app = web.Application()
+    resource = CachingStaticResource("/static", str(static_dir))
+    app.router.register_resource(resource)
+    client = await aiohttp_client(app, auto_decompress=False)
+    client.resource = resource
+    return client
+
+
+async def test_serve_file(static_client):
+    """Test serving a file without compressed siblings."""
+    resp = await static_client.get(
+        "/static/other.txt", headers={"Accept-Encoding": "identity"}
+    )
+    assert resp.status == 200
+    assert await resp.text() == "other"
+    assert resp.headers["Content-Type"].startswith("text/plain")
+    assert resp.headers["Cache-Control"] == "public, max-age=2678400"
+    assert "Vary" not in resp.headers
+    assert resp.headers["ETag"].startswith('"')
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,content_encoding,body",
+    [
+        ("identity", None, b"console.log('plain');"),
+        ("gzip, deflate", "gzip", b"gzip"),
+        ("gzip, deflate, br", "br", b"brotli"),
+    ],
+)
+async def test_serve_compressed_variants(
+    static_client, accept_encoding, content_encoding, body
+):
+    """Test pre-compressed siblings are served based on Accept-Encoding."""
+    resp = await static_client.get(
+        "/static/app.js",
+        headers={"Accept-Encoding": accept_encoding},
+    )
+    assert resp.status == 200
+    assert resp.headers.get("Content-Encoding") == content_encoding
+    assert resp.headers["Content-Type"] == mimetypes.guess_type("app.js")[0]
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    assert await resp.read() == body
+
+
+async def test_not_modified(static_client):
+    """Test a matching ETag returns a 304."""
+    resp = await static_client.get(
+        "/static/app.js", headers={"Accept-Encoding": "gzip"}
+    )
+    etag = resp.headers["ETag"]
+
+    resp = await static_client.get(
+        "/static/app.js",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": f"W/{etag}"},
+    )
+    assert resp.status == 304
+
+    # The ETag differs per encoding
+    resp = await static_client.get(
+        "/static/app.js",
+        headers={"Accept-Encoding": "br", "If-None-Match": etag},
+    )
+    assert resp.status == 200
+
+
+async def test_path_cache(static_client, static_dir):
+    """Test resolved paths are cached until cleared."""
+    resp = await static_client.get("/static/new.txt")
+    assert resp.status == 404
+
+    (static_dir / "new.txt").write_text("new")
+    resp = await static_client.get("/static/new.txt")
+    assert resp.status == 404
+
+    static_client.resource.clear_cache()
+    resp = await static_client.get("/static/new.txt")
+    assert resp.status == 200
+    assert await resp.text() == "new"
+
+
+async def test_range_request(static_client):
+    """Test range requests are served from the uncompressed file."""
+    resp = await static_client.get(
+        "/static/app.js", headers={"Range": "bytes=0-6", "Accept-Encoding": "br"}
+    )
+    assert resp.status == 206
+    assert await resp.text() == "console"
+
+
+async def test_outside_directory(static_client):
+    """Test files outside of the directory are not served."""
+    resp = await static_client.get("/static/..%2f..%2fetc%2fpasswd")
+    assert resp.status in (403, 404)
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,content_encoding",
+    [
+        ("gzip;q=0, br;q=0", None),
+        ("gzip, br;q=0", "gzip"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("gzip;q=0.5, br;q=0.5", "br"),
+        ("*;q=0.1, br;q=0", "gzip"),
+        ("GZIP; Q=0.8", "gzip"),
+    ],
+)
+async def test_accept_encoding_quality(
+    static_client, accept_encoding, content_encoding
+):
+    """Test quality values in Accept-Encoding are respected."""
+    resp = await static_client.get(
+        "/static/app.js", headers={"Accept-Encoding": accept_encoding}
+    )
+    assert resp.status == 200
+    assert resp.headers.get("Content-Encoding") == content_encoding
+
+
+async def test_file_removed(static_client, static_dir):
+    """Test a cached file that was removed returns a 404."""
+    resp = await static_client.get("/static/other.txt")
+    assert resp.status == 200
+
+    (static_dir / "other.txt").unlink()
+    resp = await static_client.get("/static/other.txt")
+    assert resp.status == 404
+    assert "ETag" not in resp.headers
+
+    # The path was resolved again
+    (static_dir / "other.txt").write_text("back")
+    resp = await static_client.get("/static/other.txt")
+    assert resp.status == 200
+    assert await resp.text() == "back"
+
+
+async def test_file_changed(static_client, static_dir):
+    """Test a cached file that changed is sent without validators."""
+    resp = await static_client.get("/static/other.txt")
+    etag = resp.headers["ETag"]
+
+    (static_dir / "other.txt").write_text("changed content")
+    resp = await static_client.get("/static/other.txt")
+    assert resp.status == 200
+    assert await resp.text() == "changed content"
+    assert "ETag" not in resp.headers
+
+    resp = await static_client.get("/static/other.txt")
+    assert resp.headers["ETag"] != etag
+
+
+def test_sendfile_signature():
+    """Test the private aiohttp API the cached responses rely on."""
+    parameters = list(inspect.signature(web.FileResponse._sendfile).parameters)
+    assert parameters == ["self", "request", "fobj", "offset", "count"]
@@ -1,5 +1,5 @@
 """Tests for Home Assistant View."""
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 from aiohttp.web_exceptions import (
     HTTPBadRequest,
@@ -14,6 +14,7 @@ from homeassistant.components.http.view import (
     request_handler_factory,
 )
 from homeassistant.exceptions import ServiceNotFound, Unauthorized
+from homeassistant.util import json_encoder
 
 
 @pytest.fixture
@@ -33,9 +34,21 @@ async def test_invalid_json(caplog):
     view = HomeAssistantView()
 
     with pytest.raises(HTTPInternalServerError):
-        view.json(float("NaN"))
+        view.json(object)
 
-    assert str(float("NaN")) in caplog.text
+    assert str(object) in caplog.text
+
+
+@pytest.mark.parametrize("native", [True, False])
+async def test_json_nan(native):
+    """Test NaN floats are returned as null."""
+    view = HomeAssistantView()
+
+    with patch(
+        "homeassistant.util.json_encoder.orjson",
+        json_encoder.orjson if native else None,
+    ):
+        assert view.json({"value": float("NaN")}).body == b'{"value":null}'
 
 
 async def test_handling_unauthorized(mock_request):
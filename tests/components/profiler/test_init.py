@@ -12,9 +12,12 @@ from homeassistant.components.profiler import (
     SERVICE_MEMORY,
     SERVICE_START,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_START_TEMPLATE_PROFILING,
     SERVICE_STOP_LOG_OBJECTS,
+    SERVICE_STOP_TEMPLATE_PROFILING,
 )
 from homeassistant.components.profiler.const import DOMAIN
+from homeassistant.helpers.template import Template, async_get_render_profile
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -147,3 +150,37 @@ async def test_dump_log_object(hass, caplog):
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_template_profiling(hass, caplog):
+    """Test we can profile template rendering and log the results."""
+
+    await setup.async_setup_component(hass, "persistent_notification", {})
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_START_TEMPLATE_PROFILING)
+    assert hass.services.has_service(DOMAIN, SERVICE_STOP_TEMPLATE_PROFILING)
+
+    await hass.services.async_call(DOMAIN, SERVICE_START_TEMPLATE_PROFILING, {})
+    await hass.async_block_till_done()
+    assert async_get_render_profile(hass) is not None
+
+    tpl = Template("{{ 1 + 1 }}", hass)
+    tpl.owner = "sensor.profiled"
+    tpl.async_render()
+
+    await hass.services.async_call(DOMAIN, SERVICE_STOP_TEMPLATE_PROFILING, {})
+    await hass.async_block_till_done()
+    assert async_get_render_profile(hass) is None
+    assert "sensor.profiled" in caplog.text
+
+    await hass.services.async_call(DOMAIN, SERVICE_START_TEMPLATE_PROFILING, {})
+    await hass.async_block_till_done()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert async_get_render_profile(hass) is None
@@ -7,6 +7,10 @@ import pytest
 
 from homeassistant.components import climate, humidifier, sensor
 from homeassistant.components.demo.sensor import DemoSensor
+from homeassistant.components.http.instrumentation import (
+    DATA_REQUEST_STATS,
+    RequestStats,
+)
 import homeassistant.components.prometheus as prometheus
 from homeassistant.const import (
     CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
@@ -201,6 +205,33 @@ async def test_view(hass, hass_client):
     )
 
 
+async def test_view_request_stats(hass, hass_client):
+    """Test the HTTP request statistics are exported."""
+    await async_setup_component(hass, prometheus.DOMAIN, {prometheus.DOMAIN: {}})
+    client = await hass_client()
+    stats = hass.data[DATA_REQUEST_STATS] = RequestStats()
+    stats.async_record("/api/states", 200, 100, 0.002)
+    stats.async_record("/api/states", 401, 0, 0.02)
+
+    resp = await client.get(prometheus.API_ENDPOINT)
+
+    assert resp.status == 200
+    body = (await resp.text()).split("\n")
+
+    assert 'http_requests_total{route="/api/states",status="200"} 1.0' in body
+    assert 'http_requests_total{route="/api/states",status="401"} 1.0' in body
+    assert 'http_response_bytes_total{route="/api/states"} 100.0' in body
+    assert (
+        'http_request_duration_seconds_bucket{le="0.005",route="/api/states"} 1.0'
+        in body
+    )
+    assert (
+        'http_request_duration_seconds_bucket{le="+Inf",route="/api/states"} 2.0'
+        in body
+    )
+    assert 'http_request_duration_seconds_count{route="/api/states"} 2.0' in body
+
+
 @pytest.fixture(name="mock_client")
 def mock_client_fixture():
     """Mock the prometheus client."""
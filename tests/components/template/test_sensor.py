@@ -15,7 +15,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
 )
 from homeassistant.core import CoreState, callback
-from homeassistant.helpers.template import Template
+from homeassistant.helpers.template import Template, async_enable_render_profiling
 from homeassistant.setup import ATTR_COMPONENT, async_setup_component
 import homeassistant.util.dt as dt_util
 
@@ -53,6 +53,42 @@ async def test_template(hass):
     assert state.state == "It Works."
 
 
+async def test_template_render_profile_owner(hass):
+    """Test renders of the templates are recorded under the sensor."""
+    profile = async_enable_render_profiling(hass)
+    with assert_setup_component(1, sensor.DOMAIN):
+        assert await async_setup_component(
+            hass,
+            sensor.DOMAIN,
+            {
+                "sensor": {
+                    "platform": "template",
+                    "sensors": {
+                        "test_template_sensor": {
+                            "value_template": "It {{ states.sensor.test_state.state }}."
+                        }
+                    },
+                }
+            },
+        )
+
+    await hass.async_block_till_done()
+    await hass.async_start()
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.test_state", "Works")
+    await hass.async_block_till_done()
+
+    stats = profile.templates[
+        (
+            "sensor.test_template_sensor",
+            "It {{ states.sensor.test_state.state }}.",
+        )
+    ]
+    assert stats.renders
+    assert stats.errors == 0
+
+
 async def test_icon_template(hass):
     """Test icon template."""
     with assert_setup_component(1, sensor.DOMAIN):
@@ -1,6 +1,14 @@
 """Tests for WebSocket API commands."""
+import logging
+from unittest.mock import patch
+
 from async_timeout import timeout
+import pytest
 
+from homeassistant.components.http.instrumentation import (
+    DATA_REQUEST_STATS,
+    RequestStats,
+)
 from homeassistant.components.websocket_api import const
 from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH,
@@ -10,9 +18,12 @@ from homeassistant.components.websocket_api.auth import (
 from homeassistant.components.websocket_api.const import URL
 from homeassistant.core import Context, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import entity
+from homeassistant.helpers import entity, template
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+from homeassistant.util import json_encoder
 
 from tests.common import MockEntity, MockEntityPlatform, async_mock_service
 
@@ -320,10 +331,26 @@ async def test_states_filters_visible(hass, hass_admin_user, websocket_client):
     assert msg["result"][0]["entity_id"] == "test.entity"
 
 
-async def test_get_states_not_allows_nan(hass, websocket_client):
-    """Test get_states command not allows NaN floats."""
+@pytest.mark.parametrize("native", [True, False])
+async def test_get_states_not_allows_nan(hass, websocket_client, native):
+    """Test get_states command does not send NaN floats."""
     hass.states.async_set("greeting.hello", "world", {"hello": float("NaN")})
 
+    with patch(
+        "homeassistant.util.json_encoder.orjson",
+        json_encoder.orjson if native else None,
+    ):
+        await websocket_client.send_json({"id": 5, "type": "get_states"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["success"]
+    assert msg["result"][0]["attributes"] == {"hello": None}
+
+
+async def test_get_states_unserializable(hass, websocket_client):
+    """Test get_states command with data that can't be serialized."""
+    hass.states.async_set("greeting.hello", "world", {"hello": object()})
+
     await websocket_client.send_json({"id": 5, "type": "get_states"})
 
     msg = await websocket_client.receive_json()
@@ -394,6 +421,171 @@ async def test_subscribe_unsubscribe_events_state_changed(
     assert msg["event"]["data"]["entity_id"] == "light.permitted"
 
 
+async def test_subscribe_events_filtered(hass, websocket_client):
+    """Test subscribe_events with entity, domain and attribute filters."""
+    init_count = sum(hass.bus.async_listeners().values())
+
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_events",
+            "event_type": "state_changed",
+            "entity_ids": ["light.kitchen"],
+            "domains": ["switch"],
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    await websocket_client.send_json(
+        {
+            "id": 8,
+            "type": "subscribe_events",
+            "event_type": "state_changed",
+            "domains": "sensor",
+            "attributes": ["unit_of_measurement"],
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    # Both subscriptions share a single bus listener
+    assert sum(hass.bus.async_listeners().values()) == init_count + 1
+
+    hass.states.async_set("light.living_room", "on")
+    hass.states.async_set("light.kitchen", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"]["data"]["entity_id"] == "light.kitchen"
+
+    hass.states.async_set("switch.heater", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"]["data"]["entity_id"] == "switch.heater"
+
+    hass.states.async_set("sensor.power", "5", {"unit_of_measurement": "W"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["event"]["data"]["new_state"]["state"] == "5"
+
+    hass.states.async_set("sensor.power", "6", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.power", "6", {"unit_of_measurement": "kW"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["event"]["data"]["new_state"]["attributes"] == {
+        "unit_of_measurement": "kW"
+    }
+
+    for iden, subscription in ((9, 7), (10, 8)):
+        await websocket_client.send_json(
+            {"id": iden, "type": "unsubscribe_events", "subscription": subscription}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+
+    assert sum(hass.bus.async_listeners().values()) == init_count
+
+
+async def test_subscribe_events_attributes_require_state_changed(
+    hass, websocket_client
+):
+    """Test attribute filters are rejected for other event types."""
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_events",
+            "event_type": "call_service",
+            "attributes": ["unit_of_measurement"],
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_INVALID_FORMAT
+
+
+async def test_subscribe_entities(hass, websocket_client, hass_admin_user):
+    """Test subscribe_entities sends a snapshot followed by diffs."""
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy(
+        {"entities": {"entity_ids": {"light.permitted": True, "light.new": True}}}
+    )
+    hass.states.async_set("light.permitted", "off", {"color": "red", "gone": 1})
+    hass.states.async_set("light.not_permitted", "off")
+    original = hass.states.get("light.permitted")
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {
+                "s": "off",
+                "a": {"color": "red", "gone": 1},
+                "c": original.context.id,
+                "lc": original.last_changed.timestamp(),
+            }
+        }
+    }
+
+    hass.states.async_set("light.not_permitted", "on")
+    hass.states.async_set("light.permitted", "on", {"color": "blue"})
+    changed = hass.states.get("light.permitted")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "s": "on",
+                    "a": {"color": "blue"},
+                    "c": changed.context.id,
+                    "lc": changed.last_changed.timestamp(),
+                },
+                "-": {"a": ["gone"]},
+            }
+        }
+    }
+
+    hass.states.async_set("light.new", "on")
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.new"]
+
+    hass.states.async_remove("light.permitted")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": ["light.permitted"]}
+
+
+async def test_subscribe_entities_with_entity_ids(hass, websocket_client):
+    """Test subscribe_entities limited to a set of entities."""
+    hass.states.async_set("light.one", "off")
+    hass.states.async_set("light.two", "off")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "entity_ids": ["light.one"]}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.one"]
+
+    hass.states.async_set("light.two", "on")
+    hass.states.async_set("light.one", "on")
+
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["c"]) == ["light.one"]
+    assert msg["event"]["c"]["light.one"]["+"]["s"] == "on"
+
+
 async def test_render_template_renders_template(hass, websocket_client):
     """Test simple template is rendered and updated."""
     hass.states.async_set("light.test", "on")
@@ -863,3 +1055,181 @@ async def test_test_condition(hass, websocket_client):
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"]["result"] is True
+
+
+async def test_request_stats(hass, websocket_client, hass_admin_user):
+    """Test fetching HTTP request statistics."""
+    await websocket_client.send_json({"id": 5, "type": "http/request_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_FOUND
+
+    stats = hass.data[DATA_REQUEST_STATS] = RequestStats()
+    stats.async_record("/api/states", 200, 100, 0.002)
+    stats.async_record("/api/history/period", 200, 1000, 0.3)
+
+    await websocket_client.send_json({"id": 6, "type": "http/request_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+    assert [route["route"] for route in msg["result"]] == [
+        "/api/history/period",
+        "/api/states",
+    ]
+    assert msg["result"][1]["statuses"] == {"200": 1}
+    assert msg["result"][1]["percentiles"]["p50"] == 0.005
+
+    hass_admin_user.groups = []
+
+    await websocket_client.send_json({"id": 7, "type": "http/request_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_template_render_stats(hass, websocket_client, hass_admin_user):
+    """Test fetching template render statistics."""
+    await websocket_client.send_json({"id": 5, "type": "template/render_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_FOUND
+
+    template.async_enable_render_profiling(hass)
+    tpl = template.Template("{{ 1 + 1 }}", hass)
+    tpl.owner = "sensor.test"
+    tpl.async_render()
+
+    await websocket_client.send_json({"id": 6, "type": "template/render_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+    assert len(msg["result"]) == 1
+    assert msg["result"][0]["owner"] == "sensor.test"
+    assert msg["result"][0]["template"] == "{{ 1 + 1 }}"
+    assert msg["result"][0]["renders"] == 1
+    assert msg["result"][0]["max_size"] == 1
+
+    hass_admin_user.groups = []
+
+    await websocket_client.send_json({"id": 7, "type": "template/render_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_poll_stats(hass, websocket_client, hass_admin_user):
+    """Test fetching entity platform poll statistics."""
+    platform = MockEntityPlatform(hass)
+    await platform.async_add_entities([MockEntity(should_poll=True)])
+
+    await websocket_client.send_json({"id": 5, "type": "entity_platform/poll_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "platform": "test_domain.test_platform",
+            "interval": 15,
+            "polls": 0,
+            "overruns": 0,
+            "average_time": None,
+            "max_time": 0,
+        }
+    ]
+
+    hass_admin_user.groups = []
+
+    await websocket_client.send_json({"id": 6, "type": "entity_platform/poll_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_storage_write_stats(hass, websocket_client, hass_admin_user):
+    """Test fetching storage write statistics."""
+    store = Store(hass, 1, "test-store")
+    with patch.object(store, "_write_data", return_value=20):
+        await store.async_save({"hello": "world"})
+
+    await websocket_client.send_json({"id": 5, "type": "storage/write_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["success"]
+    stats = {store_stats["key"]: store_stats for store_stats in msg["result"]}
+    assert stats["test-store"]["writes"] == 1
+    assert stats["test-store"]["size"] == 20
+
+    hass_admin_user.groups = []
+
+    await websocket_client.send_json({"id": 6, "type": "storage/write_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_update_coordinator_stats(hass, websocket_client, hass_admin_user):
+    """Test fetching update coordinator statistics."""
+
+    async def refresh():
+        return 1
+
+    crd = DataUpdateCoordinator(
+        hass, logging.getLogger(__name__), name="test", update_method=refresh
+    )
+    await crd.async_refresh()
+
+    await websocket_client.send_json({"id": 5, "type": "update_coordinator/stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["success"]
+    assert len(msg["result"]) == 1
+    assert msg["result"][0]["name"] == "test"
+    assert msg["result"][0]["refreshes"] == 1
+    assert msg["result"][0]["failures"] == 0
+
+    hass_admin_user.groups = []
+
+    await websocket_client.send_json({"id": 6, "type": "update_coordinator/stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_startup_trace(hass, websocket_client, hass_admin_user):
+    """Test fetching the startup trace."""
+    await websocket_client.send_json({"id": 5, "type": "startup/trace"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["success"]
+    integrations = {trace["domain"]: trace for trace in msg["result"]["integrations"]}
+    assert integrations["websocket_api"]["success"] is True
+    assert msg["result"]["critical_path"]
+
+    hass_admin_user.groups = []
+
+    await websocket_client.send_json({"id": 6, "type": "startup/trace"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
@@ -80,3 +80,45 @@ async def test_non_json_message(hass, websocket_client, caplog):
         f"Unable to serialize to JSON. Bad data found at $.result[0](state: test_domain.entity).attributes.bad={bad_data}(<class 'object'>"
         in caplog.text
     )
+
+
+async def test_coalesce_messages(hass, no_auth_websocket_client, hass_access_token):
+    """Test queued messages are sent as one frame when negotiated during auth."""
+    await no_auth_websocket_client.send_json(
+        {
+            "type": "auth",
+            "access_token": hass_access_token,
+            "coalesce_messages": True,
+        }
+    )
+    auth_ok = await no_auth_websocket_client.receive_json()
+    assert auth_ok["type"] == "auth_ok"
+
+    await no_auth_websocket_client.send_json(
+        {"id": 5, "type": "subscribe_events", "event_type": "test_event"}
+    )
+    msg = await no_auth_websocket_client.receive_json()
+    assert msg["success"]
+
+    for idx in range(3):
+        hass.bus.async_fire("test_event", {"idx": idx})
+
+    msgs = await no_auth_websocket_client.receive_json()
+    assert [msg["event"]["data"]["idx"] for msg in msgs] == [0, 1, 2]
+
+    await no_auth_websocket_client.send_json(
+        {"id": 6, "type": "websocket/connection_stats"}
+    )
+    msg = await no_auth_websocket_client.receive_json()
+    assert msg["success"]
+    assert len(msg["result"]) == 1
+    stats = msg["result"][0]
+    assert stats["coalesce_messages"] is True
+    assert stats["messages_sent"] == 6
+    assert stats["frames_sent"] == 4
+    assert stats["max_queue_size"] >= 3
+    assert stats["dropped_messages"] == 0
+
+    await no_auth_websocket_client.close()
+    await hass.async_block_till_done()
+    assert hass.data[const.DATA_CONNECTION_STATS] == {}
@@ -31,6 +31,14 @@ async def test_websocket_api(hass, aiohttp_client, hass_access_token, legacy_aut
     state = hass.states.get("sensor.connected_clients")
     assert state.state == "1"
 
+    await hass.helpers.entity_component.async_update_entity(
+        "sensor.websocket_pending_messages"
+    )
+    state = hass.states.get("sensor.websocket_pending_messages")
+    assert state.state == "0"
+    assert state.attributes["dropped_messages"] == 0
+    assert state.attributes["slowest_client"] == "127.0.0.1"
+
     await ws.close()
     await hass.async_block_till_done()
 
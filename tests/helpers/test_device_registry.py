@@ -1061,3 +1061,44 @@ async def test_get_or_create_sets_default_values(hass, registry):
     assert entry.name == "default name 1"
     assert entry.model == "default model 1"
     assert entry.manufacturer == "default manufacturer 1"
+
+
+async def test_entries_follow_updates(hass, registry):
+    """Test looking up devices reflects updates and removals."""
+    entry1 = registry.async_get_or_create(
+        config_entry_id="1234", identifiers={("bridgeid", "0123")}
+    )
+    entry2 = registry.async_get_or_create(
+        config_entry_id="1234", identifiers={("bridgeid", "4567")}
+    )
+    entry2 = registry.async_get_or_create(
+        config_entry_id="5678", identifiers={("bridgeid", "4567")}
+    )
+
+    assert device_registry.async_entries_for_config_entry(registry, "1234") == [
+        entry1,
+        entry2,
+    ]
+    assert device_registry.async_entries_for_config_entry(registry, "5678") == [entry2]
+
+    entry1 = registry.async_update_device(entry1.id, area_id="kitchen")
+
+    assert device_registry.async_entries_for_area(registry, "kitchen") == [entry1]
+
+    registry.async_clear_area_id("kitchen")
+
+    assert device_registry.async_entries_for_area(registry, "kitchen") == []
+
+    registry.async_clear_config_entry("1234")
+
+    assert device_registry.async_entries_for_config_entry(registry, "1234") == []
+    assert device_registry.async_entries_for_config_entry(registry, "5678") == [
+        registry.async_get(entry2.id)
+    ]
+
+    # Restoring a deleted device indexes it again
+    entry1 = registry.async_get_or_create(
+        config_entry_id="1234", identifiers={("bridgeid", "0123")}
+    )
+
+    assert device_registry.async_entries_for_config_entry(registry, "1234") == [entry1]
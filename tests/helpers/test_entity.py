@@ -650,6 +650,56 @@ async def test_capability_attrs(hass):
     assert state.attributes["always"] == "there"
 
 
+async def test_cache_static_attributes(hass):
+    """Test static attributes are only read again when invalidated."""
+    registry = mock_registry(hass)
+    platform = MockEntityPlatform(hass)
+    ent = MockEntity(
+        unique_id="power",
+        name="Power",
+        state="10",
+        unit_of_measurement="W",
+        capability_attributes={"max": 100},
+    )
+    ent.cache_static_attributes = True
+    await platform.async_add_entities([ent])
+
+    state = hass.states.get(ent.entity_id)
+    assert state.state == "10"
+    assert state.attributes == {
+        "max": 100,
+        "unit_of_measurement": "W",
+        "friendly_name": "Power",
+    }
+
+    ent._values.update(state="20", name="Renamed", capability_attributes={})
+    with patch.object(
+        MockEntity, "device_class", PropertyMock(return_value=None)
+    ) as mock_device_class:
+        ent.async_write_ha_state()
+    assert not mock_device_class.called
+
+    state = hass.states.get(ent.entity_id)
+    assert state.state == "20"
+    assert state.attributes["friendly_name"] == "Power"
+    assert state.attributes["max"] == 100
+
+    ent.async_invalidate_static_attributes()
+    ent.async_write_ha_state()
+    state = hass.states.get(ent.entity_id)
+    assert state.attributes == {"unit_of_measurement": "W", "friendly_name": "Renamed"}
+
+    # Updating the registry entry reads them again
+    ent._values["unit_of_measurement"] = "kW"
+    registry.async_update_entity(ent.entity_id, name="From registry")
+    await hass.async_block_till_done()
+    state = hass.states.get(ent.entity_id)
+    assert state.attributes == {
+        "unit_of_measurement": "kW",
+        "friendly_name": "From registry",
+    }
+
+
 async def test_warn_slow_write_state(hass, caplog):
     """Check that we log a warning if reading properties takes too long."""
     mock_entity = entity.Entity()
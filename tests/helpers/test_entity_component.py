@@ -13,6 +13,7 @@ import homeassistant.core as ha
 from homeassistant.exceptions import PlatformNotReady
 from homeassistant.helpers import discovery
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.entity_platform import async_get_polling_scheduler
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
@@ -100,8 +101,7 @@ async def test_setup_does_discovery(mock_setup_component, mock_setup, hass):
     assert ("platform_test", {}, {"msg": "discovery_info"}) == mock_setup.call_args[0]
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
-async def test_set_scan_interval_via_config(mock_track, hass):
+async def test_set_scan_interval_via_config(hass):
     """Test the setting of the scan interval via configuration."""
 
     def platform_setup(hass, config, add_entities, discovery_info=None):
@@ -117,8 +117,9 @@ async def test_set_scan_interval_via_config(mock_track, hass):
     )
 
     await hass.async_block_till_done()
-    assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    scheduler = async_get_polling_scheduler(hass)
+    assert len(scheduler.platforms) == 1
+    assert timedelta(seconds=30) == scheduler.platforms[0].poll_stats.interval
 
 
 async def test_set_entity_namespace_via_config(hass):
@@ -107,6 +107,118 @@ async def test_update_state_adds_entities(hass):
     assert len(hass.states.async_entity_ids()) == 2
 
 
+async def test_polling_spread_over_interval(hass):
+    """Test platforms are polled at their own phase of the interval."""
+    interval = timedelta(seconds=20)
+    offset = entity_platform._poll_offset("test_domain.kitchen", interval)
+    assert offset == entity_platform._poll_offset("test_domain.kitchen", interval)
+    assert offset != entity_platform._poll_offset("test_domain.hallway", interval)
+    assert timedelta(0) <= offset < interval * entity_platform.POLL_JITTER_SPREAD
+
+    platform = MockEntityPlatform(hass, platform_name="kitchen", scan_interval=interval)
+    ent = MockEntity(should_poll=True)
+    ent.async_update = Mock()
+    start = dt_util.utcnow()
+    await platform.async_add_entities([ent])
+    assert platform.poll_name == "test_domain.kitchen"
+
+    async_fire_time_changed(hass, start + interval - offset - timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert not ent.async_update.called
+
+    async_fire_time_changed(hass, start + interval - offset + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert ent.async_update.called
+
+    stats = platform.poll_stats.as_dict()
+    assert stats["platform"] == "test_domain.kitchen"
+    assert stats["interval"] == 20
+    assert stats["polls"] == 1
+    assert entity_platform.async_get_polling_scheduler(hass).as_list() == [stats]
+
+    await platform.async_reset()
+    assert platform.poll_stats is None
+    assert entity_platform.async_get_polling_scheduler(hass).platforms == []
+
+
+async def test_polling_limits_executor_updates(hass):
+    """Test entities updating in the executor share a limit."""
+    scheduler = entity_platform.async_get_polling_scheduler(hass)
+    scheduler.executor_polls = asyncio.Semaphore(1)
+    platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=20))
+    platform.parallel_updates_created = True
+
+    running = []
+    max_running = 0
+
+    async def run_job(target):
+        nonlocal max_running
+        running.append(target)
+        max_running = max(max_running, len(running))
+        await asyncio.sleep(0)
+        running.remove(target)
+
+    def fake_executor_job(target, *args):
+        return hass.loop.create_task(run_job(target))
+
+    entities = [MockEntity(should_poll=True) for _ in range(3)]
+    for ent in entities:
+        ent.update = Mock()
+    await platform.async_add_entities(entities)
+
+    with patch.object(hass, "async_add_executor_job", fake_executor_job):
+        await platform._update_entity_states(dt_util.utcnow())
+
+    assert max_running == 1
+
+
+async def test_polling_backs_off_when_overrunning(hass):
+    """Test the poll interval grows while polls take longer than it."""
+    platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=10))
+    ent = MockEntity(should_poll=True)
+    ent.async_update = Mock()
+    await platform.async_add_entities([ent])
+    stats = platform.poll_stats
+
+    with patch(
+        "homeassistant.helpers.entity_platform.perf_counter", side_effect=[0, 11]
+    ):
+        await platform._update_entity_states(dt_util.utcnow())
+    assert stats.interval == timedelta(seconds=20)
+    assert stats.overruns == 1
+
+    for _ in range(5):
+        with patch(
+            "homeassistant.helpers.entity_platform.perf_counter",
+            side_effect=[0, 1000],
+        ):
+            await platform._update_entity_states(dt_util.utcnow())
+    assert stats.interval == timedelta(seconds=10) * entity_platform.MAX_POLL_BACKOFF
+    assert stats.overruns == 6
+
+    # Fast polls return to the scan interval step by step
+    await platform._update_entity_states(dt_util.utcnow())
+    assert stats.interval == timedelta(seconds=40)
+    await platform._update_entity_states(dt_util.utcnow())
+    await platform._update_entity_states(dt_util.utcnow())
+    await platform._update_entity_states(dt_util.utcnow())
+    assert stats.interval == timedelta(seconds=10)
+    assert stats.polls == 10
+
+    # The next poll uses the current interval
+    ent.async_update.reset_mock()
+    stats.interval = timedelta(seconds=30)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    ent.async_update.reset_mock()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert not ent.async_update.called
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=41))
+    await hass.async_block_till_done()
+    assert ent.async_update.called
+
+
 async def test_update_state_adds_entities_with_update_before_add_true(hass):
     """Test if call update before add to state machine."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -135,8 +247,7 @@ async def test_update_state_adds_entities_with_update_before_add_false(hass):
     assert not ent.update.called
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
-async def test_set_scan_interval_via_platform(mock_track, hass):
+async def test_set_scan_interval_via_platform(hass):
     """Test the setting of the scan interval via platform."""
 
     def platform_setup(hass, config, add_entities, discovery_info=None):
@@ -153,8 +264,9 @@ async def test_set_scan_interval_via_platform(mock_track, hass):
     component.setup({DOMAIN: {"platform": "platform"}})
 
     await hass.async_block_till_done()
-    assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    scheduler = entity_platform.async_get_polling_scheduler(hass)
+    assert len(scheduler.platforms) == 1
+    assert timedelta(seconds=30) == scheduler.platforms[0].poll_stats.interval
 
 
 async def test_adding_entities_with_generator_and_thread_callback(hass):
@@ -805,6 +917,58 @@ async def test_device_info_not_overrides(hass):
     assert device2.model == "test-model"
 
 
+async def test_add_entities_batch(hass):
+    """Test a batch of entities shares device lookups and registry saves."""
+    device_registry = await hass.helpers.device_registry.async_get_registry()
+    entity_registry = await hass.helpers.entity_registry.async_get_registry()
+
+    async def async_setup_entry(hass, config_entry, async_add_entities):
+        """Mock setup entry method."""
+        async_add_entities(
+            [
+                MockEntity(
+                    unique_id=f"sensor-{idx}",
+                    device_info={
+                        "identifiers": {("hue", str(idx // 2))},
+                        "name": f"Device {idx // 2}",
+                    },
+                )
+                for idx in range(6)
+            ]
+        )
+        return True
+
+    platform = MockPlatform(async_setup_entry=async_setup_entry)
+    config_entry = MockConfigEntry(entry_id="super-mock-id")
+    entity_platform = MockEntityPlatform(
+        hass, platform_name=config_entry.domain, platform=platform
+    )
+
+    with patch.object(
+        device_registry,
+        "async_get_or_create",
+        wraps=device_registry.async_get_or_create,
+    ) as mock_get_or_create, patch.object(
+        device_registry._store, "async_delay_save"
+    ) as mock_device_save, patch.object(
+        entity_registry._store, "async_delay_save"
+    ) as mock_entity_save:
+        assert await entity_platform.async_setup_entry(config_entry)
+        await hass.async_block_till_done()
+
+    assert len(hass.states.async_entity_ids()) == 6
+    assert len(mock_get_or_create.mock_calls) == 3
+    assert len(mock_device_save.mock_calls) == 1
+    assert len(mock_entity_save.mock_calls) == 1
+
+    for idx in range(6):
+        device = device_registry.async_get_device({("hue", str(idx // 2))})
+        entity_id = entity_registry.async_get_entity_id(
+            DOMAIN, config_entry.domain, f"sensor-{idx}"
+        )
+        assert entity_registry.async_get(entity_id).device_id == device.id
+
+
 async def test_entity_disabled_by_integration(hass):
     """Test entity disabled by integration."""
     component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
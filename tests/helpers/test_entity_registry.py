@@ -149,6 +149,23 @@ def test_create_triggers_save(hass, registry):
     assert len(mock_schedule_save.mock_calls) == 1
 
 
+def test_defer_save(hass, registry):
+    """Test that deferring saves schedules a single save."""
+    with patch.object(registry._store, "async_delay_save") as mock_delay_save:
+        with registry.async_defer_save():
+            registry.async_get_or_create("light", "hue", "1234")
+            with registry.async_defer_save():
+                registry.async_get_or_create("light", "hue", "5678")
+            assert len(mock_delay_save.mock_calls) == 0
+
+        assert len(mock_delay_save.mock_calls) == 1
+
+        with registry.async_defer_save():
+            pass
+
+        assert len(mock_delay_save.mock_calls) == 1
+
+
 async def test_loading_saving_data(hass, registry):
     """Test that we load/save data correctly."""
     mock_config = MockConfigEntry(domain="light")
@@ -794,3 +811,43 @@ async def test_disabled_entities_excluded_from_entity_list(hass, registry):
         registry, device_entry.id, include_disabled_entities=True
     )
     assert entries == [entry1, entry2]
+
+
+async def test_entries_follow_updates(hass, registry):
+    """Test looking up entries reflects updates and removals."""
+    config_entry = MockConfigEntry(domain="light")
+    entry1 = registry.async_get_or_create(
+        "light", "hue", "1234", config_entry=config_entry, device_id="device-1"
+    )
+    entry2 = registry.async_get_or_create("switch", "hue", "5678")
+
+    assert entity_registry.async_entries_for_config_entry(
+        registry, config_entry.entry_id
+    ) == [entry1]
+    assert entity_registry.async_entries_for_device(registry, "device-1") == [entry1]
+    assert entity_registry.async_entries_for_domain(registry, "switch") == [entry2]
+    assert registry.async_entries_for("platform", "hue") == [entry1, entry2]
+
+    entry1 = registry.async_update_entity(
+        entry1.entity_id, area_id="kitchen", new_entity_id="light.kitchen"
+    )
+    entry2 = registry.async_update_entity(entry2.entity_id, area_id="kitchen")
+
+    assert entity_registry.async_entries_for_area(registry, "kitchen") == [
+        entry1,
+        entry2,
+    ]
+    assert entity_registry.async_entries_for_device(registry, "device-1") == [entry1]
+
+    registry.async_clear_area_id("kitchen")
+
+    assert entity_registry.async_entries_for_area(registry, "kitchen") == []
+    assert registry.async_get(entry1.entity_id).area_id is None
+
+    registry.async_clear_config_entry(config_entry.entry_id)
+
+    assert entity_registry.async_entries_for_device(registry, "device-1") == []
+    assert entity_registry.async_entries_for_domain(registry, "light") == []
+    assert registry.async_entries_for("platform", "hue") == [
+        registry.async_get(entry2.entity_id)
+    ]
@@ -15,14 +15,18 @@ from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    TRACK_FILTERED_EVENT_INDEXES,
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_template_render_scheduler,
+    async_track_filtered_events,
     async_track_point_in_time,
     async_track_point_in_utc_time,
     async_track_same_state,
     async_track_state_added_domain,
+    async_track_state_attribute_change,
     async_track_state_change,
     async_track_state_change_event,
     async_track_state_change_filtered,
@@ -34,6 +38,7 @@ from homeassistant.helpers.event import (
     async_track_time_change,
     async_track_time_interval,
     async_track_utc_time_change,
+    attributes_diff,
     track_point_in_utc_time,
 )
 from homeassistant.helpers.template import Template
@@ -3326,3 +3331,247 @@ async def test_async_track_entity_registry_updated_event_with_empty_list(hass):
 
     unsub_single2()
     unsub_single()
+
+
+async def test_track_filtered_events_routing(hass):
+    """Test events are routed by entity_id and domain."""
+    calls = []
+
+    def record(name):
+        return lambda event: calls.append((name, event.data["entity_id"]))
+
+    unsub_entity = async_track_filtered_events(
+        hass, "state_changed", record("entity"), entity_ids=["Light.Kitchen"]
+    )
+    unsub_both = async_track_filtered_events(
+        hass,
+        "state_changed",
+        record("both"),
+        entity_ids=["light.kitchen"],
+        domains=["light"],
+    )
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.hallway", "on")
+    hass.states.async_set("switch.kitchen", "on")
+    await hass.async_block_till_done()
+
+    assert calls == [
+        ("entity", "light.kitchen"),
+        ("both", "light.kitchen"),
+        ("both", "light.hallway"),
+    ]
+
+    unsub_entity()
+    unsub_both()
+    assert hass.data[TRACK_FILTERED_EVENT_INDEXES] == {}
+
+
+async def test_track_filtered_events_attributes(hass):
+    """Test attribute filters only match changed attributes."""
+    calls = []
+
+    async_track_filtered_events(
+        hass,
+        "state_changed",
+        lambda event: calls.append(event.data["new_state"]),
+        attributes=["brightness", "state"],
+    )
+
+    hass.states.async_set("light.kitchen", "on", {"brightness": 10})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 10, "color": "red"})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 20, "color": "red"})
+    hass.states.async_set("light.kitchen", "off", {"brightness": 20, "color": "red"})
+    hass.states.async_remove("light.kitchen")
+    await hass.async_block_till_done()
+
+    assert [state and state.state for state in calls] == ["on", "on", "off", None]
+
+
+async def test_track_filtered_events_error(hass, caplog):
+    """Test an error in one subscription does not affect others."""
+    calls = []
+
+    def fail(event):
+        raise ValueError
+
+    async_track_filtered_events(hass, "test_event", fail, domains=["light"])
+    async_track_filtered_events(
+        hass, "test_event", calls.append, entity_ids=["light.kitchen"]
+    )
+
+    hass.bus.async_fire("test_event", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test_event", {"no_entity": True})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert "Error while forwarding event for light.kitchen" in caplog.text
+
+
+async def test_track_state_attribute_change(hass):
+    """Test only changes of the tracked attributes of an entity are passed."""
+    kitchen_calls = []
+    hallway_calls = []
+
+    unsub_kitchen = async_track_state_attribute_change(
+        hass,
+        [("Light.Kitchen", "brightness"), ("light.kitchen", "state")],
+        kitchen_calls.append,
+    )
+
+    @callback
+    def hallway_changed(event):
+        hallway_calls.append(event.data["new_state"].attributes["color"])
+
+    async_track_state_attribute_change(
+        hass, [("light.hallway", "color"), ("light.kitchen", "color")], hallway_changed
+    )
+
+    hass.states.async_set("light.kitchen", "on", {"brightness": 10, "color": "red"})
+    hass.states.async_set("light.hallway", "on", {"brightness": 10, "color": "red"})
+    await hass.async_block_till_done()
+    assert len(kitchen_calls) == 1
+    assert hallway_calls == ["red", "red"]
+
+    # The hallway brightness and the kitchen color are tracked by others
+    hass.states.async_set("light.hallway", "on", {"brightness": 20, "color": "red"})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 10, "color": "blue"})
+    await hass.async_block_till_done()
+    assert len(kitchen_calls) == 1
+    assert hallway_calls == ["red", "red", "blue"]
+
+    hass.states.async_set("light.kitchen", "off", {"brightness": 10, "color": "blue"})
+    hass.states.async_set("light.kitchen", "off", {"brightness": 5, "color": "blue"})
+    await hass.async_block_till_done()
+    assert [event.data["new_state"].state for event in kitchen_calls] == [
+        "on",
+        "off",
+        "off",
+    ]
+
+    unsub_kitchen()
+    hass.states.async_set("light.kitchen", "on", {"brightness": 1, "color": "green"})
+    await hass.async_block_till_done()
+    assert len(kitchen_calls) == 3
+    assert hallway_calls == ["red", "red", "blue", "green"]
+
+    assert async_track_state_attribute_change(hass, [], kitchen_calls.append)
+
+
+async def test_track_state_attribute_change_diffs_once(hass):
+    """Test the changed attributes are computed once per event."""
+    calls = []
+    for attribute in ("brightness", "color", "state"):
+        async_track_state_attribute_change(
+            hass, [("light.kitchen", attribute)], calls.append
+        )
+
+    hass.states.async_set("light.kitchen", "on", {"brightness": 10})
+
+    with patch(
+        "homeassistant.helpers.event.attributes_diff", wraps=attributes_diff
+    ) as mock_diff:
+        hass.states.async_set("light.kitchen", "on", {"brightness": 20})
+        await hass.async_block_till_done()
+
+    assert mock_diff.call_count == 1
+    assert len(calls) == 4
+
+
+def test_attributes_diff():
+    """Test the changed and removed attributes of two states."""
+    assert attributes_diff({"a": 1}, {"a": 1}) == ({}, [])
+    assert attributes_diff({"a": 1, "b": 2}, {"a": 3, "c": 4}) == (
+        {"a": 3, "c": 4},
+        ["b"],
+    )
+
+
+async def test_track_template_result_coalesced(hass):
+    """Test a burst of state changes renders a template once."""
+    runs = []
+    template_sum = Template(
+        "{{ states.sensor | map(attribute='state') | map('int') | sum }}", hass
+    )
+
+    def run_callback(event, updates):
+        runs.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass, [TrackTemplate(template_sum, None)], run_callback
+    )
+    await hass.async_block_till_done()
+    scheduler = async_get_template_render_scheduler(hass)
+    renders = scheduler.renders
+
+    for value in range(1, 6):
+        hass.states.async_set(f"sensor.power_{value}", value)
+    await hass.async_block_till_done()
+
+    assert runs == [15]
+    assert scheduler.renders == renders + 1
+    assert scheduler.renders_avoided == 4
+    assert scheduler.stats["pending"] == 0
+
+    hass.states.async_set("sensor.power_1", 10)
+    info.async_remove()
+    await hass.async_block_till_done()
+    assert runs == [15]
+
+
+async def test_template_render_scheduler_cheapest_first(hass):
+    """Test dirty templates are rendered cheapest first within a time budget."""
+    order = []
+
+    def track(name, cost):
+        info = async_track_template_result(
+            hass,
+            [TrackTemplate(Template("{{ states('sensor.source') }}", hass), None)],
+            lambda event, updates: order.append(name),
+        )
+        info.render_cost = cost
+        return info
+
+    track("expensive", 1.0)
+    track("cheap", 0.001)
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.source", "on")
+    await hass.async_block_till_done()
+    assert order == ["cheap", "expensive"]
+
+    order.clear()
+    with patch("homeassistant.helpers.event.TEMPLATE_RENDER_FLUSH_BUDGET", -1):
+        hass.states.async_set("sensor.source", "off")
+        await hass.async_block_till_done()
+    # Everything past the budget is rendered in the next flush
+    assert sorted(order) == ["cheap", "expensive"]
+
+
+async def test_template_render_scheduler_min_interval(hass):
+    """Test dirty templates wait for the minimum interval between flushes."""
+    runs = []
+    scheduler = async_get_template_render_scheduler(hass)
+    scheduler.min_interval = 5
+
+    async_track_template_result(
+        hass,
+        [TrackTemplate(Template("{{ states('sensor.source') }}", hass), None)],
+        lambda event, updates: runs.append(updates.pop().result),
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.source", "1")
+    await hass.async_block_till_done()
+    assert runs == [1]
+    runs.clear()
+
+    hass.states.async_set("sensor.source", "2")
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.source", "3")
+    await hass.async_block_till_done()
+    assert runs == []
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=6))
+    await hass.async_block_till_done()
+    assert runs == [3]
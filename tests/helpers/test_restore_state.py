@@ -1,5 +1,5 @@
 """The tests for the Restore component."""
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import patch
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START
@@ -9,6 +9,7 @@ from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE_TASK,
     STORAGE_KEY,
+    STORAGE_KEY_JOURNAL,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -271,3 +272,101 @@ async def test_restoring_invalid_entity_id(hass, hass_storage):
 
     state = await entity.async_get_last_state()
     assert state is None
+
+
+async def test_dump_changed_states(hass, hass_storage):
+    """Test only changed states are journaled between full dumps."""
+    for idx in range(6):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{idx}"
+        await entity.async_internal_added_to_hass()
+        hass.states.async_set(entity.entity_id, "on")
+
+    data = await RestoreStateData.async_get_instance(hass)
+
+    # The first dump writes all states
+    await data.async_dump_changed_states()
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 6
+    assert hass_storage[STORAGE_KEY_JOURNAL]["data"] == {"states": [], "removed": {}}
+    hass_storage[STORAGE_KEY]["data"] = "full dump"
+
+    hass.states.async_set("input_boolean.b0", "off")
+    await entity.async_remove()
+    await data.async_dump_changed_states()
+
+    # The state of a removed entity is kept until it expires
+    assert hass_storage[STORAGE_KEY]["data"] == "full dump"
+    journal = hass_storage[STORAGE_KEY_JOURNAL]["data"]
+    assert [
+        (item["state"]["entity_id"], item["state"]["state"])
+        for item in journal["states"]
+    ] == [("input_boolean.b0", "off"), ("input_boolean.b5", "on")]
+    assert journal["removed"] == {}
+
+    # Nothing changed since the last dump
+    await data.async_dump_changed_states()
+    assert hass_storage[STORAGE_KEY_JOURNAL]["data"] == journal
+
+    # An entity that does not restore its state took over the entity ID
+    hass.states.async_set("input_boolean.b5", "off")
+    await data.async_dump_changed_states()
+
+    journal = hass_storage[STORAGE_KEY_JOURNAL]["data"]
+    assert [item["state"]["entity_id"] for item in journal["states"]] == [
+        "input_boolean.b0"
+    ]
+    assert list(journal["removed"]) == ["input_boolean.b5"]
+
+    # All states are dumped again when many of them changed
+    hass.states.async_set("input_boolean.b1", "off")
+    hass.states.async_set("input_boolean.b2", "off")
+    await data.async_dump_changed_states()
+
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 5
+    assert hass_storage[STORAGE_KEY_JOURNAL]["data"] == {"states": [], "removed": {}}
+
+
+async def test_load_journal(hass, hass_storage):
+    """Test journaled states are applied to the last full dump."""
+    before = dt_util.utcnow() - timedelta(hours=1)
+    now = dt_util.utcnow()
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [
+            StoredState(State("input_boolean.b0", "on"), now).as_dict(),
+            StoredState(State("input_boolean.b1", "on"), before).as_dict(),
+            StoredState(State("input_boolean.b2", "on"), before).as_dict(),
+            StoredState(State("input_boolean.b3", "on"), now).as_dict(),
+        ],
+    }
+    hass_storage[STORAGE_KEY_JOURNAL] = {
+        "version": 1,
+        "key": STORAGE_KEY_JOURNAL,
+        "data": {
+            "states": [
+                # Older than the full dump
+                StoredState(State("input_boolean.b0", "off"), before).as_dict(),
+                StoredState(State("input_boolean.b1", "off"), now).as_dict(),
+                StoredState(State("input_boolean.b4", "off"), now).as_dict(),
+            ],
+            "removed": {
+                "input_boolean.b2": now.isoformat(),
+                # Older than the full dump
+                "input_boolean.b3": before.isoformat(),
+            },
+        },
+    }
+
+    data = await RestoreStateData.async_get_instance(hass)
+
+    assert {
+        entity_id: stored_state.state.state
+        for entity_id, stored_state in data.last_states.items()
+    } == {
+        "input_boolean.b0": "on",
+        "input_boolean.b1": "off",
+        "input_boolean.b3": "on",
+        "input_boolean.b4": "off",
+    }
@@ -12,7 +12,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import CoreState
 from homeassistant.helpers import storage
-from homeassistant.util import dt
+from homeassistant.util import dt, json as json_util
 
 from tests.common import async_fire_time_changed
 
@@ -279,3 +279,50 @@ async def test_migrator_transforming_config(hass, store, hass_storage):
         "version": MOCK_VERSION,
         "data": data,
     }
+
+
+async def test_concurrent_writes_are_batched(hass, hass_storage):
+    """Test stores saving at the same time are written by one executor job."""
+    store1 = storage.Store(hass, MOCK_VERSION, "store-1")
+    store2 = storage.Store(hass, MOCK_VERSION, "store-2")
+
+    with patch.object(
+        hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+    ) as mock_executor_job:
+        await asyncio.gather(
+            store1.async_save(MOCK_DATA), store2.async_save(MOCK_DATA2)
+        )
+
+    assert len(mock_executor_job.mock_calls) == 1
+    assert hass_storage["store-1"]["data"] == MOCK_DATA
+    assert hass_storage["store-2"]["data"] == MOCK_DATA2
+
+    stats = storage.async_get_storage_writer(hass).stats
+    assert stats["store-1"].writes == 1
+    assert stats["store-2"].writes == 1
+
+
+async def test_write_stats(hass):
+    """Test the size and errors of writes are recorded per store."""
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+
+    with patch.object(store, "_write_data", return_value=42):
+        await store.async_save(MOCK_DATA)
+
+    with patch.object(
+        store, "_write_data", side_effect=json_util.WriteError("disk full")
+    ):
+        await store.async_save(MOCK_DATA2)
+
+    writer = storage.async_get_storage_writer(hass)
+    stats = writer.stats[MOCK_KEY]
+    assert writer.as_list() == [
+        {
+            "key": MOCK_KEY,
+            "writes": 2,
+            "errors": 1,
+            "average_time": round(stats.total_time / 2, 6),
+            "max_time": round(stats.max_time, 6),
+            "size": 42,
+        }
+    ]
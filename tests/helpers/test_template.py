@@ -1,9 +1,11 @@
 """Test Home Assistant template helper methods."""
+from ast import literal_eval
 from datetime import datetime
 import math
 import random
 from unittest.mock import patch
 
+import jinja2
 import pytest
 import pytz
 import voluptuous as vol
@@ -2055,35 +2057,51 @@ def test_urlencode(hass):
     assert tpl.async_render() == "the%20quick%20brown%20fox%20%3D%20true"
 
 
-async def test_cache_garbage_collection():
-    """Test caching a template."""
+async def test_compiled_template_cache(hass):
+    """Test templates with the same source share the compiled code."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
-    tpl = template.Template(
-        (template_string),
-    )
+    cache = template._COMPILED_TEMPLATE_CACHE  # pylint: disable=protected-access
+    cache.clear()
+
+    tpl = template.Template(template_string)
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert cache.info() == {
+        "hits": 0,
+        "misses": 1,
+        "size": 1,
+        "maxsize": template.COMPILED_TEMPLATE_CACHE_SIZE,
+    }
 
-    tpl2 = template.Template(
-        (template_string),
-    )
+    tpl2 = template.Template(template_string)
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert template.compiled_template_cache_info()["hits"] == 1
 
+    # Compiled code outlives the templates so reloads do not compile again
     del tpl
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
     del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert cache.get((False, template_string))
+
+    # Environments with hass are cached separately
+    tpl3 = template.Template(template_string, hass)
+    assert tpl3.async_render() == "foo=x%26y&bar=42"
+    assert template.compiled_template_cache_info()["size"] == 2
+
+
+def test_compiled_template_cache_size():
+    """Test the least recently used code is removed."""
+    cache = template.CompiledTemplateCache(2)
+    code = compile("1", "<test>", "eval")
+    cache.set("a", code)
+    cache.set("b", code)
+    assert cache.get("a") is code
+    cache.set("c", code)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is code
+    assert cache.get("c") is code
+    assert cache.info() == {"hits": 3, "misses": 1, "size": 2, "maxsize": 2}
 
 
 def test_is_template_string():
@@ -2434,3 +2452,175 @@ async def test_parse_result(hass):
         ("0011101.00100001010001", "0011101.00100001010001"),
     ):
         assert template.Template(tpl, hass).async_render() == result
+
+
+@pytest.mark.parametrize(
+    "template_string, dependencies",
+    [
+        ("{{ 5 * 60 }}", set()),
+        ("{% set x = 3 %}{% for i in range(x) %}{{ loop.index }}{% endfor %}", set()),
+        ("{{ float('1.5') | round }}", set()),
+        ("{{ states('sensor.temperature') }}", {template.TEMPLATE_DEPENDS_STATES}),
+        ("{{ 'group.all' | expand | list }}", {template.TEMPLATE_DEPENDS_STATES}),
+        ("{{ now().hour }}", {template.TEMPLATE_DEPENDS_TIME}),
+        ("{{ [1, 2] | random }}", {template.TEMPLATE_DEPENDS_RANDOM}),
+        ("{{ trigger.to_state.state }}", {template.TEMPLATE_DEPENDS_VARIABLES}),
+        (
+            "{% macro double(x) %}{{ x * 2 }}{% endmacro %}{{ double(value) }}",
+            {template.TEMPLATE_DEPENDS_VARIABLES},
+        ),
+        (
+            "{{ is_state('light.kitchen', 'on') and utcnow() }}",
+            {template.TEMPLATE_DEPENDS_STATES, template.TEMPLATE_DEPENDS_TIME},
+        ),
+    ],
+)
+def test_template_dependencies(hass, template_string, dependencies):
+    """Test classifying what a template depends on."""
+    assert template.Template(template_string, hass).dependencies == dependencies
+
+
+def test_static_template_dependencies(hass):
+    """Test static templates have no dependencies."""
+    assert template.Template("hello", hass).dependencies == set()
+
+
+def test_constant_template_rendered_once(hass):
+    """Test a template without dependencies is only rendered once."""
+    tpl = template.Template("{{ 5 * 60 }}", hass)
+    assert tpl.async_render() == 300
+
+    with patch.object(jinja2.Template, "render") as mock_render:
+        assert tpl.async_render() == 300
+        assert tpl.async_render(parse_result=False) == "300"
+
+    assert not mock_render.called
+
+
+def test_template_with_dependencies_rendered(hass):
+    """Test a template with dependencies is rendered every time."""
+    tpl = template.Template("{{ states('sensor.temperature') }}", hass)
+    hass.states.async_set("sensor.temperature", "10")
+    assert tpl.async_render() == 10
+    hass.states.async_set("sensor.temperature", "20")
+    assert tpl.async_render() == 20
+
+
+def test_parse_result_cached(hass):
+    """Test parsing the same render result again is skipped."""
+    tpl = template.Template("{{ value }}", hass)
+
+    with patch(
+        "homeassistant.helpers.template.literal_eval", wraps=literal_eval
+    ) as mock_literal_eval:
+        assert tpl.async_render({"value": "on"}) == "on"
+        assert mock_literal_eval.call_count == 0
+
+        assert tpl.async_render({"value": "12.5"}) == 12.5
+        assert tpl.async_render({"value": "12.5"}) == 12.5
+        assert mock_literal_eval.call_count == 1
+
+        # Mutable results are parsed every time
+        assert tpl.async_render({"value": "[1, 2]"}) == [1, 2]
+        assert tpl.async_render({"value": "[1, 2]"}) == [1, 2]
+        assert mock_literal_eval.call_count == 3
+
+        assert tpl.async_render({"value": "True"}) is True
+
+
+def test_render_profiling(hass):
+    """Test render statistics are collected per owner and template."""
+    tpl = template.Template("{{ value }}", hass)
+    tpl.owner = "sensor.test"
+    other = template.Template("{{ value }}", hass)
+    failing = template.Template("{{ value | float(1) + 'x' }}", hass)
+
+    tpl.async_render({"value": "1"})
+    assert template.async_get_render_profile(hass) is None
+
+    profile = template.async_enable_render_profiling(hass)
+    assert template.async_enable_render_profiling(hass) is profile
+    assert template.async_get_render_profile(hass) is profile
+
+    tpl.async_render({"value": "1"})
+    tpl.async_render({"value": "12345"})
+    tpl.async_render_to_info({"value": "123"})
+    other.async_render({"value": "1"})
+    assert other.async_render_with_possible_json_value("12") == "12"
+    with pytest.raises(TemplateError):
+        failing.async_render({"value": "1"})
+
+    stats = profile.templates[("sensor.test", "{{ value }}")]
+    assert stats.renders == 3
+    assert stats.errors == 0
+    assert stats.max_size == 5
+    assert stats.max_time > 0
+    assert stats.total_time >= stats.max_time
+
+    data = stats.as_dict()
+    assert data["owner"] == "sensor.test"
+    assert data["template"] == "{{ value }}"
+    assert data["average_size"] == 3
+
+    assert profile.templates[(None, "{{ value }}")].renders == 2
+    failing_stats = profile.templates[(None, failing.template)]
+    assert failing_stats.renders == 1
+    assert failing_stats.errors == 1
+    assert failing_stats.as_dict()["average_size"] == 0
+    assert len(profile.as_list()) == 3
+
+    assert template.async_disable_render_profiling(hass) is profile
+    assert template.async_get_render_profile(hass) is None
+
+    tpl.async_render({"value": "1"})
+    assert stats.renders == 3
+
+
+def test_template_states_reused(hass):
+    """Test template state wrappers are reused until the state changes."""
+    hass.states.async_set("sensor.power_1", "10")
+    hass.states.async_set("sensor.power_2", "20")
+
+    wrapper = template._get_state(hass, "sensor.power_1")
+    assert template._get_state(hass, "sensor.power_1") is wrapper
+
+    iterated = list(template.AllStates(hass).sensor)
+    assert [state.entity_id for state in iterated] == [
+        "sensor.power_1",
+        "sensor.power_2",
+    ]
+    assert [state.entity_id for state in template.AllStates(hass).sensor] == [
+        "sensor.power_1",
+        "sensor.power_2",
+    ]
+    assert list(template.AllStates(hass).sensor)[0] is iterated[0]
+    # Iterated states do not collect, so they are not shared with lookups
+    assert iterated[0] is not wrapper
+
+    hass.states.async_set("sensor.power_1", "11")
+    updated = template._get_state(hass, "sensor.power_1")
+    assert updated is not wrapper
+    assert updated.state == "11"
+    assert list(template.AllStates(hass))[0].state == "11"
+
+    tpl = template.Template(
+        "{{ states.sensor | map(attribute='state') | map('int') | sum }}", hass
+    )
+    assert tpl.async_render() == 31
+
+
+def test_template_states_removed(hass):
+    """Test wrappers of removed entities are dropped."""
+    for idx in range(5):
+        hass.states.async_set(f"sensor.temp_{idx}", idx)
+        template._get_state(hass, f"sensor.temp_{idx}")
+
+    for idx in range(5):
+        hass.states.async_remove(f"sensor.temp_{idx}")
+        assert template._get_state(hass, f"sensor.temp_{idx}") is None
+
+    hass.states.async_set("sensor.new", "on")
+    template._get_state(hass, "sensor.new")
+
+    cache = hass.data[template._TEMPLATE_STATES][True]
+    assert list(cache) == ["sensor.new"]
@@ -284,3 +284,121 @@ async def test_async_set_updated_data(crd):
     crd.async_set_updated_data(300)
     # We have created a new refresh listener
     assert crd._unsub_refresh is not old_refresh
+
+
+async def test_refresh_stats(crd):
+    """Test refreshes are recorded in the statistics."""
+    await crd.async_refresh()
+    crd.update_method = AsyncMock(side_effect=update_coordinator.UpdateFailed)
+    await crd.async_refresh()
+
+    assert crd.stats.refreshes == 2
+    assert crd.stats.failures == 1
+    data = crd.stats.as_dict()
+    assert data["name"] == "test"
+    assert data["refreshes"] == 2
+    assert data["failures"] == 1
+
+    coordinators = update_coordinator.async_get_update_coordinators(crd.hass)
+    assert crd in coordinators.coordinators
+
+
+async def test_skip_unchanged_data(hass):
+    """Test listeners are not called for unchanged data."""
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        name="test",
+        update_method=AsyncMock(return_value=1),
+        update_interval=DEFAULT_UPDATE_INTERVAL,
+        always_update=False,
+    )
+    updates = []
+    crd.async_add_listener(lambda: updates.append(crd.data))
+
+    await crd.async_refresh()
+    await crd.async_refresh()
+    assert updates == [1]
+    assert crd.stats.unchanged == 1
+
+    crd.update_method.return_value = 2
+    await crd.async_refresh()
+    assert updates == [1, 2]
+
+    # Listeners are called when recovering with the same data
+    crd.update_method.side_effect = update_coordinator.UpdateFailed
+    await crd.async_refresh()
+    crd.update_method.side_effect = None
+    await crd.async_refresh()
+    assert updates == [1, 2, 2, 2]
+
+
+async def test_backoff(hass):
+    """Test the update interval backs off on failures and unchanged data."""
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        name="test",
+        update_method=AsyncMock(return_value=1),
+        update_interval=DEFAULT_UPDATE_INTERVAL,
+        max_update_interval=timedelta(seconds=30),
+    )
+    updates = []
+    crd.async_add_listener(lambda: updates.append(crd.data))
+
+    await crd.async_refresh()
+    assert crd.current_update_interval == DEFAULT_UPDATE_INTERVAL
+
+    await crd.async_refresh()
+    assert crd.current_update_interval == timedelta(seconds=20)
+    # Listeners are still called by default
+    assert updates == [1, 1]
+
+    crd.update_method.side_effect = update_coordinator.UpdateFailed
+    await crd.async_refresh()
+    assert crd.current_update_interval == timedelta(seconds=30)
+    await crd.async_refresh()
+    assert crd.current_update_interval == timedelta(seconds=30)
+    assert crd.stats.interval == timedelta(seconds=30)
+
+    crd.update_method.side_effect = None
+    crd.update_method.return_value = 2
+    await crd.async_refresh()
+    assert crd.current_update_interval == DEFAULT_UPDATE_INTERVAL
+
+    crd.async_set_updated_data(2)
+    await crd.async_refresh()
+    assert crd.current_update_interval == timedelta(seconds=20)
+    crd.async_set_updated_data(3)
+    assert crd.current_update_interval == DEFAULT_UPDATE_INTERVAL
+
+
+async def test_group_limits_parallel_updates(hass):
+    """Test coordinators in a group don't fetch data at the same time."""
+    running = 0
+    max_running = 0
+
+    async def refresh():
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return 1
+
+    crds = [
+        update_coordinator.DataUpdateCoordinator[int](
+            hass,
+            _LOGGER,
+            name=f"test {idx}",
+            update_method=refresh,
+            group="host",
+            group_parallel_updates=2,
+        )
+        for idx in range(5)
+    ]
+    await asyncio.gather(*(crd.async_refresh() for crd in crds))
+
+    assert max_running == 2
+    assert all(crd.data == 1 for crd in crds)
+    assert crds[0].stats.as_dict()["group"] == "host"
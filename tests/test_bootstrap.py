@@ -1,6 +1,7 @@
 """Test the bootstrapping."""
 # pylint: disable=protected-access
 import asyncio
+from datetime import timedelta
 import os
 from unittest.mock import Mock, patch
 
@@ -9,11 +10,17 @@ import pytest
 from homeassistant import bootstrap, core, runner
 import homeassistant.config as config_util
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.setup import (
+    SETUP_REPORT_SAVE_DELAY,
+    STORAGE_KEY_SETUP_REPORT,
+    async_get_setup_trace,
+)
 import homeassistant.util.dt as dt_util
 
 from tests.common import (
     MockModule,
     MockPlatform,
+    async_fire_time_changed,
     get_test_config_dir,
     mock_coro,
     mock_entity_platform,
@@ -78,6 +85,24 @@ async def test_empty_setup(hass):
         assert domain in hass.config.components, domain
 
 
+async def test_setup_report(hass, hass_storage):
+    """Test the setup trace is saved after setting up."""
+    await bootstrap.async_from_config_dict({"group": {}}, hass)
+
+    setup_trace = async_get_setup_trace(hass)
+    assert set(setup_trace.stages) == {"core", "resolve", "stage_2", "wrap_up"}
+    assert setup_trace.integrations["group"].success is True
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=SETUP_REPORT_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    report = hass_storage[STORAGE_KEY_SETUP_REPORT]["data"]
+    assert report["critical_path"]
+    assert "group" in {trace["domain"] for trace in report["integrations"]}
+
+
 async def test_core_failure_loads_safe_mode(hass, caplog):
     """Test failing core setup aborts further setup."""
     with patch(
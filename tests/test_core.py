@@ -3,6 +3,7 @@
 import asyncio
 from datetime import datetime, timedelta
 import functools
+import json
 import logging
 import os
 from tempfile import TemporaryDirectory
@@ -574,6 +575,39 @@ async def test_statemachine_entity_ids(hass):
     assert states == ["light.bowl", "switch.ac"]
 
 
+async def test_statemachine_all_json(hass):
+    """Test the serialized snapshot of all states."""
+    assert hass.states.async_all_json() == b"[]"
+
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    hass.states.async_set("switch.fan", "off")
+    version = hass.states.version
+
+    snapshot = hass.states.async_all_json()
+    assert json.loads(snapshot) == [
+        hass.states.get("light.bowl").as_dict(),
+        hass.states.get("switch.fan").as_dict(),
+    ]
+    assert hass.states.async_all_json() is snapshot
+
+    # Setting the same state does not invalidate the snapshot
+    hass.states.async_set("switch.fan", "off")
+    assert hass.states.version == version
+    assert hass.states.async_all_json() is snapshot
+
+    fan_json = hass.states.get("switch.fan").as_dict_json
+    hass.states.async_set("light.bowl", "off")
+    assert hass.states.version == version + 1
+    assert json.loads(hass.states.async_all_json())[0]["state"] == "off"
+    assert hass.states.get("switch.fan").as_dict_json is fan_json
+
+    hass.states.async_remove("light.bowl")
+    assert hass.states.version == version + 2
+    assert json.loads(hass.states.async_all_json()) == [
+        hass.states.get("switch.fan").as_dict()
+    ]
+
+
 async def test_statemachine_remove(hass):
     """Test remove method."""
     hass.states.async_set("light.bowl", "on", {})
@@ -1461,6 +1495,54 @@ async def test_async_entity_ids_count(hass):
     assert hass.states.async_entity_ids_count() == 5
     assert hass.states.async_entity_ids_count("light") == 3
 
+    hass.states.async_remove("vacuum.floor")
+
+    assert hass.states.async_entity_ids_count() == 4
+    assert hass.states.async_entity_ids_count("vacuum") == 0
+
+
+async def test_async_all_sorted(hass):
+    """Test async_all_sorted keeps the order until entities change."""
+    hass.states.async_set("switch.link", "on")
+    hass.states.async_set("light.frog", "on")
+    hass.states.async_set("light.bowl", "on")
+
+    assert [state.entity_id for state in hass.states.async_all_sorted()] == [
+        "light.bowl",
+        "light.frog",
+        "switch.link",
+    ]
+    assert [state.entity_id for state in hass.states.async_all_sorted("LIGHT")] == [
+        "light.bowl",
+        "light.frog",
+    ]
+    assert hass.states.async_all_sorted("vacuum") == []
+
+    # Updated states are returned without sorting again
+    with patch("homeassistant.core.sorted", create=True) as mock_sorted:
+        hass.states.async_set("light.frog", "off")
+        states = hass.states.async_all_sorted("light")
+    assert not mock_sorted.called
+    assert states[1] is hass.states.get("light.frog")
+    assert states[1].state == "off"
+
+    hass.states.async_set("light.ant", "on")
+    assert [state.entity_id for state in hass.states.async_all_sorted("light")] == [
+        "light.ant",
+        "light.bowl",
+        "light.frog",
+    ]
+    assert hass.states.async_all_sorted()[0].entity_id == "light.ant"
+
+    hass.states.async_remove("light.bowl")
+    hass.states.async_remove("switch.link")
+    assert [state.entity_id for state in hass.states.async_all_sorted()] == [
+        "light.ant",
+        "light.frog",
+    ]
+    assert hass.states.async_all_sorted("switch") == []
+    assert hass.states.async_entity_ids("light") == ["light.frog", "light.ant"]
+
 
 async def test_hassjob_forbid_coroutine():
     """Test hassjob forbids coroutines."""
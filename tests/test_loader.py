@@ -6,6 +6,7 @@ import pytest
 from homeassistant import core, loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
 
 from tests.common import MockModule, async_mock_service, mock_integration
 
@@ -449,3 +450,82 @@ async def test_get_custom_components_safe_mode(hass):
     """Test that we get empty custom components in safe mode."""
     hass.config.safe_mode = True
     assert await loader.async_get_custom_components(hass) == {}
+
+
+async def test_get_integration_from_manifest_index(hass):
+    """Test built-in integrations are resolved from the manifest index."""
+    manifest = {"domain": "hue", "name": "Indexed Hue", "dependencies": []}
+    with patch(
+        "homeassistant.loader._load_manifest_index", return_value={"hue": manifest}
+    ), patch("homeassistant.loader.Integration.resolve_from_root") as mock_resolve:
+        integration = await loader.async_get_integration(hass, "hue")
+        http_integration = await loader.async_get_integration(hass, "http")
+
+    assert integration.name == "Indexed Hue"
+    assert integration.is_built_in
+    assert integration.get_component() == hue
+    assert "is_built_in" not in manifest
+
+    # Integrations missing from the index are read from disk
+    assert mock_resolve.mock_calls[0][1][2] == "http"
+    assert http_integration is mock_resolve.return_value
+
+    resolve_times = loader.async_get_resolve_times(hass)
+    assert set(resolve_times) == {"hue", "http"}
+
+
+def test_load_manifest_index(tmp_path):
+    """Test loading the manifest index."""
+    index = loader._load_manifest_index()
+    assert index["hue"]["domain"] == "hue"
+
+    index_path = tmp_path / "manifests.json"
+    with patch("homeassistant.loader.MANIFEST_INDEX_PATH", index_path):
+        assert loader._load_manifest_index() == {}
+
+        index_path.write_text('{"version": 0, "manifests": {"hue": {}}}')
+        assert loader._load_manifest_index() == {}
+
+
+async def test_custom_components_manifest_cache(hass):
+    """Test manifests of custom integrations are cached by modification time."""
+    # pylint: disable=protected-access
+    assert loader._async_mount_config_dir(hass)
+    import custom_components
+
+    integrations, cache = loader._resolve_custom_components(hass, custom_components, {})
+    assert set(integrations) == {"test", "test_package"}
+    assert len(cache) == 2
+
+    for entry in cache.values():
+        entry["manifest"] = {**entry["manifest"], "name": "Cached"}
+    integrations, new_cache = loader._resolve_custom_components(
+        hass, custom_components, cache
+    )
+    assert integrations["test_package"].name == "Cached"
+    assert new_cache == cache
+
+    for entry in cache.values():
+        entry["mtime"] -= 1
+    integrations, new_cache = loader._resolve_custom_components(
+        hass, custom_components, cache
+    )
+    assert integrations["test_package"].name == "Test Package"
+    assert new_cache != cache
+
+
+async def test_get_custom_components_saves_cache(
+    hass, hass_storage, enable_custom_integrations
+):
+    """Test the manifests of custom integrations are stored after startup."""
+    hass.state = core.CoreState.not_running
+    with patch("homeassistant.loader.MANIFEST_CACHE_SAVE_DELAY", 0):
+        integrations = await loader.async_get_custom_components(hass)
+        await hass.async_block_till_done()
+        assert loader.STORAGE_KEY_MANIFEST_CACHE not in hass_storage
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+
+    assert set(integrations) == {"test", "test_package"}
+    assert len(hass_storage[loader.STORAGE_KEY_MANIFEST_CACHE]["data"]) == 2
@@ -596,3 +596,54 @@ async def test_integration_disabled(hass, caplog):
     result = await setup.async_setup_component(hass, "test_component1", {})
     assert not result
     assert disabled_reason in caplog.text
+
+
+async def test_setup_trace(hass):
+    """Test setting up integrations is traced."""
+
+    async def async_setup_slow(hass, config):
+        await asyncio.sleep(0)
+        return True
+
+    mock_integration(hass, MockModule("trace_dep", async_setup=async_setup_slow))
+    mock_integration(hass, MockModule("trace_comp", dependencies=["trace_dep"]))
+    mock_integration(
+        hass, MockModule("trace_failing", async_setup=Mock(return_value=False))
+    )
+
+    assert await setup.async_setup_component(hass, "trace_comp", {})
+    assert not await setup.async_setup_component(hass, "trace_failing", {})
+
+    setup_trace = setup.async_get_setup_trace(hass)
+    comp_trace = setup_trace.integrations["trace_comp"]
+    assert comp_trace.success is True
+    assert comp_trace.dependencies == ["trace_dep"]
+    assert comp_trace.dependency_wait > 0
+    assert comp_trace.started < comp_trace.finished
+    assert setup_trace.integrations["trace_dep"].setup_time > 0
+    assert setup_trace.integrations["trace_failing"].success is False
+
+    report = setup.async_get_setup_report(hass)
+    assert report["critical_path"] == ["trace_failing"]
+    integrations = {trace["domain"]: trace for trace in report["integrations"]}
+    assert integrations["trace_comp"]["dependencies"] == ["trace_dep"]
+    assert integrations["trace_comp"]["own_time"] >= 0
+
+
+def test_setup_trace_critical_path():
+    """Test the critical path follows the dependency that finished last."""
+    setup_trace = setup.SetupTrace()
+    for domain, finished, dependencies in (
+        ("http", 1.0, []),
+        ("frontend", 3.0, ["http"]),
+        ("api", 2.0, ["http"]),
+        ("config", 4.0, ["frontend", "api"]),
+        ("zwave", 3.5, []),
+        ("never_finished", None, []),
+    ):
+        trace = setup_trace.async_get(domain)
+        trace.finished = finished
+        trace.dependencies = dependencies
+
+    assert setup_trace.critical_path() == ["http", "frontend", "config"]
+    assert setup.SetupTrace().critical_path() == []
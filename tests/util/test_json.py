@@ -48,15 +48,24 @@ def _path_for(leaf_name):
 def test_save_and_load():
     """Test saving and loading back."""
     fname = _path_for("test1")
-    save_json(fname, TEST_JSON_A)
+    size = save_json(fname, TEST_JSON_A)
     data = load_json(fname)
     assert data == TEST_JSON_A
+    assert size == os.path.getsize(fname)
 
 
 # Skipped on Windows
 @unittest.skipIf(
     sys.platform.startswith("win"), "private permissions not supported on Windows"
 )
+def test_save_indented():
+    """Test saved files are indented with four spaces."""
+    fname = _path_for("test5")
+    save_json(fname, {"a": {"b": 1}})
+    with open(fname, encoding="utf-8") as fdesc:
+        assert fdesc.read() == '{\n    "a": {\n        "b": 1\n    }\n}'
+
+
 def test_save_and_load_private():
     """Test we can load private files and that they are protected."""
     fname = _path_for("test2")
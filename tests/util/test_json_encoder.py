@@ -0,0 +1,67 @@
+"""Test the fast JSON serialization of Home Assistant objects."""
+import datetime
+import json
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant import core
+from homeassistant.helpers.json import JSONEncoder as HAJSONEncoder
+from homeassistant.util import dt as dt_util, json_encoder
+from homeassistant.util.json_encoder import json_bytes, json_dumps
+
+
+@pytest.mark.parametrize("native", [True, False])
+def test_json_bytes(native):
+    """Test the native and standard library encoders produce the same output."""
+    now = dt_util.utcnow()
+    naive = datetime.datetime(2021, 1, 2, 3, 4, 5, 6)
+    state = core.State("test.test", "hello", {"list": (1, 2), "wörd": "ünicode"})
+    event = core.Event("test_event", {"set": {1}, 1: "int key"})
+    data = {"now": now, "naive": naive, "state": state, "event": event}
+
+    with patch.object(json_encoder, "orjson", json_encoder.orjson if native else None):
+        result = json_bytes(data)
+        assert json_dumps(data) == result.decode("utf-8")
+
+    assert json.loads(result) == {
+        "now": now.isoformat(),
+        "naive": naive.isoformat(),
+        "state": json.loads(json.dumps(state, cls=HAJSONEncoder)),
+        "event": json.loads(json.dumps(event, cls=HAJSONEncoder)),
+    }
+    assert result == json.dumps(
+        data, cls=HAJSONEncoder, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+@pytest.mark.parametrize("native", [True, False])
+def test_json_bytes_unserializable(native):
+    """Test both encoders raise on unserializable data."""
+    with patch.object(
+        json_encoder, "orjson", json_encoder.orjson if native else None
+    ), pytest.raises(TypeError):
+        json_bytes({"bad": object()})
+
+
+@pytest.mark.parametrize("native", [True, False])
+def test_json_bytes_non_finite_floats(native):
+    """Test both encoders serialize non finite floats as null."""
+    state = core.State("test.test", "hello", {"nan": float("nan")})
+    data = {"inf": float("inf"), "list": [float("-inf"), 1.5], "state": state}
+
+    with patch.object(json_encoder, "orjson", json_encoder.orjson if native else None):
+        result = json.loads(json_bytes(data))
+
+    assert result["inf"] is None
+    assert result["list"] == [None, 1.5]
+    assert result["state"]["attributes"] == {"nan": None}
+
+
+def test_json_bytes_circular_reference():
+    """Test the standard library encoder still raises on circular references."""
+    data = {"value": float("nan")}
+    data["self"] = data
+
+    with patch.object(json_encoder, "orjson", None), pytest.raises(ValueError):
+        json_bytes(data)